@@ -2,7 +2,11 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from app.api.v1.api import api_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import get_settings
+from app.core.idempotency import IdempotencyMiddleware
+from app.core.lifecycle import InFlightMiddleware, lifespan
+from app.core.middleware import ReadYourWritesMiddleware
 
 settings = get_settings()
 
@@ -12,6 +16,7 @@ app = FastAPI(
     version="0.1.0",
     docs_url=f"{settings.API_V1_STR}/docs",
     redoc_url=f"{settings.API_V1_STR}/redoc",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -21,6 +26,10 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(IdempotencyMiddleware)
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(InFlightMiddleware)
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 app.mount("/static", StaticFiles(directory="static"), name="static")
\ No newline at end of file
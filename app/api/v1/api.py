@@ -4,10 +4,16 @@ from app.api.v1.endpoints import users
 from app.api.v1.endpoints import events
 from app.api.v1.endpoints import session
 from app.api.v1.endpoints import registrations
+from app.api.v1.endpoints import health
+from app.api.v1.endpoints import history
+from app.api.v1.endpoints import batch
 
 api_router = APIRouter()
 
 api_router.include_router(users.router, tags=["users"])
 api_router.include_router(events.router, tags=["events"])
 api_router.include_router(session.router, tags=["sessions"])
-api_router.include_router(registrations.router, tags=["registrations"])
\ No newline at end of file
+api_router.include_router(registrations.router, tags=["registrations"])
+api_router.include_router(history.router, tags=["history"])
+api_router.include_router(batch.router, tags=["batch"])
+api_router.include_router(health.router, tags=["health"])
\ No newline at end of file
@@ -0,0 +1,29 @@
+from typing import Annotated, List
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from app.core.batch import run_batch
+from app.core.dependencies import get_current_user
+from app.schemas.batch import BatchRequest, BatchResponseItem
+from app.schemas.user import UserResponse
+
+router = APIRouter()
+
+@router.post("/batch", response_model=List[BatchResponseItem], summary="Ejecutar varias peticiones GET en una sola llamada")
+async def execute_batch(
+    request: Request,
+    batch: BatchRequest,
+    current_user: Annotated[UserResponse, Depends(get_current_user)]
+):
+    """
+    Ejecuta un lote de peticiones GET de la API y devuelve el estado y el cuerpo de cada una,
+    en el mismo orden. El usuario se autentica una sola vez para todo el lote y las peticiones
+    se ejecutan de forma concurrente; un error en una no afecta a las demás.
+    """
+    try:
+        return await run_batch(request.app.router, request.scope, current_user, batch.requests)
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
@@ -1,28 +1,50 @@
+import asyncio
+from datetime import date
 from typing import Annotated, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query, File, UploadFile, Form
+from fastapi import APIRouter, Depends, HTTPException, status, Query, File, UploadFile, Form, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlmodel import Session
 
-from app.database.connection import get_db_session
+from app.core.config import get_settings
+from app.database.connection import get_db_session, get_read_db_session
 from app.core.dependencies import get_current_user
+from app.core.broadcast import CLOSED, broadcaster
+from app.core.middleware import wrote_recently
+from app.core.single_flight import single_flight
 from app.repositories.event_repository import EventRepository
+from app.repositories.registration import RegistrationRepository
 from app.use_cases.event.create_event import CreateEventUseCase
-from app.use_cases.event.get_event import GetEventUseCase
+from app.use_cases.event.get_event import TRENDING_SIZE, GetEventUseCase
 from app.use_cases.event.update_event import UpdateEventUseCase
 from app.use_cases.event.delete_event import DeleteEventUseCase
-from app.schemas.event import EventCreate, EventUpdate, EventResponse
+from app.use_cases.event.import_events import ImportEventsUseCase, detect_import_format
+from app.use_cases.event.availability import GetEventAvailabilityUseCase, availability_channel
+from app.schemas.fieldsets import parse_fields
+from app.schemas.event import EventCalendarDay, EventChangesResponse, EventCreate, EventImportReport, EventUpdate, EventResponse, OrganizerDashboard, TrendingEvent
 from app.schemas.user import UserResponse
 
 
 router = APIRouter()
+settings = get_settings()
+
+# Comentario SSE periódico para que proxies y clientes no cierren la conexión inactiva
+STREAM_KEEPALIVE_SECONDS = 15
 
 def get_event_repository(session: Annotated[Session, Depends(get_db_session)]) -> EventRepository:
     return EventRepository(session)
 
+def get_event_read_repository(session: Annotated[Session, Depends(get_read_db_session)]) -> EventRepository:
+    return EventRepository(session)
+
 def get_create_event_use_case(event_repo: Annotated[EventRepository, Depends(get_event_repository)]) -> CreateEventUseCase:
     return CreateEventUseCase(event_repo)
 
-def get_get_event_use_case(event_repo: Annotated[EventRepository, Depends(get_event_repository)]) -> GetEventUseCase:
-    return GetEventUseCase(event_repo)
+def get_get_event_use_case(
+    event_repo: Annotated[EventRepository, Depends(get_event_read_repository)],
+    primary_event_repo: Annotated[EventRepository, Depends(get_event_repository)]
+) -> GetEventUseCase:
+    return GetEventUseCase(event_repo, primary_event_repo)
 
 def get_update_event_use_case(event_repo: Annotated[EventRepository, Depends(get_event_repository)]) -> UpdateEventUseCase:
     return UpdateEventUseCase(event_repo)
@@ -30,6 +52,21 @@ def get_update_event_use_case(event_repo: Annotated[EventRepository, Depends(get
 def get_delete_event_use_case(event_repo: Annotated[EventRepository, Depends(get_event_repository)]) -> DeleteEventUseCase:
     return DeleteEventUseCase(event_repo)
 
+def get_event_availability_use_case(
+    event_repo: Annotated[EventRepository, Depends(get_event_read_repository)],
+    session: Annotated[Session, Depends(get_read_db_session)]
+) -> GetEventAvailabilityUseCase:
+    return GetEventAvailabilityUseCase(event_repo, RegistrationRepository(session))
+
+def get_import_events_use_case(event_repo: Annotated[EventRepository, Depends(get_event_repository)]) -> ImportEventsUseCase:
+    return ImportEventsUseCase(event_repo)
+
+def _resolve_date_from(date_from: Optional[date], upcoming: bool) -> Optional[date]:
+    if not upcoming:
+        return date_from
+    today = date.today()
+    return max(date_from, today) if date_from else today
+
 
 @router.post("/event", response_model=EventResponse, status_code=status.HTTP_201_CREATED, summary="Crear un nuevo evento")
 async def create_event(
@@ -66,21 +103,58 @@ async def create_event(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
 
+@router.post("/events/import", response_model=EventImportReport, summary="Importar eventos en lote desde CSV o NDJSON")
+async def import_events(
+    current_user: Annotated[UserResponse, Depends(get_current_user)],
+    import_events_uc: Annotated[ImportEventsUseCase, Depends(get_import_events_use_case)],
+    file: UploadFile = File(..., description="CSV con cabecera o NDJSON con un evento por línea"),
+    images: Optional[List[UploadFile]] = File(None, description="Imágenes referenciadas por nombre en la columna image"),
+):
+    """
+    Importa eventos en lote. El usuario autenticado será el organizador de todos ellos.
+    Devuelve los ids creados y los errores de validación de cada fila rechazada.
+    """
+    try:
+        file_format = detect_import_format(file.filename, file.content_type)
+        image_paths = {}
+        for image in images or []:
+            image_path = f"static/events/event_{current_user.id}_{image.filename}"
+            with open(image_path, "wb") as buffer:
+                buffer.write(await image.read())
+            image_paths[image.filename] = image_path
+        return import_events_uc.execute(file.file, file_format, current_user.id, image_paths)
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
+
 @router.get("/events", response_model=List[EventResponse], summary="Obtener todos los eventos o buscar por nombre")
 async def get_events(
     get_event_uc: Annotated[GetEventUseCase, Depends(get_get_event_use_case)],
     current_user: Annotated[UserResponse, Depends(get_current_user)],
     name_query: Optional[str] = Query(None, description="Buscar eventos por nombre o parte del nombre"),
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=0, le=100)
+    limit: int = Query(100, ge=0, le=100),
+    date_from: Optional[date] = Query(None, description="Solo eventos en o después de esta fecha"),
+    date_to: Optional[date] = Query(None, description="Solo eventos en o antes de esta fecha"),
+    upcoming: bool = Query(False, description="Solo eventos desde hoy en adelante"),
+    fields: Optional[str] = Query(None, description="Campos a devolver separados por comas, p. ej. id,name,event_date,image_url")
 ):
     """
-    Obtiene una lista de eventos. Permite búsqueda por nombre y paginación.
+    Obtiene una lista de eventos. Permite búsqueda por nombre, filtro por fechas y paginación.
+    Con `fields` solo se leen y devuelven esos campos.
     """
     try:
+        date_from = _resolve_date_from(date_from, upcoming)
+        selected = parse_fields(fields, EventResponse)
         if name_query:
-            return get_event_uc.execute_search_by_name_by_user(name_query=name_query, current_user_id=current_user.id, skip=skip, limit=limit)
-        return get_event_uc.execute_all_by_user(current_user_id=current_user.id, skip=skip, limit=limit)
+            events = get_event_uc.execute_search_by_name_by_user(name_query=name_query, current_user_id=current_user.id, skip=skip, limit=limit, date_from=date_from, date_to=date_to, fields=selected)
+        else:
+            events = get_event_uc.execute_all_by_user(current_user_id=current_user.id, skip=skip, limit=limit, date_from=date_from, date_to=date_to, fields=selected)
+        # Las filas parciales no cumplen EventResponse, se devuelven sin pasar por response_model
+        return JSONResponse(jsonable_encoder(events)) if selected else events
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -88,18 +162,107 @@ async def get_events(
 
 @router.get("/events/all", response_model=List[EventResponse], summary="Obtener todos los eventos o buscar por nombre")
 async def get_events(
+    request: Request,
     get_event_uc: Annotated[GetEventUseCase, Depends(get_get_event_use_case)],
     name_query: Optional[str] = Query(None, description="Buscar eventos por nombre o parte del nombre"),
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=0, le=100)
+    limit: int = Query(100, ge=0, le=100),
+    date_from: Optional[date] = Query(None, description="Solo eventos en o después de esta fecha"),
+    date_to: Optional[date] = Query(None, description="Solo eventos en o antes de esta fecha"),
+    upcoming: bool = Query(False, description="Solo eventos desde hoy en adelante"),
+    fields: Optional[str] = Query(None, description="Campos a devolver separados por comas, p. ej. id,name,event_date,image_url")
 ):
     """
-    Obtiene una lista de eventos. Permite búsqueda por nombre y paginación.
+    Obtiene una lista de eventos. Permite búsqueda por nombre, filtro por fechas y paginación.
+    Las peticiones idénticas simultáneas comparten una sola consulta. Con `fields` solo se leen
+    y devuelven esos campos.
     """
     try:
+        date_from = _resolve_date_from(date_from, upcoming)
+        selected = parse_fields(fields, EventResponse)
         if name_query:
-            return get_event_uc.execute_search_by_name(name_query=name_query, skip=skip, limit=limit)
-        return get_event_uc.execute_all(skip=skip, limit=limit)
+            def load():
+                return get_event_uc.execute_search_by_name(name_query=name_query, skip=skip, limit=limit, date_from=date_from, date_to=date_to, fields=selected)
+        else:
+            def load():
+                return get_event_uc.execute_all(skip=skip, limit=limit, date_from=date_from, date_to=date_to, fields=selected)
+        key = ("catalog", name_query, skip, limit, date_from, date_to, tuple(selected or ()))
+        events = await single_flight.do(key, load, shared=not wrote_recently(request))
+        return JSONResponse(jsonable_encoder(events)) if selected else events
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
+
+@router.get("/events/dashboard", response_model=OrganizerDashboard, summary="Panel del organizador con las métricas de sus eventos")
+async def get_organizer_dashboard(
+    get_event_uc: Annotated[GetEventUseCase, Depends(get_get_event_use_case)],
+    current_user: Annotated[UserResponse, Depends(get_current_user)]
+):
+    """
+    Para cada evento del usuario autenticado: inscripciones, ocupación, sesiones y última inscripción.
+    """
+    try:
+        return get_event_uc.execute_dashboard(current_user.id)
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
+
+@router.get("/events/changes", response_model=EventChangesResponse, summary="Cambios del catálogo desde un cursor")
+async def get_event_changes(
+    get_event_uc: Annotated[GetEventUseCase, Depends(get_get_event_use_case)],
+    since: int = Query(0, ge=0, description="Cursor devuelto en next_cursor por la sincronización anterior; 0 para la primera"),
+    limit: int = Query(500, ge=1, le=1000)
+):
+    """
+    Sincronización incremental del catálogo publicado: eventos creados o modificados y marcas de borrado
+    posteriores al cursor. Si has_more es true, hay que volver a llamar con next_cursor.
+    """
+    try:
+        return get_event_uc.execute_changes(since=since, limit=limit)
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
+
+@router.get("/events/calendar", response_model=List[EventCalendarDay], summary="Número de eventos publicados por día de un mes")
+async def get_events_calendar(
+    get_event_uc: Annotated[GetEventUseCase, Depends(get_get_event_use_case)],
+    year: int = Query(..., ge=1, le=9999),
+    month: int = Query(..., ge=1, le=12)
+):
+    """
+    Devuelve, para cada día del mes con eventos publicados, cuántos hay. Solo incluye los días con eventos.
+    """
+    try:
+        return get_event_uc.execute_calendar(year, month)
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
+
+@router.get("/events/trending", response_model=List[TrendingEvent], summary="Eventos publicados más populares")
+async def get_trending_events(
+    get_event_uc: Annotated[GetEventUseCase, Depends(get_get_event_use_case)],
+    limit: int = Query(10, ge=1, le=TRENDING_SIZE)
+):
+    """
+    Devuelve los eventos publicados con más inscripciones recientes, ordenados por su puntuación
+    de popularidad. El ranking puede tener hasta un minuto de retraso.
+    """
+    try:
+        return get_event_uc.execute_trending(limit)
+    except HTTPException as e:
+        raise e
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -108,18 +271,65 @@ async def get_events(
 @router.get("/event/{event_id}", response_model=EventResponse, summary="Obtener un evento por ID")
 async def get_event_by_id(
     event_id: int,
+    request: Request,
     get_event_uc: Annotated[GetEventUseCase, Depends(get_get_event_use_case)]
 ):
     """
     Obtiene los detalles de un evento específico por su ID.
+    Las peticiones simultáneas del mismo evento comparten una sola consulta.
     """
     try:
-        return get_event_uc.execute_by_id(event_id)
+        return await single_flight.do(
+            ("event_detail", event_id), lambda: get_event_uc.execute_by_id(event_id), shared=not wrote_recently(request)
+        )
+    except HTTPException as e:
+        raise e
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
 
+@router.get("/event/{event_id}/availability/stream", summary="Seguir en vivo las plazas disponibles de un evento")
+async def stream_event_availability(
+    event_id: int,
+    request: Request,
+    availability_uc: Annotated[GetEventAvailabilityUseCase, Depends(get_event_availability_use_case)]
+):
+    """
+    Server-Sent Events con las plazas disponibles y el estado del evento. Envía el estado actual
+    al conectar y después cada cambio. Todos los observadores de un evento comparten el mismo mensaje,
+    así que solo se consulta la base de datos al conectar el primero.
+    """
+    channel = availability_channel(event_id)
+    initial = broadcaster.latest(channel)
+    if initial is None:
+        try:
+            initial = availability_uc.execute(event_id)
+        except HTTPException as e:
+            raise e
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
+
+    async def events():
+        # Duración máxima de la conexión: el cliente (EventSource) se reconecta solo y recibe el estado actual
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.STREAM_MAX_SECONDS
+        async with broadcaster.subscribe(channel, initial=initial) as queue:
+            while not await request.is_disconnected():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=min(STREAM_KEEPALIVE_SECONDS, remaining))
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if message is CLOSED:
+                    break
+                yield f"event: availability\ndata: {message.model_dump_json()}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
 @router.patch("/event/{event_id}", response_model=EventResponse, summary="Actualizar un evento")
 async def update_event(
     event_id: int,
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+
+from app.core.lifecycle import lifecycle
+from app.core.single_flight import single_flight
+
+router = APIRouter()
+
+
+@router.get("/health/live", summary="El proceso está vivo")
+async def live():
+    return {"status": "alive"}
+
+
+@router.get("/health/ready", summary="El proceso está listo para recibir tráfico")
+async def ready():
+    """
+    Devuelve 503 hasta terminar el calentamiento y de nuevo durante el apagado,
+    para que el balanceador solo envíe tráfico a instancias calientes.
+    """
+    if not lifecycle.ready:
+        state = "draining" if lifecycle.draining else "starting"
+        return JSONResponse({"status": state}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    return {"status": "ready", "in_flight": lifecycle.in_flight}
+
+
+@router.get("/health/metrics", summary="Métricas internas del proceso")
+async def metrics():
+    """
+    Por consulta deduplicada: ejecuciones reales y peticiones que se unieron a una en curso.
+    """
+    return {"single_flight": single_flight.stats()}
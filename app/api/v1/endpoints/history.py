@@ -0,0 +1,59 @@
+from typing import Annotated, List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
+
+from app.core.dependencies import get_current_user
+from app.database.connection import get_read_db_session
+from app.repositories.archive_repository import ArchiveRepository
+from app.schemas.archive import EventArchiveResponse, RegistrationHistoryResponse
+from app.schemas.user import UserResponse
+from app.use_cases.archive.get_history import GetHistoryUseCase
+
+router = APIRouter()
+
+def get_archive_read_repository(session: Annotated[Session, Depends(get_read_db_session)]) -> ArchiveRepository:
+    return ArchiveRepository(session)
+
+def get_get_history_use_case(archive_repo: Annotated[ArchiveRepository, Depends(get_archive_read_repository)]) -> GetHistoryUseCase:
+    return GetHistoryUseCase(archive_repo)
+
+
+@router.get("/events/history", response_model=List[EventArchiveResponse], summary="Eventos archivados del organizador")
+async def get_archived_events(
+    get_history_uc: Annotated[GetHistoryUseCase, Depends(get_get_history_use_case)],
+    current_user: Annotated[UserResponse, Depends(get_current_user)],
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=0, le=100)
+):
+    """
+    Obtiene los eventos completados o cancelados del usuario autenticado que ya se archivaron,
+    del más reciente al más antiguo.
+    """
+    try:
+        return get_history_uc.execute_events_by_organizer(current_user.id, skip=skip, limit=limit)
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
+
+
+@router.get("/user/registrations/history", response_model=List[RegistrationHistoryResponse], summary="Inscripciones archivadas del usuario")
+async def get_archived_registrations(
+    get_history_uc: Annotated[GetHistoryUseCase, Depends(get_get_history_use_case)],
+    current_user: Annotated[UserResponse, Depends(get_current_user)],
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=0, le=100)
+):
+    """
+    Obtiene las inscripciones del usuario autenticado en eventos ya archivados.
+    """
+    try:
+        return get_history_uc.execute_registrations_by_user(current_user.id, skip=skip, limit=limit)
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
@@ -2,13 +2,19 @@ from typing import Annotated, List
 from fastapi import APIRouter, Depends, status, HTTPException
 from app.repositories.registration import RegistrationRepository
 from app.repositories.event_repository import EventRepository
+from app.repositories.session_registration_repository import SessionRegistrationRepository
+from app.repositories.session_repository import SessionRepository
 from app.use_cases.registrations.register_for_events import RegisterForEvent
+from app.use_cases.registrations.cancel_registration import CancelRegistration
 from app.use_cases.registrations.get_user_registrations import GetUserRegistrations
 from app.use_cases.registrations.get_user_event_registrations import GetUserEventRegistrations
-from app.schemas.registration import RegistrationResponse
+from app.use_cases.registrations.register_for_session import RegisterForSession
+from app.use_cases.registrations.cancel_session_registration import CancelSessionRegistration
+from app.use_cases.registrations.get_user_session_registrations import GetUserSessionRegistrations
+from app.schemas.registration import RegistrationResponse, SessionRegistrationResponse
 from app.core.dependencies import get_current_user
 from app.schemas.user import UserResponse
-from app.database.connection import get_db_session
+from app.database.connection import get_db_session, get_read_db_session
 from sqlmodel import Session
 
 router = APIRouter()
@@ -16,22 +22,58 @@ router = APIRouter()
 def get_registration_repository(session: Annotated[Session, Depends(get_db_session)]) -> RegistrationRepository:
     return RegistrationRepository(session)
 
+def get_registration_read_repository(session: Annotated[Session, Depends(get_read_db_session)]) -> RegistrationRepository:
+    return RegistrationRepository(session)
+
 def get_event_repository(session: Annotated[Session, Depends(get_db_session)]) -> EventRepository:
     return EventRepository(session)
 
+def get_session_registration_repository(session: Annotated[Session, Depends(get_db_session)]) -> SessionRegistrationRepository:
+    return SessionRegistrationRepository(session)
+
+def get_session_registration_read_repository(session: Annotated[Session, Depends(get_read_db_session)]) -> SessionRegistrationRepository:
+    return SessionRegistrationRepository(session)
+
+def get_session_repository(session: Annotated[Session, Depends(get_db_session)]) -> SessionRepository:
+    return SessionRepository(session)
+
 def get_register_for_event_use_case(
     registration_repo: Annotated[RegistrationRepository, Depends(get_registration_repository)],
     event_repo: Annotated[EventRepository, Depends(get_event_repository)]
 ) -> RegisterForEvent:
     return RegisterForEvent(registration_repo, event_repo)
 
+def get_cancel_registration_use_case(
+    registration_repo: Annotated[RegistrationRepository, Depends(get_registration_repository)],
+    event_repo: Annotated[EventRepository, Depends(get_event_repository)],
+    session_registration_repo: Annotated[SessionRegistrationRepository, Depends(get_session_registration_repository)]
+) -> CancelRegistration:
+    return CancelRegistration(registration_repo, event_repo, session_registration_repo)
+
+def get_register_for_session_use_case(
+    session_registration_repo: Annotated[SessionRegistrationRepository, Depends(get_session_registration_repository)],
+    registration_repo: Annotated[RegistrationRepository, Depends(get_registration_repository)],
+    session_repo: Annotated[SessionRepository, Depends(get_session_repository)]
+) -> RegisterForSession:
+    return RegisterForSession(session_registration_repo, registration_repo, session_repo)
+
+def get_cancel_session_registration_use_case(
+    session_registration_repo: Annotated[SessionRegistrationRepository, Depends(get_session_registration_repository)]
+) -> CancelSessionRegistration:
+    return CancelSessionRegistration(session_registration_repo)
+
+def get_get_user_session_registrations_use_case(
+    session_registration_repo: Annotated[SessionRegistrationRepository, Depends(get_session_registration_read_repository)]
+) -> GetUserSessionRegistrations:
+    return GetUserSessionRegistrations(session_registration_repo)
+
 def get_get_user_registrations_use_case(
-    registration_repo: Annotated[RegistrationRepository, Depends(get_registration_repository)]
+    registration_repo: Annotated[RegistrationRepository, Depends(get_registration_read_repository)]
 ) -> GetUserRegistrations:
     return GetUserRegistrations(registration_repo)
 
 def get_get_user_event_registrations_use_case(
-    registration_repo: Annotated[RegistrationRepository, Depends(get_registration_repository)]
+    registration_repo: Annotated[RegistrationRepository, Depends(get_registration_read_repository)]
 ) -> GetUserEventRegistrations:
     return GetUserEventRegistrations(registration_repo)
 
@@ -52,6 +94,23 @@ async def register_for_event(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
 
+@router.delete("/event/{event_id}/register", status_code=status.HTTP_204_NO_CONTENT, summary="Cancelar el registro en un evento")
+async def cancel_registration(
+    event_id: int,
+    current_user: Annotated[UserResponse, Depends(get_current_user)],
+    cancel_registration_uc: Annotated[CancelRegistration, Depends(get_cancel_registration_use_case)]
+):
+    """
+    Cancela el registro del usuario autenticado en el evento especificado.
+    """
+    try:
+        cancel_registration_uc.execute(current_user.id, event_id)
+        return
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
+
 @router.get("/event/{event_id}/registrations", response_model=List[RegistrationResponse], summary="Obtener usuarios registrados en un evento")
 async def get_event_registrations(
     event_id: int,
@@ -81,4 +140,56 @@ async def get_user_event_registrations(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
+
+@router.post("/session/{session_id}/register", response_model=SessionRegistrationResponse, status_code=status.HTTP_201_CREATED, summary="Reservar plaza en una sesión")
+async def register_for_session(
+    session_id: int,
+    current_user: Annotated[UserResponse, Depends(get_current_user)],
+    register_for_session_uc: Annotated[RegisterForSession, Depends(get_register_for_session_use_case)]
+):
+    """
+    Reserva una plaza en la sesión para el usuario autenticado. Requiere estar inscrito en el
+    evento y no tener reservada otra sesión a la misma hora.
+    """
+    try:
+        registration = register_for_session_uc.execute(current_user.id, session_id)
+        return SessionRegistrationResponse.model_validate(registration)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
+
+@router.delete("/session/{session_id}/register", status_code=status.HTTP_204_NO_CONTENT, summary="Cancelar la reserva en una sesión")
+async def cancel_session_registration(
+    session_id: int,
+    current_user: Annotated[UserResponse, Depends(get_current_user)],
+    cancel_session_registration_uc: Annotated[CancelSessionRegistration, Depends(get_cancel_session_registration_use_case)]
+):
+    """
+    Cancela la reserva del usuario autenticado en la sesión y libera su plaza.
+    """
+    try:
+        cancel_session_registration_uc.execute(current_user.id, session_id)
+        return
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
+
+@router.get("/user/session-registrations", response_model=List[SessionRegistrationResponse], summary="Obtener las sesiones reservadas por el usuario")
+async def get_user_session_registrations(
+    current_user: Annotated[UserResponse, Depends(get_current_user)],
+    get_user_session_registrations_uc: Annotated[GetUserSessionRegistrations, Depends(get_get_user_session_registrations_use_case)]
+):
+    """
+    Obtiene todas las sesiones en las que el usuario autenticado tiene plaza reservada.
+    """
+    try:
+        return get_user_session_registrations_uc.execute(current_user.id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
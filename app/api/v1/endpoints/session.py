@@ -1,14 +1,20 @@
 from typing import Annotated, List, Optional
-from fastapi import APIRouter, Depends, status, Query, HTTPException
+from fastapi import APIRouter, Depends, status, Query, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlmodel import Session
 
-from app.database.connection import get_db_session
+from app.database.connection import get_db_session, get_read_db_session
 from app.core.dependencies import get_current_user
+from app.core.middleware import wrote_recently
+from app.core.single_flight import single_flight
 from app.repositories.session_repository import SessionRepository
 from app.use_cases.session.create_session import CreateSessionUseCase
 from app.use_cases.session.get_session import GetSessionUseCase
 from app.use_cases.session.delete_session import DeleteSessionUseCase
-from app.schemas.session import SessionCreate, SessionUpdate, SessionResponse
+from app.use_cases.session.update_session import UpdateSessionUseCase
+from app.schemas.fieldsets import parse_fields
+from app.schemas.session import SessionCreate, SessionUpdate, SessionResponse, SessionConflictResponse
 from app.schemas.user import UserResponse
 
 router = APIRouter()
@@ -16,12 +22,18 @@ router = APIRouter()
 def get_session_repository(session: Annotated[Session, Depends(get_db_session)]) -> SessionRepository:
     return SessionRepository(session)
 
+def get_session_read_repository(session: Annotated[Session, Depends(get_read_db_session)]) -> SessionRepository:
+    return SessionRepository(session)
+
 def get_create_session_use_case(session_repo: Annotated[SessionRepository, Depends(get_session_repository)]) -> CreateSessionUseCase:
     return CreateSessionUseCase(session_repo)
 
-def get_get_session_use_case(session_repo: Annotated[SessionRepository, Depends(get_session_repository)]) -> GetSessionUseCase:
+def get_get_session_use_case(session_repo: Annotated[SessionRepository, Depends(get_session_read_repository)]) -> GetSessionUseCase:
     return GetSessionUseCase(session_repo)
 
+def get_update_session_use_case(session_repo: Annotated[SessionRepository, Depends(get_session_repository)]) -> UpdateSessionUseCase:
+    return UpdateSessionUseCase(session_repo)
+
 def get_delete_session_use_case(session_repo: Annotated[SessionRepository, Depends(get_session_repository)]) -> DeleteSessionUseCase:
     return DeleteSessionUseCase(session_repo)
 
@@ -38,21 +50,36 @@ async def create_session(
         return create_session_uc.execute(session_in)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException as e:
+        raise e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
 
 @router.get("/sessions/{event_id}", response_model=List[SessionResponse], summary="Obtener todas las sesiones o buscar por nombre")
 async def get_sessions(
     event_id: int,
+    request: Request,
     get_session_uc: Annotated[GetSessionUseCase, Depends(get_get_session_use_case)],
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=0, le=100)
+    limit: int = Query(100, ge=0, le=100),
+    fields: Optional[str] = Query(None, description="Campos a devolver separados por comas, p. ej. id,name,start_time")
 ):
     """
     Obtiene una lista de sesiones. Permite búsqueda por nombre y paginación.
+    Las peticiones idénticas simultáneas comparten una sola consulta. Con `fields` solo se leen
+    y devuelven esos campos.
     """
     try:
-        return get_session_uc.execute_all(event_id=event_id, skip=skip, limit=limit)
+        selected = parse_fields(fields, SessionResponse)
+        sessions = await single_flight.do(
+            ("sessions_by_event", event_id, skip, limit, tuple(selected or ())),
+            lambda: get_session_uc.execute_all(event_id=event_id, skip=skip, limit=limit, fields=selected),
+            shared=not wrote_recently(request),
+        )
+        # Las filas parciales no cumplen SessionResponse, se devuelven sin pasar por response_model
+        return JSONResponse(jsonable_encoder(sessions)) if selected else sessions
+    except HTTPException as e:
+        raise e
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -73,6 +100,41 @@ async def get_session_by_id(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
 
+@router.patch("/session/{session_id}", response_model=SessionResponse, summary="Actualizar una sesión")
+async def update_session(
+    session_id: int,
+    session_update: SessionUpdate,
+    update_session_uc: Annotated[UpdateSessionUseCase, Depends(get_update_session_use_case)],
+    current_user: Annotated[UserResponse, Depends(get_current_user)]
+):
+    """
+    Actualiza una sesión. Solo el speaker puede hacerlo. Rechaza horarios que se solapen
+    con otra sesión del mismo speaker o del mismo evento.
+    """
+    try:
+        return update_session_uc.execute(session_id, session_update, current_user.id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
+
+@router.get("/speakers/{speaker_id}/conflicts", response_model=List[SessionConflictResponse], summary="Obtener los conflictos de horario de un speaker")
+async def get_speaker_conflicts(
+    speaker_id: int,
+    get_session_uc: Annotated[GetSessionUseCase, Depends(get_get_session_use_case)]
+):
+    """
+    Obtiene los pares de sesiones solapadas de un speaker en todos sus eventos.
+    """
+    try:
+        return get_session_uc.execute_speaker_conflicts(speaker_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
+
 @router.delete("/session/{session_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Eliminar una sesión")
 async def delete_session(
     session_id: int,
@@ -1,13 +1,14 @@
 from typing import Annotated
 
-from app.core.config import Settings
+from app.core.config import Settings, get_settings
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
 from sqlmodel import Session
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.responses import JSONResponse
 
-from app.database.connection import get_db_session
+from app.database.connection import get_db_session, get_read_db_session
 from app.core.dependencies import get_current_user, get_current_active_superuser
+from app.repositories.revoked_token_repository import RevokedTokenRepository
 from app.repositories.user_repository import UserRepository
 from app.use_cases.user.create_user import CreateUserUseCase
 from app.use_cases.user.get_user import GetUserUseCase
@@ -15,11 +16,18 @@ from app.use_cases.user.login_user import LoginUserUseCase
 from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
 
 router = APIRouter()
+settings = get_settings()
+
+REFRESH_TOKEN_MAX_AGE = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
 
 def get_user_repository(session: Annotated[Session, Depends(get_db_session)]) -> UserRepository:
     """Provee una instancia de UserRepository."""
     return UserRepository(session)
 
+def get_user_read_repository(session: Annotated[Session, Depends(get_read_db_session)]) -> UserRepository:
+    """Provee una instancia de UserRepository para lecturas (réplica si está configurada)."""
+    return UserRepository(session)
+
 def get_create_user_use_case(
     user_repo: Annotated[UserRepository, Depends(get_user_repository)]
 ) -> CreateUserUseCase:
@@ -27,16 +35,21 @@ def get_create_user_use_case(
     return CreateUserUseCase(user_repo)
 
 def get_get_user_use_case(
-    user_repo: Annotated[UserRepository, Depends(get_user_repository)]
+    user_repo: Annotated[UserRepository, Depends(get_user_read_repository)]
 ) -> GetUserUseCase:
     """Provee una instancia de GetUserUseCase."""
     return GetUserUseCase(user_repo)
 
+def get_revoked_token_repository(session: Annotated[Session, Depends(get_db_session)]) -> RevokedTokenRepository:
+    """Provee una instancia de RevokedTokenRepository."""
+    return RevokedTokenRepository(session)
+
 def get_login_user_use_case(
-    user_repo: Annotated[UserRepository, Depends(get_user_repository)]
+    user_repo: Annotated[UserRepository, Depends(get_user_repository)],
+    revoked_token_repo: Annotated[RevokedTokenRepository, Depends(get_revoked_token_repository)]
 ) -> LoginUserUseCase:
     """Provee una instancia de LoginUserUseCase."""
-    return LoginUserUseCase(user_repo)
+    return LoginUserUseCase(user_repo, revoked_token_repo)
 
 
 @router.post("/users/", response_model=UserResponse, status_code=status.HTTP_201_CREATED, summary="Crear un nuevo usuario")
@@ -94,7 +107,7 @@ async def login_access_token(
             httponly=True,
             secure=True,
             samesite="Lax",
-            max_age=7*24*60*60
+            max_age=REFRESH_TOKEN_MAX_AGE
         )
         return response
     except ValueError as e:
@@ -114,13 +127,15 @@ async def refresh_access_token(
     login_user_uc: Annotated[LoginUserUseCase, Depends(get_login_user_use_case)]
 ):
     """
-    Recibe un refresh token válido y devuelve un nuevo access token JWT.
+    Recibe un refresh token válido y devuelve un nuevo access token JWT y un nuevo refresh token.
+    El refresh token usado queda revocado: cada refresh token sirve una sola vez.
     """
     try:
         token = login_user_uc.refresh_access_token(request.cookies.get("refresh_token"))
         response = JSONResponse(
             content={
                 "access_token": token.access_token,
+                "refresh_token": token.refresh_token,
                 "token_type": "bearer"
             },
             status_code=status.HTTP_200_OK
@@ -133,6 +148,14 @@ async def refresh_access_token(
             samesite="Lax",
             max_age=15 * 60
         )
+        response.set_cookie(
+            key="refresh_token",
+            value=token.refresh_token,
+            httponly=True,
+            secure=True,
+            samesite="Lax",
+            max_age=REFRESH_TOKEN_MAX_AGE
+        )
         return response
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -145,7 +168,14 @@ async def refresh_access_token(
         )
 
 @router.post("/logout")
-def logout(response: Response):
+def logout(
+    request: Request,
+    login_user_uc: Annotated[LoginUserUseCase, Depends(get_login_user_use_case)]
+):
+    """
+    Revoca el refresh token de la sesión y elimina las cookies.
+    """
+    login_user_uc.logout(request.cookies.get("refresh_token"))
     response = JSONResponse(content={"message": "Cierre de sesión exitoso"})
     response.delete_cookie("access_token")
     response.delete_cookie("refresh_token")
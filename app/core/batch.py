@@ -0,0 +1,107 @@
+import asyncio
+import json
+import logging
+from typing import Any, List
+from urllib.parse import unquote
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Scope
+
+from app.core.config import get_settings
+from app.schemas.batch import BatchRequestItem, BatchResponseItem
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+BATCH_PATH = f"{settings.API_V1_STR}/batch"
+# Clave del scope con el usuario ya autenticado por /batch; get_current_user lo reutiliza
+BATCH_USER_SCOPE_KEY = "batch.user"
+
+# Claves del scope que fija el enrutado de /batch y que cada subpetición resuelve de nuevo
+_ROUTE_SCOPE_KEYS = {"route", "endpoint", "path_params", "router"}
+# Cabeceras del lote que no aplican a las subpeticiones (cuerpo, compresión, idempotencia)
+_DROPPED_HEADERS = {b"content-length", b"content-type", b"transfer-encoding", b"accept-encoding", b"idempotency-key"}
+
+
+class _StreamingNotSupported(Exception):
+    pass
+
+
+def validate_batch(items: List[BatchRequestItem]) -> None:
+    """
+    Comprueba el tamaño del lote y que todas las rutas son de la API (y no el propio /batch).
+    """
+    if not items:
+        raise ValueError("The batch must contain at least one request")
+    if len(items) > settings.BATCH_MAX_REQUESTS:
+        raise ValueError(f"A batch can contain at most {settings.BATCH_MAX_REQUESTS} requests")
+    for item in items:
+        path = unquote(item.path.partition("?")[0])
+        if not path.startswith(f"{settings.API_V1_STR}/") or path == BATCH_PATH:
+            raise ValueError(f"Invalid batch path: {item.path}")
+
+
+async def run_batch(app: ASGIApp, scope: Scope, user: Any, items: List[BatchRequestItem]) -> List[BatchResponseItem]:
+    """
+    Ejecuta las subpeticiones contra el enrutador de la aplicación, sin volver a pasar por los
+    middlewares, con un máximo de BATCH_MAX_CONCURRENCY a la vez. Las respuestas se devuelven
+    en el orden de las peticiones.
+    """
+    validate_batch(items)
+    semaphore = asyncio.Semaphore(settings.BATCH_MAX_CONCURRENCY)
+
+    async def run(item: BatchRequestItem) -> BatchResponseItem:
+        async with semaphore:
+            return await _dispatch(app, scope, user, item)
+
+    return list(await asyncio.gather(*(run(item) for item in items)))
+
+
+async def _dispatch(app: ASGIApp, scope: Scope, user: Any, item: BatchRequestItem) -> BatchResponseItem:
+    path, _, query = item.path.partition("?")
+    sub_scope = {key: value for key, value in scope.items() if key not in _ROUTE_SCOPE_KEYS}
+    sub_scope.update({
+        "method": item.method,
+        "path": unquote(path),
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": [(name, value) for name, value in scope["headers"] if name not in _DROPPED_HEADERS],
+        BATCH_USER_SCOPE_KEY: user,
+    })
+    status_code = 500
+    content_type = ""
+    chunks: List[bytes] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status_code, content_type
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            if content_type.startswith("text/event-stream"):
+                raise _StreamingNotSupported()
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await asyncio.wait_for(app(sub_scope, receive, send), timeout=settings.BATCH_REQUEST_TIMEOUT_SECONDS)
+    except HTTPException as e:
+        # El enrutador lanza el 404 de rutas inexistentes en lugar de responderlo
+        return BatchResponseItem(id=item.id, status=e.status_code, body={"detail": e.detail})
+    except _StreamingNotSupported:
+        return BatchResponseItem(id=item.id, status=400, body={"detail": "Streaming endpoints are not supported in batches"})
+    except asyncio.TimeoutError:
+        return BatchResponseItem(id=item.id, status=504, body={"detail": "Batch request timed out"})
+    except Exception:
+        logger.exception("Batch request %s %s failed", item.method, item.path)
+        return BatchResponseItem(id=item.id, status=500, body={"detail": "Internal server error"})
+
+    body = b"".join(chunks)
+    if not body:
+        return BatchResponseItem(id=item.id, status=status_code)
+    if content_type.startswith("application/json"):
+        return BatchResponseItem(id=item.id, status=status_code, body=json.loads(body))
+    return BatchResponseItem(id=item.id, status=status_code, body=body.decode("utf-8", errors="replace"))
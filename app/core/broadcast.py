@@ -0,0 +1,85 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+# Señal de fin de canal para los suscriptores
+CLOSED = object()
+
+
+class Broadcaster:
+    """
+    Difusión en memoria del proceso por canal. El publicador calcula el mensaje una
+    vez y se entrega a todos los suscriptores del canal. Los mensajes son estados
+    completos, así que a un suscriptor lento se le descartan los más antiguos.
+    """
+    def __init__(self, queue_size: int = 8):
+        self.queue_size = queue_size
+        # Cada cola recuerda su bucle de eventos para poder publicar desde otros hilos
+        self._subscribers: Dict[str, Dict[asyncio.Queue, asyncio.AbstractEventLoop]] = {}
+        self._latest: Dict[str, Any] = {}
+
+    def has_subscribers(self, channel: str) -> bool:
+        return bool(self._subscribers.get(channel))
+
+    def latest(self, channel: str) -> Any:
+        """Último mensaje publicado en un canal con suscriptores, o None."""
+        return self._latest.get(channel)
+
+    def publish(self, channel: str, message: Any) -> None:
+        """
+        Entrega el mensaje a los suscriptores del canal. Puede llamarse desde el bucle
+        de eventos o desde otro hilo.
+        """
+        subscribers = self._subscribers.get(channel)
+        if not subscribers:
+            return
+        if message is not CLOSED:
+            self._latest[channel] = message
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for queue, loop in list(subscribers.items()):
+            if loop is running:
+                self._put(queue, message)
+            else:
+                loop.call_soon_threadsafe(self._put, queue, message)
+
+    def close(self, channel: str) -> None:
+        """Termina las suscripciones de un canal (por ejemplo, al eliminar el recurso)."""
+        self.publish(channel, CLOSED)
+
+    def close_all(self) -> None:
+        for channel in list(self._subscribers):
+            self.close(channel)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str, initial: Any = None) -> AsyncIterator[asyncio.Queue]:
+        """
+        Suscribe una cola al canal. Si el canal no tenía último mensaje se usa `initial`.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(channel, {})[queue] = asyncio.get_running_loop()
+        if channel not in self._latest and initial is not None:
+            self._latest[channel] = initial
+        if channel in self._latest:
+            queue.put_nowait(self._latest[channel])
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.pop(queue, None)
+                if not subscribers:
+                    # Sin suscriptores el último mensaje quedaría desactualizado
+                    del self._subscribers[channel]
+                    self._latest.pop(channel, None)
+
+    @staticmethod
+    def _put(queue: asyncio.Queue, message: Any) -> None:
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(message)
+
+
+broadcaster = Broadcaster()
@@ -0,0 +1,143 @@
+import gzip
+import zlib
+from typing import Callable, List, Optional, Tuple
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Solo formatos de texto; imágenes, vídeo y archivos ya van comprimidos.
+# text/event-stream queda fuera: cada mensaje debe llegar en cuanto se envía.
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/css",
+    "text/csv",
+    "text/html",
+    "text/plain",
+    "text/xml",
+)
+
+
+def negotiate_encoding(accept_encoding: str, available: Tuple[str, ...]) -> Optional[str]:
+    """
+    Elige la codificación con mayor q de Accept-Encoding entre las disponibles
+    (en empate, el orden de `available`). None si el cliente no acepta ninguna.
+    """
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = accepted.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def _compressor(encoding: str) -> Tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+    # (comprimir un trozo, cerrar el flujo) para respuestas en varias partes
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+        return (lambda chunk: compressor.process(chunk) + compressor.flush()), compressor.finish
+    compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+    return (lambda chunk: compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)), compressor.flush
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+class CompressionMiddleware:
+    """
+    Comprime las respuestas de texto (JSON de los listados) según Accept-Encoding: br si
+    el cliente lo acepta, si no gzip. Las respuestas por debajo de
+    COMPRESSION_MINIMUM_SIZE se envían tal cual, porque la cabecera y la CPU no compensan.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.encodings = ("br", "gzip")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressedResponse(self.app, encoding)(scope, receive, send)
+
+
+class _CompressedResponse:
+    def __init__(self, app: ASGIApp, encoding: str):
+        self.app = app
+        self.encoding = encoding
+        self.start: Optional[Message] = None
+        self.active = False
+        self.streaming = False
+        self.process: Optional[Callable[[bytes], bytes]] = None
+        self.finish: Optional[Callable[[], bytes]] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_wrapper)
+
+    async def send_wrapper(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+            self.active = content_type in COMPRESSIBLE_TYPES and "content-encoding" not in headers
+            if not self.active:
+                await self.send(message)
+                return
+            # Se espera al primer trozo del cuerpo para conocer su tamaño
+            self.start = message
+            return
+        if message["type"] != "http.response.body" or not self.active:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is not None:
+            start, self.start = self.start, None
+            headers = MutableHeaders(raw=start["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if not more_body and len(body) < settings.COMPRESSION_MINIMUM_SIZE:
+                self.active = False
+                await self.send(start)
+                await self.send(message)
+                return
+            headers["Content-Encoding"] = self.encoding
+            if more_body:
+                # Respuesta en varias partes: compresión incremental sin Content-Length
+                self.streaming = True
+                self.process, self.finish = _compressor(self.encoding)
+                del headers["Content-Length"]
+            else:
+                body = compress(body, self.encoding)
+                headers["Content-Length"] = str(len(body))
+            await self.send(start)
+        if self.streaming:
+            body = self.process(body) if body else b""
+            if not more_body:
+                body += self.finish()
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 
@@ -15,9 +16,64 @@ class Settings(BaseSettings):
     POSTGRES_PORT: str
     POSTGRES_DB: str
 
+    # Réplica de solo lectura para los endpoints GET. Sin valor, todo va al primario.
+    READ_DATABASE_URL: Optional[str] = None
+    # Tras una escritura, las lecturas del mismo cliente van al primario durante esta ventana
+    READ_YOUR_WRITES_SECONDS: int = 5
+
+    # Conexiones del pool que se abren al arrancar, antes de declararse listo
+    WARMUP_POOL_CONNECTIONS: int = 5
+    # Tiempo máximo de espera a peticiones y tareas en curso al apagar
+    SHUTDOWN_DRAIN_SECONDS: float = 25
+    # Tras la señal de parada, tiempo en que /health/ready falla antes de cerrar el listener,
+    # para que el balanceador retire la instancia (al menos un periodo de la sonda)
+    SHUTDOWN_READINESS_DELAY_SECONDS: float = 5
+    # Duración máxima de una conexión SSE; el cliente se reconecta y recibe el estado actual
+    STREAM_MAX_SECONDS: float = 300
+
+    # Worker del outbox dentro del servicio; desactivarlo si se ejecuta como proceso aparte
+    OUTBOX_WORKER_IN_PROCESS: bool = True
+    OUTBOX_WORKER_CONCURRENCY: int = 4
+    OUTBOX_BATCH_SIZE: int = 50
+    OUTBOX_MAX_ATTEMPTS: int = 8
+    # Los mensajes procesados se borran tras este plazo; los fallidos se conservan
+    OUTBOX_RETENTION_HOURS: int = 72
+
+    # Compresión de respuestas: tamaño mínimo en bytes y niveles (gzip 1-9, brotli 0-11)
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 6
+
+    # Respuestas guardadas por Idempotency-Key: tiempo de reutilización, plazo de la reserva
+    # de una petición en curso y espera máxima de un duplicado a la respuesta de otra réplica
+    IDEMPOTENCY_TTL_SECONDS: int = 86400
+    IDEMPOTENCY_LOCK_SECONDS: int = 60
+    IDEMPOTENCY_WAIT_SECONDS: float = 10
+    # Bytes del cuerpo de una petición con Idempotency-Key que se guardan en memoria antes
+    # de pasar a un fichero temporal
+    IDEMPOTENCY_BODY_MEMORY_BYTES: int = 1024 * 1024
+
+    # POST /batch: peticiones por lote, cuántas se ejecutan a la vez (cada una usa una conexión
+    # del pool) y plazo máximo de cada una
+    BATCH_MAX_REQUESTS: int = 20
+    BATCH_MAX_CONCURRENCY: int = 4
+    BATCH_REQUEST_TIMEOUT_SECONDS: float = 10
+
+    # Días tras la fecha del evento antes de archivar los completados o cancelados
+    ARCHIVE_AFTER_DAYS: int = 30
+
+    # Tareas periódicas dentro del servicio; desactivarlo si se ejecutan como proceso aparte
+    SCHEDULER_IN_PROCESS: bool = True
+    SCHEDULER_BATCH_SIZE: int = 500
+    EVENT_COMPLETION_INTERVAL_SECONDS: int = 300
+    ARCHIVE_INTERVAL_SECONDS: int = 86400
+
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Cada cuánto cada réplica incorpora las revocaciones de refresh tokens hechas en las demás
+    REVOCATION_SYNC_SECONDS: float = 5
 
     ENVIRONMENT: str = "development"
 
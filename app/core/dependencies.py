@@ -6,8 +6,9 @@ from jose import jwt, JWTError
 from pydantic import ValidationError
 from sqlmodel import Session
 
+from app.core.batch import BATCH_USER_SCOPE_KEY
 from app.core.config import get_settings
-from app.core.security import decode_access_token
+from app.core.security import REFRESH_TOKEN_TYPE, decode_access_token
 from app.database.connection import get_db_session
 from app.models.user import User 
 from app.schemas.user import TokenPayload
@@ -25,6 +26,10 @@ def get_current_user(
     """
     Obtiene el usuario actualmente autenticado a partir de un token JWT.
     """
+    batch_user = request.scope.get(BATCH_USER_SCOPE_KEY)
+    if batch_user is not None:
+        # Subpetición de /batch: el lote ya autenticó al usuario
+        return batch_user
     token = request.cookies.get("access_token") or request.headers.get("Authorization")
     if not token:
         raise HTTPException(
@@ -37,6 +42,9 @@ def get_current_user(
     try:
         payload = decode_access_token(token)
         token_data = TokenPayload.model_validate(payload)
+        if token_data.type == REFRESH_TOKEN_TYPE:
+            # Un refresh token solo sirve para /login/refresh-token
+            raise JWTError("Refresh token used as access token")
     except (JWTError, ValidationError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,252 @@
+import asyncio
+import hashlib
+import tempfile
+from dataclasses import dataclass
+from typing import IO, Dict, List, Optional, Tuple
+
+from jose import JWTError
+from pydantic import ValidationError
+from starlette.requests import HTTPConnection
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+from app.core.security import REFRESH_TOKEN_TYPE, decode_access_token
+from app.database.connection import open_session
+from app.repositories.idempotency_repository import IdempotencyRepository
+from app.schemas.user import TokenPayload
+
+settings = get_settings()
+
+IDEMPOTENCY_HEADER = "idempotency-key"
+REPLAYED_HEADER = "idempotent-replayed"
+MAX_KEY_LENGTH = 255
+BODY_CHUNK_SIZE = 64 * 1024
+# Las respuestas de autenticación contienen tokens: no se guardan
+EXCLUDED_PATH_PREFIXES = (f"{settings.API_V1_STR}/login", f"{settings.API_V1_STR}/logout")
+
+
+@dataclass
+class StoredResponse:
+    fingerprint: str
+    status_code: int
+    headers: List[List[str]]
+    body: bytes
+
+    async def replay(self, send: Send) -> None:
+        headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in self.headers]
+        headers.append((REPLAYED_HEADER.encode("latin-1"), b"true"))
+        await send({"type": "http.response.start", "status": self.status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": self.body})
+
+
+def request_user_id(connection: HTTPConnection) -> Optional[int]:
+    """
+    Usuario del access token (cookie o cabecera Authorization) sin consultar la base de datos.
+    La validación completa la hace el endpoint; sin token válido no se aplica idempotencia.
+    """
+    token = connection.cookies.get("access_token") or connection.headers.get("authorization")
+    if not token:
+        return None
+    if token.startswith("Bearer "):
+        token = token.split(" ")[1]
+    try:
+        token_data = TokenPayload.model_validate(decode_access_token(token))
+    except (JWTError, ValidationError):
+        return None
+    return None if token_data.type == REFRESH_TOKEN_TYPE else token_data.sub
+
+
+class RequestFingerprint:
+    """
+    Huella del método, la ruta y el cuerpo, calculada por partes a medida que llega el
+    cuerpo. En multipart se descarta el boundary, que el cliente genera al azar en cada
+    envío aunque el contenido sea el mismo.
+    """
+    def __init__(self, scope: Scope, connection: HTTPConnection):
+        self._hash = hashlib.sha256(b"\n".join([scope["method"].encode(), scope["path"].encode(), scope["query_string"], b""]))
+        self._boundary = b""
+        self._pending = b""
+        content_type = connection.headers.get("content-type", "")
+        if content_type.startswith("multipart/") and "boundary=" in content_type:
+            self._boundary = content_type.split("boundary=", 1)[1].split(";", 1)[0].strip('"').encode("latin-1")
+
+    def update(self, chunk: bytes) -> None:
+        if not self._boundary:
+            self._hash.update(chunk)
+            return
+        # Se retiene la cola por si un boundary queda partido entre dos fragmentos
+        data = (self._pending + chunk).replace(self._boundary, b"")
+        keep = len(self._boundary) - 1
+        self._hash.update(data[:len(data) - keep] if len(data) > keep else b"")
+        self._pending = data[len(data) - keep:] if len(data) > keep else data
+
+    def hexdigest(self) -> str:
+        final = self._hash.copy()
+        final.update(self._pending)
+        return final.hexdigest()
+
+
+class IdempotencyMiddleware:
+    """
+    Guarda la primera respuesta de cada POST autenticado con cabecera Idempotency-Key
+    (por usuario y clave, durante IDEMPOTENCY_TTL_SECONDS) y la devuelve tal cual a los
+    reintentos sin volver a ejecutar el endpoint. Un duplicado simultáneo espera a la
+    petición original: en el mismo proceso, a su futuro; en otra réplica, a que se guarde
+    su respuesta. Las respuestas 5xx no se guardan para que el reintento se ejecute.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._in_flight: Dict[Tuple[int, str], asyncio.Future] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"].startswith(EXCLUDED_PATH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        connection = HTTPConnection(scope)
+        key = connection.headers.get(IDEMPOTENCY_HEADER)
+        user_id = request_user_id(connection) if key else None
+        if user_id is None:
+            await self.app(scope, receive, send)
+            return
+        if len(key) > MAX_KEY_LENGTH:
+            response = JSONResponse({"detail": f"Idempotency-Key must be at most {MAX_KEY_LENGTH} characters"}, status_code=400)
+            await response(scope, receive, send)
+            return
+
+        fingerprint = RequestFingerprint(scope, connection)
+        with tempfile.SpooledTemporaryFile(max_size=settings.IDEMPOTENCY_BODY_MEMORY_BYTES) as body:
+            await _spool_body(receive, body, fingerprint)
+            await self._dispatch(scope, _replay_body(body, receive), send, user_id, key, fingerprint.hexdigest())
+
+    async def _dispatch(self, scope: Scope, receive: Receive, send: Send, user_id: int, key: str, fingerprint: str) -> None:
+        slot = (user_id, key)
+        # Varios duplicados pueden esperar al mismo futuro: si la original no guardó respuesta,
+        # solo uno ocupa su lugar y el resto vuelve a esperar al nuevo futuro
+        while (waiting := self._in_flight.get(slot)) is not None:
+            stored = await asyncio.shield(waiting)
+            if stored is not None:
+                await self._replay(stored, fingerprint, scope, receive, send)
+                return
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[slot] = future
+        stored = None
+        try:
+            stored = await self._handle(scope, receive, send, user_id, key, fingerprint)
+        finally:
+            if self._in_flight.get(slot) is future:
+                del self._in_flight[slot]
+            future.set_result(stored)
+
+    async def _handle(self, scope: Scope, receive: Receive, send: Send, user_id: int, key: str, fingerprint: str) -> Optional[StoredResponse]:
+        claimed = await asyncio.to_thread(self._claim, user_id, key, fingerprint)
+        if not claimed:
+            stored = await self._wait_for_response(user_id, key)
+            if stored is None:
+                response = JSONResponse(
+                    {"detail": "A request with this Idempotency-Key is still in progress"},
+                    status_code=409, headers={"Retry-After": "1"},
+                )
+                await response(scope, receive, send)
+                return None
+            await self._replay(stored, fingerprint, scope, receive, send)
+            return stored
+
+        status_code = 500
+        headers: List[List[str]] = []
+        chunks: List[bytes] = []
+
+        async def capture(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers.extend(
+                    [name.decode("latin-1"), value.decode("latin-1")]
+                    for name, value in message.get("headers", [])
+                    if name.lower() != b"set-cookie"
+                )
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, capture)
+        except BaseException:
+            await asyncio.to_thread(self._release, user_id, key)
+            raise
+        if status_code >= 500:
+            await asyncio.to_thread(self._release, user_id, key)
+            return None
+        stored = StoredResponse(fingerprint, status_code, headers, b"".join(chunks))
+        await asyncio.to_thread(self._complete, user_id, key, stored)
+        return stored
+
+    async def _replay(self, stored: StoredResponse, fingerprint: str, scope: Scope, receive: Receive, send: Send) -> None:
+        if stored.fingerprint != fingerprint:
+            response = JSONResponse({"detail": "Idempotency-Key was already used with a different request"}, status_code=422)
+            await response(scope, receive, send)
+            return
+        await stored.replay(send)
+
+    async def _wait_for_response(self, user_id: int, key: str) -> Optional[StoredResponse]:
+        # La petición original está en otra réplica: se espera a que guarde su respuesta
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.IDEMPOTENCY_WAIT_SECONDS
+        while True:
+            stored = await asyncio.to_thread(self._get, user_id, key)
+            if stored is not None or loop.time() >= deadline:
+                return stored
+            await asyncio.sleep(0.1)
+
+    @staticmethod
+    def _claim(user_id: int, key: str, fingerprint: str) -> bool:
+        with open_session() as session:
+            return IdempotencyRepository(session).claim(user_id, key, fingerprint, settings.IDEMPOTENCY_LOCK_SECONDS)
+
+    @staticmethod
+    def _get(user_id: int, key: str) -> Optional[StoredResponse]:
+        with open_session() as session:
+            record = IdempotencyRepository(session).get(user_id, key)
+            if record is None or record.status_code is None:
+                return None
+            return StoredResponse(record.fingerprint, record.status_code, record.headers, record.body or b"")
+
+    @staticmethod
+    def _complete(user_id: int, key: str, stored: StoredResponse) -> None:
+        with open_session() as session:
+            IdempotencyRepository(session).complete(
+                user_id, key, stored.status_code, stored.headers, stored.body, settings.IDEMPOTENCY_TTL_SECONDS
+            )
+
+    @staticmethod
+    def _release(user_id: int, key: str) -> None:
+        with open_session() as session:
+            IdempotencyRepository(session).release(user_id, key)
+
+
+async def _spool_body(receive: Receive, body: IO[bytes], fingerprint: RequestFingerprint) -> None:
+    # El cuerpo se guarda en un fichero temporal (en memoria solo hasta IDEMPOTENCY_BODY_MEMORY_BYTES)
+    # para que las subidas grandes, como /events/import, no queden enteras en memoria
+    while True:
+        message = await receive()
+        chunk = message.get("body", b"")
+        fingerprint.update(chunk)
+        body.write(chunk)
+        if not message.get("more_body", False):
+            body.seek(0)
+            return
+
+
+def _replay_body(body: IO[bytes], receive: Receive) -> Receive:
+    # El cuerpo guardado se entrega por partes; después se delega (p. ej. http.disconnect)
+    done = False
+
+    async def replay() -> Message:
+        nonlocal done
+        if not done:
+            chunk = body.read(BODY_CHUNK_SIZE)
+            done = len(chunk) < BODY_CHUNK_SIZE
+            return {"type": "http.request", "body": chunk, "more_body": not done}
+        return await receive()
+    return replay
@@ -0,0 +1,220 @@
+import asyncio
+import logging
+import signal
+import threading
+from contextlib import asynccontextmanager
+from datetime import date
+from types import FrameType
+from typing import AsyncIterator, Callable, Coroutine, List, Optional, Set
+
+from fastapi import FastAPI
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+HEALTH_PATH_PREFIX = f"{settings.API_V1_STR}/health"
+
+
+class Lifecycle:
+    """
+    Estado del proceso: listo para recibir tráfico, drenando, peticiones en curso
+    y tareas en segundo plano pendientes.
+    """
+    def __init__(self):
+        self.ready = False
+        self.draining = False
+        self.in_flight = 0
+        self._tasks: Set[asyncio.Task] = set()
+        self._on_drain: List[Callable[[], None]] = []
+        self._handed_over = False
+        self._hand_over_task: Optional[asyncio.Task] = None
+
+    def spawn(self, coro: Coroutine) -> asyncio.Task:
+        """
+        Lanza una tarea en segundo plano que el apagado esperará antes de cerrar.
+        """
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def on_drain(self, callback: Callable[[], None]) -> None:
+        """
+        Registra una función que se llama al empezar el drenaje, p. ej. para cerrar las
+        conexiones que no terminan solas y que bloquearían el apagado.
+        """
+        if callback not in self._on_drain:
+            self._on_drain.append(callback)
+
+    def begin_draining(self) -> None:
+        """
+        Deja de declararse listo y rechaza las peticiones nuevas con 503.
+        """
+        self.ready = False
+        if self.draining:
+            return
+        self.draining = True
+        for callback in self._on_drain:
+            callback()
+
+    def install_signal_handlers(self) -> None:
+        """
+        Adelanta el drenaje a la señal de parada. Al recibir SIGTERM/SIGINT uvicorn deja de
+        aceptar conexiones y espera a las abiertas antes de ejecutar el apagado del lifespan,
+        así que el drenaje no vería tráfico. Estos manejadores se ejecutan antes: marcan el
+        proceso como drenando (/health/ready falla), esperan SHUTDOWN_READINESS_DELAY_SECONDS
+        a que el balanceador deje de enviar tráfico y a que terminen las peticiones en curso,
+        y después pasan la señal a uvicorn. Una segunda señal se pasa de inmediato.
+        """
+        # Solo el hilo principal puede instalar manejadores (no aplica, p. ej., en TestClient)
+        if threading.current_thread() is not threading.main_thread():
+            return
+        loop = asyncio.get_running_loop()
+        self._handed_over = False
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            previous = signal.getsignal(signum)
+            if not callable(previous) or previous is signal.default_int_handler:
+                continue
+
+            def handler(signum: int, frame: Optional[FrameType], previous: Callable = previous) -> None:
+                loop.call_soon_threadsafe(self.on_shutdown_signal, previous, signum, frame)
+            signal.signal(signum, handler)
+
+    def on_shutdown_signal(self, previous: Callable, signum: int, frame: Optional[FrameType]) -> None:
+        if self.draining:
+            self._hand_over(previous, signum, frame)
+            return
+        logger.info("Shutdown signal %s received, draining", signum)
+        self.begin_draining()
+        self._hand_over_task = asyncio.get_running_loop().create_task(self._hand_over_after_drain(previous, signum, frame))
+
+    async def _hand_over_after_drain(self, previous: Callable, signum: int, frame: Optional[FrameType]) -> None:
+        await asyncio.sleep(settings.SHUTDOWN_READINESS_DELAY_SECONDS)
+        await self._wait_in_flight(settings.SHUTDOWN_DRAIN_SECONDS)
+        self._hand_over(previous, signum, frame)
+
+    def _hand_over(self, previous: Callable, signum: int, frame: Optional[FrameType]) -> None:
+        # Uvicorn trata un segundo SIGINT como salida forzada: solo se le pasa una vez por drenaje
+        if not self._handed_over:
+            self._handed_over = True
+            previous(signum, frame)
+
+    async def _wait_in_flight(self, timeout: float) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while self.in_flight and loop.time() < deadline:
+            await asyncio.sleep(0.05)
+
+    async def drain(self, timeout: float) -> None:
+        """
+        Deja de aceptar trabajo y espera a las peticiones en curso y a las tareas
+        en segundo plano; lo que siga pendiente al agotar el plazo se cancela.
+        """
+        self.begin_draining()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        await self._wait_in_flight(timeout)
+        if self._tasks:
+            _, pending = await asyncio.wait(set(self._tasks), timeout=max(deadline - loop.time(), 0))
+            for task in pending:
+                task.cancel()
+        if self.in_flight or self._tasks:
+            logger.warning("Shutdown drain timed out with %s requests and %s tasks pending", self.in_flight, len(self._tasks))
+
+
+lifecycle = Lifecycle()
+
+
+class InFlightMiddleware:
+    """
+    Cuenta las peticiones en curso y, durante el apagado, rechaza las nuevas con 503
+    (salvo los health checks, que deben seguir informando del estado).
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(HEALTH_PATH_PREFIX):
+            await self.app(scope, receive, send)
+            return
+        if lifecycle.draining:
+            response = JSONResponse({"detail": "Server is shutting down"}, status_code=503, headers={"Retry-After": "1"})
+            await response(scope, receive, send)
+            return
+        lifecycle.in_flight += 1
+        try:
+            # Incluye las BackgroundTasks de la respuesta, que se ejecutan antes de volver
+            await self.app(scope, receive, send)
+        finally:
+            lifecycle.in_flight -= 1
+
+
+def warm_up(app: FastAPI) -> None:
+    """
+    Paga al arrancar los costes que si no pagaría la primera petición tras un despliegue.
+    """
+    from app.core.security import get_password_hash, verify_password
+    from app.database.connection import engine, open_session, read_engine
+    from app.repositories.event_repository import EventRepository
+    from app.use_cases.event.get_event import GetEventUseCase
+
+    # Conexiones del pool abiertas a la vez para que queden todas en el pool
+    for bind in filter(None, (engine, read_engine)):
+        connections = [bind.connect() for _ in range(min(settings.WARMUP_POOL_CONNECTIONS, bind.pool.size()))]
+        for connection in connections:
+            connection.exec_driver_sql("SELECT 1")
+        for connection in connections:
+            connection.close()
+
+    # Carga del backend de bcrypt
+    verify_password("warm-up", get_password_hash("warm-up"))
+
+    # Esquemas de los modelos de respuesta (OpenAPI) y caché del calendario del mes actual
+    app.openapi()
+    today = date.today()
+    with open_session() as session:
+        GetEventUseCase(EventRepository(session)).execute_calendar(today.year, today.month)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    from app.core.broadcast import broadcaster
+    from app.database.connection import engine, read_engine
+    from app.workers.outbox_worker import build_worker
+    from app.workers.revocation_sync import RevocationSync
+    from app.workers.scheduler import Scheduler
+
+    await asyncio.to_thread(warm_up, app)
+    # Lista de revocación completa antes de aceptar tráfico y sincronizada después
+    revocation_sync = RevocationSync(engine, settings.REVOCATION_SYNC_SECONDS)
+    await asyncio.to_thread(revocation_sync.sync_once)
+    lifecycle.spawn(revocation_sync.run())
+    outbox_worker = build_worker(engine) if settings.OUTBOX_WORKER_IN_PROCESS else None
+    if outbox_worker:
+        lifecycle.spawn(outbox_worker.run())
+    scheduler = Scheduler(engine) if settings.SCHEDULER_IN_PROCESS else None
+    if scheduler:
+        lifecycle.spawn(scheduler.run())
+    lifecycle.draining = False
+    # Las conexiones de streaming no terminan solas y uvicorn las espera antes del apagado:
+    # se cierran al empezar el drenaje, con la señal de parada
+    lifecycle.on_drain(broadcaster.close_all)
+    lifecycle.install_signal_handlers()
+    lifecycle.ready = True
+    logger.info("Application warmed up and ready")
+    try:
+        yield
+    finally:
+        # El worker y el planificador terminan su lote en curso y el drenaje los espera como a cualquier tarea
+        if outbox_worker:
+            outbox_worker.stop()
+        if scheduler:
+            scheduler.stop()
+        revocation_sync.stop()
+        await lifecycle.drain(settings.SHUTDOWN_DRAIN_SECONDS)
+        for bind in filter(None, (engine, read_engine)):
+            bind.dispose()
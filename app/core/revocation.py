@@ -0,0 +1,60 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Protocol, Tuple
+
+
+class RevocationStore(Protocol):
+    """
+    Almacén persistente de jti revocados, compartido entre réplicas
+    (la tabla revoked_token; podría sustituirse por Redis u otro almacén).
+    """
+    def revoke(self, jti: str, user_id: int, expires_at: datetime) -> bool: ...
+
+    def get_revoked_since(self, since: datetime) -> List[Tuple[str, datetime]]: ...
+
+
+class RevocationList:
+    """
+    Copia en memoria del proceso de los jti revocados con su expiración (UTC).
+    Comprobar un token es una búsqueda en un dict; las entradas se descartan cuando
+    el token habría expirado de todos modos, así que el tamaño se limita a los
+    refresh tokens revocados en su periodo de validez.
+    """
+    def __init__(self, overlap_seconds: float = 60):
+        # Se releen las revocaciones de este margen anterior a la última sincronización:
+        # cubre transacciones confirmadas tarde y relojes desfasados entre réplicas
+        self.overlap_seconds = overlap_seconds
+        self._entries: Dict[str, datetime] = {}
+        self._synced_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def is_revoked(self, jti: str) -> bool:
+        return jti in self._entries
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        with self._lock:
+            self._entries[jti] = expires_at
+
+    def sync(self, store: RevocationStore) -> None:
+        """
+        Incorpora las revocaciones del almacén hechas desde la última sincronización
+        (todas las vigentes la primera vez) y descarta las expiradas. La consulta al
+        almacén se hace sin el lock para no bloquear a `add` durante ella.
+        """
+        with self._lock:
+            now = datetime.utcnow()
+            since = self._synced_at - timedelta(seconds=self.overlap_seconds) if self._synced_at else datetime.min
+        revoked = store.get_revoked_since(since)
+        with self._lock:
+            self._entries.update(revoked)
+            self._synced_at = max(now, self._synced_at) if self._synced_at else now
+            for jti in [jti for jti, expires_at in self._entries.items() if expires_at <= now]:
+                self._entries.pop(jti, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._synced_at = None
+
+
+revocation_list = RevocationList()
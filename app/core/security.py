@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta, timezone
 from typing import Any, Union
+from uuid import uuid4
 
 from passlib.context import CryptContext
 from jose import jwt, JWTError
@@ -10,6 +11,8 @@ settings = get_settings()
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+REFRESH_TOKEN_TYPE = "refresh"
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifica si una contraseña en texto plano coincide con su versión hasheada.
@@ -36,6 +39,14 @@ def create_access_token(
     )
     return encoded_jwt
 
+def create_refresh_token(subject: Union[str, Any]) -> str:
+    """
+    Crea un refresh token de un solo uso: su identificador (jti) se revoca al rotarlo.
+    """
+    expire = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    to_encode = {"exp": expire, "sub": str(subject), "jti": uuid4().hex, "type": REFRESH_TOKEN_TYPE}
+    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
 def decode_access_token(token: str) -> dict[str, Any]:
     """
     Decodifica y valida un token de acceso JWT.
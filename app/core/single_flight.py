@@ -0,0 +1,62 @@
+import asyncio
+from collections import Counter
+from typing import Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Deduplicación de lecturas idénticas simultáneas dentro del proceso. La primera petición
+    con una clave lanza la consulta en un hilo; las que llegan mientras está en curso esperan
+    ese mismo resultado (o excepción) en lugar de repetirla. No es una caché: la clave se
+    libera en cuanto termina la consulta.
+    """
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        # Por nombre de la consulta (primer elemento de la clave)
+        self.executed: Counter = Counter()
+        self.coalesced: Counter = Counter()
+
+    async def do(self, key: Tuple, fn: Callable[[], T], shared: bool = True) -> T:
+        """
+        Ejecuta `fn` o se une a la ejecución en curso con la misma clave. Con `shared=False`
+        se ejecuta aparte (p. ej. un cliente que acaba de escribir no debe recibir una
+        lectura que empezó antes de su escritura).
+        """
+        name = key[0]
+        loop = asyncio.get_running_loop()
+        task = self._calls.get(key) if shared else None
+        if task is not None and task.get_loop() is loop:
+            self.coalesced[name] += 1
+            return await asyncio.shield(task)
+
+        self.executed[name] += 1
+        task = loop.create_task(asyncio.to_thread(fn))
+        task.add_done_callback(self._retrieve_exception)
+        if shared:
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        # shield: si se cancela la petición que lanzó la consulta, las demás siguen esperándola
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        names = sorted(set(self.executed) | set(self.coalesced))
+        return {name: {"executed": self.executed[name], "coalesced": self.coalesced[name]} for name in names}
+
+    def reset_stats(self) -> None:
+        self.executed.clear()
+        self.coalesced.clear()
+
+    def _release(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    @staticmethod
+    def _retrieve_exception(task: asyncio.Task) -> None:
+        # Evita el aviso de excepción no recuperada si nadie quedó esperando
+        if not task.cancelled():
+            task.exception()
+
+
+single_flight = SingleFlight()
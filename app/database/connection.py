@@ -1,7 +1,11 @@
-from typing import Generator
+from typing import Annotated, Generator, Optional
 
+from fastapi import Depends, Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlmodel import create_engine, Session
 from app.core.config import get_settings
+from app.core.middleware import wrote_recently
 
 settings = get_settings()
 
@@ -14,6 +18,20 @@ DATABASE_URL = (
 
 engine = create_engine(DATABASE_URL, echo=True)
 
+# Motor de solo lectura (réplica). Si no está configurado, las lecturas usan el primario.
+read_engine = create_engine(settings.READ_DATABASE_URL, echo=True) if settings.READ_DATABASE_URL else None
+
+@event.listens_for(Engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """
+    SQLite no aplica las claves foráneas (ni ON DELETE CASCADE) salvo que se active por conexión.
+    """
+    if type(dbapi_connection).__module__.startswith("sqlite3"):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 def create_db_and_tables():
     """
     Función para crear todas las tablas definidas por SQLModel.
@@ -24,10 +42,34 @@ def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
 
 
+def open_session(bind: Optional[Engine] = None) -> Session:
+    """
+    Crea una sesión que no expira los objetos al hacer commit: los valores generados
+    ya llegan con el INSERT/UPDATE (RETURNING) y no hace falta un SELECT posterior.
+    """
+    return Session(bind if bind is not None else engine, expire_on_commit=False)
+
+
 def get_db_session() -> Generator[Session, None, None]:
     """
     Dependencia de FastAPI para obtener una sesión de base de datos.
     Abre y cierra la sesión por cada solicitud.
     """
-    with Session(engine) as session:
+    with open_session() as session:
+        yield session
+
+
+def get_read_db_session(
+    request: Request,
+    primary_session: Annotated[Session, Depends(get_db_session)],
+) -> Generator[Session, None, None]:
+    """
+    Dependencia de FastAPI para lecturas que toleran el retraso de la réplica.
+    Usa el primario si no hay réplica o si el cliente escribió hace muy poco
+    (read-your-writes); la sesión del primario no abre conexión si no se usa.
+    """
+    if read_engine is None or wrote_recently(request):
+        yield primary_session
+        return
+    with open_session(read_engine) as session:
         yield session
\ No newline at end of file
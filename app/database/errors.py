@@ -0,0 +1,27 @@
+# app/database/errors.py
+from typing import Optional
+
+from sqlalchemy import Table, UniqueConstraint
+from sqlalchemy.exc import IntegrityError
+
+
+def violated_constraint(error: IntegrityError, table: Table) -> Optional[str]:
+    """
+    Nombre de la restricción o índice único de `table` que violó la escritura, o None si
+    no se puede identificar. PostgreSQL lo informa en el diagnóstico del error; SQLite solo
+    en el mensaje, con el nombre en las CHECK y con las columnas en las restricciones únicas.
+    """
+    diag = getattr(error.orig, "diag", None)
+    if diag is not None:
+        return diag.constraint_name
+    message = str(error.orig)
+    unique = [index for index in table.indexes if index.unique]
+    unique += [constraint for constraint in table.constraints if isinstance(constraint, UniqueConstraint)]
+    for constraint in unique:
+        columns = ", ".join(f"{table.name}.{column.name}" for column in constraint.columns)
+        if message == f"UNIQUE constraint failed: {columns}":
+            return constraint.name
+    for constraint in table.constraints:
+        if constraint.name and message == f"CHECK constraint failed: {constraint.name}":
+            return constraint.name
+    return None
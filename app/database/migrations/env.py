@@ -13,6 +13,14 @@ from app.models.base import SQLModel
 from app.models.user import User
 from app.models.envent import Event
 from app.models.session import Session
+from app.models.outbox import OutboxMessage
+from app.models.event_change import EventChange
+from app.models.archive import EventArchive, SessionArchive, RegistrationArchive, SessionRegistrationArchive
+from app.models.job_run import JobRun
+from app.models.revoked_token import RevokedToken
+from app.models.idempotency import IdempotencyKey
+from app.models.session_registration import SessionRegistration
+from app.models.event_popularity import EventPopularity, PopularityEpoch
 
 target_metadata = SQLModel.metadata
 
@@ -0,0 +1,38 @@
+"""Create session registration archive
+
+Revision ID: 1b8e5f3c7a64
+Revises: f7c1e4a9d352
+Create Date: 2026-10-20 11:03:15.902741
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b8e5f3c7a64'
+down_revision: Union[str, None] = 'f7c1e4a9d352'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('session_registration_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('session_id', sa.Integer(), nullable=False),
+    sa.Column('registration_date', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_session_registration_archive_session_id'), 'session_registration_archive', ['session_id'], unique=False)
+    op.create_index('ix_session_registration_archive_user_id_session_id', 'session_registration_archive', ['user_id', 'session_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_session_registration_archive_user_id_session_id', table_name='session_registration_archive')
+    op.drop_index(op.f('ix_session_registration_archive_session_id'), table_name='session_registration_archive')
+    op.drop_table('session_registration_archive')
@@ -0,0 +1,50 @@
+"""Cascade event deletes to sessions and registrations
+
+Revision ID: 3c8b5f2a7e19
+Revises: 9d4e2b7f1c63
+Create Date: 2026-10-19 19:10:36.845120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c8b5f2a7e19'
+down_revision: Union[str, None] = '9d4e2b7f1c63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("session", "registration")
+
+
+def _replace_event_fks(on_delete: str) -> None:
+    # El cambio de la restricción (NOT VALID) toma un bloqueo exclusivo breve, sin recorrer la tabla
+    for table in TABLES:
+        op.execute(
+            f'ALTER TABLE "{table}" DROP CONSTRAINT {table}_event_id_fkey, '
+            f'ADD CONSTRAINT {table}_event_id_fkey FOREIGN KEY (event_id) REFERENCES event (id) {on_delete} NOT VALID'
+        )
+    # VALIDATE en su propia transacción, tras confirmar la anterior: recorre la tabla con
+    # SHARE UPDATE EXCLUSIVE, que no bloquea las escrituras. En la misma transacción se mantendría
+    # el bloqueo exclusivo del ALTER durante todo el recorrido.
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.execute(f'ALTER TABLE "{table}" VALIDATE CONSTRAINT {table}_event_id_fkey')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Solo PostgreSQL: en SQLite (pruebas) las tablas se crean desde los modelos
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    _replace_event_fks("ON DELETE CASCADE")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    _replace_event_fks("")
@@ -0,0 +1,68 @@
+"""Add access path indexes
+
+Revision ID: 4b1d2e7c9a30
+Revises: d69fac703615
+Create Date: 2026-10-19 15:30:12.418230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b1d2e7c9a30'
+down_revision: Union[str, None] = 'd69fac703615'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    postgres = bind.dialect.name == "postgresql"
+
+    # La restricción única fallaría si ya existen registros duplicados: se conserva el más antiguo
+    op.execute(
+        "DELETE FROM registration WHERE id NOT IN ("
+        "SELECT MIN(id) FROM registration GROUP BY user_id, event_id)"
+    )
+
+    # CREATE INDEX CONCURRENTLY no puede ejecutarse dentro de una transacción
+    with op.get_context().autocommit_block():
+        op.create_index('ix_event_organizer_id', 'event', ['organizer_id'], unique=False,
+                        postgresql_concurrently=True)
+        op.create_index('ix_event_published', 'event', ['id'], unique=False,
+                        postgresql_where=sa.text("status = 'PUBLISHED'"),
+                        sqlite_where=sa.text("status = 'PUBLISHED'"),
+                        postgresql_concurrently=True)
+        op.create_index('ix_session_event_id_start_time', 'session', ['event_id', 'start_time'], unique=False,
+                        postgresql_concurrently=True)
+        op.create_index('uq_registration_user_event', 'registration', ['user_id', 'event_id'], unique=True,
+                        postgresql_concurrently=True)
+        # El índice compuesto (user_id, event_id) ya sirve las búsquedas por user_id
+        op.drop_index('ix_registration_user_id', table_name='registration', postgresql_concurrently=True)
+
+    if postgres:
+        # Promueve el índice único ya construido a restricción sin volver a recorrer la tabla
+        op.execute(
+            "ALTER TABLE registration ADD CONSTRAINT uq_registration_user_event "
+            "UNIQUE USING INDEX uq_registration_user_event"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.drop_constraint('uq_registration_user_event', 'registration', type_='unique')
+    else:
+        op.drop_index('uq_registration_user_event', table_name='registration')
+
+    with op.get_context().autocommit_block():
+        op.create_index('ix_registration_user_id', 'registration', ['user_id'], unique=False,
+                        postgresql_concurrently=True)
+        op.drop_index('ix_session_event_id_start_time', table_name='session', postgresql_concurrently=True)
+        op.drop_index('ix_event_published', table_name='event', postgresql_concurrently=True)
+        op.drop_index('ix_event_organizer_id', table_name='event', postgresql_concurrently=True)
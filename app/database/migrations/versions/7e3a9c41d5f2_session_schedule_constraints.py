@@ -0,0 +1,48 @@
+"""Session schedule constraints
+
+Revision ID: 7e3a9c41d5f2
+Revises: 4b1d2e7c9a30
+Create Date: 2026-10-19 16:05:41.902117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e3a9c41d5f2'
+down_revision: Union[str, None] = '4b1d2e7c9a30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_session_speaker_id_start_time', 'session', ['speaker_id', 'start_time'], unique=False,
+                        postgresql_concurrently=True)
+
+    if op.get_bind().dialect.name == "postgresql":
+        # Intervalos semiabiertos [inicio, fin): sesiones consecutivas no se consideran solapadas.
+        # Fallará si ya existen solapamientos; hay que resolverlos antes (GET /speakers/{id}/conflicts).
+        op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+        op.execute(
+            "ALTER TABLE session ADD CONSTRAINT ex_session_speaker_overlap "
+            "EXCLUDE USING gist (speaker_id WITH =, tsrange(start_time, end_time) WITH &&)"
+        )
+        op.execute(
+            "ALTER TABLE session ADD CONSTRAINT ex_session_event_overlap "
+            "EXCLUDE USING gist (event_id WITH =, tsrange(start_time, end_time) WITH &&)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_constraint('ex_session_event_overlap', 'session')
+        op.drop_constraint('ex_session_speaker_overlap', 'session')
+
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_session_speaker_id_start_time', table_name='session', postgresql_concurrently=True)
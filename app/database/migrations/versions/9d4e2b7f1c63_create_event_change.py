@@ -0,0 +1,41 @@
+"""Create event change feed
+
+Revision ID: 9d4e2b7f1c63
+Revises: f1a7c3e9b2d8
+Create Date: 2026-10-19 18:41:52.207316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4e2b7f1c63'
+down_revision: Union[str, None] = 'f1a7c3e9b2d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('event_change',
+    sa.Column('seq', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), autoincrement=True, nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('deleted', sa.Boolean(), nullable=False),
+    sa.Column('changed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('seq')
+    )
+    op.create_index(op.f('ix_event_change_event_id'), 'event_change', ['event_id'], unique=False)
+    # Los eventos existentes entran en el feed en orden de actualización
+    op.execute(
+        "INSERT INTO event_change (event_id, deleted, changed_at) "
+        "SELECT id, false, updated_at FROM event ORDER BY updated_at, id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_event_change_event_id'), table_name='event_change')
+    op.drop_table('event_change')
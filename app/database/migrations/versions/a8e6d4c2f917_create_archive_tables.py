@@ -0,0 +1,78 @@
+"""Create archive tables
+
+Revision ID: a8e6d4c2f917
+Revises: 3c8b5f2a7e19
+Create Date: 2026-10-19 20:41:12.308551
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e6d4c2f917'
+down_revision: Union[str, None] = '3c8b5f2a7e19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Reutiliza el tipo 'eventstatus' que ya crea la tabla event
+    event_status = sa.Enum('DRAFT', 'PUBLISHED', 'CANCELLED', 'COMPLETED', name='eventstatus').with_variant(
+        postgresql.ENUM(name='eventstatus', create_type=False), 'postgresql'
+    )
+    op.create_table('event_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('name', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False),
+    sa.Column('description', sqlmodel.sql.sqltypes.AutoString(length=1000), nullable=True),
+    sa.Column('event_date', sa.Date(), nullable=False),
+    sa.Column('location', sqlmodel.sql.sqltypes.AutoString(length=200), nullable=False),
+    sa.Column('capacity', sa.Integer(), nullable=False),
+    sa.Column('status', event_status, nullable=False),
+    sa.Column('image_url', sqlmodel.sql.sqltypes.AutoString(length=500), nullable=True),
+    sa.Column('organizer_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_event_archive_organizer_id_event_date', 'event_archive', ['organizer_id', 'event_date'], unique=False)
+    op.create_table('session_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('name', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False),
+    sa.Column('description', sqlmodel.sql.sqltypes.AutoString(length=1000), nullable=True),
+    sa.Column('start_time', sa.DateTime(), nullable=False),
+    sa.Column('end_time', sa.DateTime(), nullable=False),
+    sa.Column('capacity', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('speaker_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_session_archive_event_id'), 'session_archive', ['event_id'], unique=False)
+    op.create_table('registration_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('registration_date', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_registration_archive_event_id'), 'registration_archive', ['event_id'], unique=False)
+    op.create_index('ix_registration_archive_user_id_event_id', 'registration_archive', ['user_id', 'event_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_registration_archive_user_id_event_id', table_name='registration_archive')
+    op.drop_index(op.f('ix_registration_archive_event_id'), table_name='registration_archive')
+    op.drop_table('registration_archive')
+    op.drop_index(op.f('ix_session_archive_event_id'), table_name='session_archive')
+    op.drop_table('session_archive')
+    op.drop_index('ix_event_archive_organizer_id_event_date', table_name='event_archive')
+    op.drop_table('event_archive')
@@ -0,0 +1,31 @@
+"""Add event status/date index
+
+Revision ID: c2f5a8d1e6b4
+Revises: 7e3a9c41d5f2
+Create Date: 2026-10-19 17:12:08.331540
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f5a8d1e6b4'
+down_revision: Union[str, None] = '7e3a9c41d5f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_event_status_event_date', 'event', ['status', 'event_date'], unique=False,
+                        postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_event_status_event_date', table_name='event', postgresql_concurrently=True)
@@ -0,0 +1,46 @@
+"""Create session registration
+
+Revision ID: c6d2f8a4b173
+Revises: b4f1a7d3c985
+Create Date: 2026-10-19 23:41:27.518306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6d2f8a4b173'
+down_revision: Union[str, None] = 'b4f1a7d3c985'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('session', sa.Column('seats_taken', sa.Integer(), server_default='0', nullable=False))
+    op.create_check_constraint('ck_session_seats_taken', 'session', 'seats_taken >= 0 AND seats_taken <= capacity')
+    op.add_column('session_archive', sa.Column('seats_taken', sa.Integer(), server_default='0', nullable=False))
+    op.create_table('session_registration',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('session_id', sa.Integer(), nullable=False),
+    sa.Column('registration_date', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['session_id'], ['session.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_session_registration_session_id'), 'session_registration', ['session_id'], unique=False)
+    op.create_index('uq_session_registration_user_session', 'session_registration', ['user_id', 'session_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_session_registration_user_session', table_name='session_registration')
+    op.drop_index(op.f('ix_session_registration_session_id'), table_name='session_registration')
+    op.drop_table('session_registration')
+    op.drop_column('session_archive', 'seats_taken')
+    op.drop_constraint('ck_session_seats_taken', 'session', type_='check')
+    op.drop_column('session', 'seats_taken')
@@ -0,0 +1,44 @@
+"""Create event popularity
+
+Revision ID: e3a9d5b7c210
+Revises: c6d2f8a4b173
+Create Date: 2026-10-20 00:18:52.304117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a9d5b7c210'
+down_revision: Union[str, None] = 'c6d2f8a4b173'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('event_popularity',
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['event_id'], ['event.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('event_id')
+    )
+    op.create_index(op.f('ix_event_popularity_score'), 'event_popularity', ['score'], unique=False)
+
+    if op.get_bind().dialect.name == "postgresql":
+        # Puntuación inicial a partir de las inscripciones existentes, con el mismo EPOCH y
+        # vida media (3 días = 259200 s) que app/use_cases/event/popularity.py
+        op.execute(
+            "INSERT INTO event_popularity (event_id, score) "
+            "SELECT event_id, SUM(POWER(2, EXTRACT(EPOCH FROM registration_date - TIMESTAMP '2026-01-01') / 259200.0)) "
+            "FROM registration GROUP BY event_id"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_event_popularity_score'), table_name='event_popularity')
+    op.drop_table('event_popularity')
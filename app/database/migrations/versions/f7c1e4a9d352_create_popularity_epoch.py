@@ -0,0 +1,35 @@
+"""Create popularity epoch
+
+Revision ID: f7c1e4a9d352
+Revises: e3a9d5b7c210
+Create Date: 2026-10-20 10:12:36.184529
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c1e4a9d352'
+down_revision: Union[str, None] = 'e3a9d5b7c210'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    popularity_epoch = op.create_table('popularity_epoch',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('epoch', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # La época con la que se calcularon las puntuaciones existentes (migración e3a9d5b7c210)
+    op.bulk_insert(popularity_epoch, [{'id': 1, 'epoch': datetime(2026, 1, 1)}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('popularity_epoch')
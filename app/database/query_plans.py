@@ -0,0 +1,151 @@
+# app/database/query_plans.py
+"""
+Comprobaciones basadas en EXPLAIN de que el planificador usa los índices
+pensados para las consultas calientes de los repositorios.
+
+Las consultas se capturan ejecutando los métodos reales de los repositorios,
+así que la comprobación sigue a la consulta si el repositorio cambia.
+
+Uso:
+    python -m app.database.query_plans --disable-seqscan
+"""
+import argparse
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlmodel import Session, create_engine
+
+from app.repositories.event_repository import EventRepository
+from app.repositories.registration import RegistrationRepository
+from app.repositories.session_repository import SessionRepository
+
+
+@dataclass
+class AccessPathCheck:
+    name: str
+    index_name: str
+    run: Callable[[Session], Any]
+    dialects: Optional[Sequence[str]] = None
+    # Otros índices igualmente válidos para la consulta
+    alternatives: Sequence[str] = ()
+
+
+@dataclass
+class PlanResult:
+    name: str
+    index_name: str
+    plan: str
+    uses_index: bool
+
+
+# Los índices parciales solo se aplican en SQLite si el filtro es un literal, y los
+# repositorios usan parámetros, por eso el catálogo publicado se comprueba solo en PostgreSQL.
+ACCESS_PATHS: List[AccessPathCheck] = [
+    AccessPathCheck("events_by_organizer", "ix_event_organizer_id",
+                    lambda s: EventRepository(s).get_all_events_by_user(current_user_id=1)),
+    AccessPathCheck("published_catalog", "ix_event_published",
+                    lambda s: EventRepository(s).get_all_events(), dialects=("postgresql",)),
+    AccessPathCheck("published_by_date_range", "ix_event_status_event_date",
+                    lambda s: EventRepository(s).get_all_events(date_from=date(2030, 1, 1), date_to=date(2030, 1, 31)),
+                    alternatives=("ix_event_published",)),
+    AccessPathCheck("calendar_month", "ix_event_status_event_date",
+                    lambda s: EventRepository(s).count_published_events_by_day(date(2030, 1, 1), date(2030, 2, 1))),
+    AccessPathCheck("trending_events", "ix_event_popularity_score",
+                    lambda s: EventRepository(s).get_trending_events(limit=50, min_score=1.0), dialects=("postgresql",)),
+    AccessPathCheck("event_changes_since", "event_change_pkey",
+                    lambda s: EventRepository(s).get_changes(since=1), dialects=("postgresql",)),
+    AccessPathCheck("sessions_by_event", "ix_session_event_id_start_time",
+                    lambda s: SessionRepository(s).get_sessions_by_event_id(event_id=1)),
+    AccessPathCheck("speaker_schedule_overlap", "ix_session_speaker_id_start_time",
+                    lambda s: SessionRepository(s).find_overlapping_sessions(
+                        datetime(2030, 1, 1, 10), datetime(2030, 1, 1, 11), speaker_id=1),
+                    alternatives=("ex_session_speaker_overlap",)),
+    AccessPathCheck("registration_lookup", "uq_registration_user_event",
+                    lambda s: RegistrationRepository(s).get_registration(user_id=1, event_id=1)),
+    AccessPathCheck("registrations_by_user", "uq_registration_user_event",
+                    lambda s: RegistrationRepository(s).get_registrations_by_user(user_id=1)),
+    AccessPathCheck("registrations_count_by_event", "ix_registration_event_id",
+                    lambda s: RegistrationRepository(s).get_event_current_registrations_count(event_id=1)),
+]
+
+
+@contextmanager
+def capture_statements(bind: Engine) -> Iterator[List[Tuple[str, Any]]]:
+    """
+    Registra las sentencias SELECT (con sus parámetros) que se ejecutan sobre el motor.
+    """
+    captured: List[Tuple[str, Any]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(bind, "before_cursor_execute", _capture)
+    try:
+        yield captured
+    finally:
+        event.remove(bind, "before_cursor_execute", _capture)
+
+
+def explain(connection: Connection, statement: str, parameters: Any) -> str:
+    """
+    Devuelve el plan de ejecución de una sentencia ya compilada para el dialecto.
+    """
+    if connection.dialect.name == "sqlite":
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        return "\n".join(str(row[-1]) for row in rows)
+    rows = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).all()
+    return "\n".join(str(row[0]) for row in rows)
+
+
+def check_access_paths(session: Session, checks: Sequence[AccessPathCheck] = ACCESS_PATHS) -> List[PlanResult]:
+    """
+    Ejecuta cada consulta de los repositorios, obtiene su plan y verifica el índice esperado.
+    """
+    bind = session.get_bind()
+    dialect = bind.dialect.name
+    results: List[PlanResult] = []
+    for check in checks:
+        if check.dialects and dialect not in check.dialects:
+            continue
+        with capture_statements(bind) as captured:
+            check.run(session)
+        plans = [explain(session.connection(), statement, parameters) for statement, parameters in captured]
+        plan = "\n".join(plans)
+        uses_index = any(name in plan for name in (check.index_name, *check.alternatives))
+        results.append(PlanResult(check.name, check.index_name, plan, uses_index))
+    session.rollback()
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Verifica con EXPLAIN que las consultas usan sus índices")
+    parser.add_argument("--database-url", help="Por defecto, la base de datos configurada en .env")
+    parser.add_argument("--disable-seqscan", action="store_true",
+                        help="PostgreSQL: desactiva seq scan para comprobar que el índice es utilizable en tablas pequeñas")
+    args = parser.parse_args(argv)
+    if args.database_url:
+        database_url = args.database_url
+    else:
+        from app.database.connection import DATABASE_URL
+        database_url = DATABASE_URL
+
+    engine = create_engine(database_url)
+    failed = False
+    with Session(engine) as session:
+        if args.disable_seqscan and engine.dialect.name == "postgresql":
+            session.connection().exec_driver_sql("SET enable_seqscan = off")
+        for result in check_access_paths(session):
+            failed = failed or not result.uses_index
+            print(f"[{'OK' if result.uses_index else 'FAIL'}] {result.name} -> {result.index_name}")
+            print("    " + result.plan.replace("\n", "\n    "))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+# app/database/synthetic_data.py
+"""
+Generador de datos sintéticos para pruebas de escala.
+
+Carga masivamente usuarios, eventos, sesiones y registros con distribuciones
+realistas: popularidad sesgada (Zipf) entre eventos y fechas pasadas y futuras.
+En PostgreSQL usa COPY; en otros motores, inserciones multi-fila por lotes.
+
+Uso:
+    python -m app.database.synthetic_data --users 100000 --events 20000 \\
+        --sessions 60000 --registrations 10000000
+"""
+import argparse
+import csv
+import io
+import random
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Table, func, insert, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlmodel import SQLModel, create_engine
+
+from app.core.security import get_password_hash
+from app.models.envent import Event, EventStatus
+from app.models.registration import Registration
+from app.models.session import Session
+from app.models.user import User
+
+DEFAULT_PASSWORD = "password123"
+
+
+@dataclass
+class GenerationConfig:
+    users: int = 1000
+    events: int = 200
+    sessions: int = 600
+    registrations: int = 10000
+    batch_size: int = 50000
+    zipf_exponent: float = 1.1
+    days_back: int = 365
+    days_forward: int = 365
+    password: str = DEFAULT_PASSWORD
+    seed: int = 42
+
+
+def _zipf_weights(size: int, exponent: float, rng: random.Random) -> List[float]:
+    """Pesos de popularidad sesgados: unos pocos eventos concentran la mayoría de registros."""
+    weights = [1.0 / (rank ** exponent) for rank in range(1, size + 1)]
+    rng.shuffle(weights)
+    return weights
+
+
+def _next_id(connection: Connection, table: Table) -> int:
+    return (connection.execute(select(func.max(table.c.id))).scalar() or 0) + 1
+
+
+def _chunks(rows: Iterable[Tuple], size: int) -> Iterator[List[Tuple]]:
+    batch: List[Tuple] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _copy_rows(connection: Connection, table: Table, columns: Sequence[str], rows: List[Tuple]) -> None:
+    """Carga un lote con COPY ... FROM STDIN (solo PostgreSQL)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(["" if value is None else value for value in row])
+    buffer.seek(0)
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert(f'COPY "{table.name}" ({column_list}) FROM STDIN WITH (FORMAT csv)', buffer)
+    finally:
+        cursor.close()
+
+
+def _load(connection: Connection, table: Table, columns: Sequence[str], rows: Iterable[Tuple], batch_size: int) -> int:
+    """Inserta las filas por lotes usando COPY en PostgreSQL o inserciones multi-fila en el resto."""
+    total = 0
+    use_copy = connection.dialect.name == "postgresql"
+    for batch in _chunks(rows, batch_size):
+        if use_copy:
+            _copy_rows(connection, table, columns, batch)
+        else:
+            connection.execute(insert(table), [dict(zip(columns, row)) for row in batch])
+        total += len(batch)
+    return total
+
+
+def _reset_sequence(connection: Connection, table: Table) -> None:
+    """Tras cargar ids explícitos, alinea la secuencia de PostgreSQL con el máximo id."""
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(text(
+        f"SELECT setval(pg_get_serial_sequence('\"{table.name}\"', 'id'), "
+        f"COALESCE((SELECT MAX(id) FROM \"{table.name}\"), 1))"
+    ))
+
+
+def _event_status(event_date: date, today: date, rng: random.Random) -> EventStatus:
+    roll = rng.random()
+    if event_date < today:
+        return EventStatus.CANCELLED if roll < 0.05 else EventStatus.COMPLETED
+    if roll < 0.05:
+        return EventStatus.CANCELLED
+    if roll < 0.20:
+        return EventStatus.DRAFT
+    return EventStatus.PUBLISHED
+
+
+def generate(engine: Engine, config: GenerationConfig, log=print) -> Dict[str, int]:
+    """
+    Genera y carga el conjunto de datos. Devuelve cuántas filas se insertaron por tabla.
+    """
+    rng = random.Random(config.seed)
+    today = date.today()
+    now = datetime.utcnow()
+    postgres = engine.dialect.name == "postgresql"
+    hashed_password = get_password_hash(config.password)  # Un solo hash para todos los usuarios
+    user_table, event_table = User.__table__, Event.__table__
+    session_table, registration_table = Session.__table__, Registration.__table__
+    counts: Dict[str, int] = {}
+
+    with engine.begin() as connection:
+        started = time.perf_counter()
+        first_user = _next_id(connection, user_table)
+        user_ids = range(first_user, first_user + config.users)
+        counts["users"] = _load(
+            connection, user_table,
+            ["id", "email", "hashed_password", "is_active", "is_superuser", "created_at", "updated_at"],
+            ((uid, f"user{uid}@example.com", hashed_password, True, False, now, now) for uid in user_ids),
+            config.batch_size,
+        )
+        log(f"users: {counts['users']} en {time.perf_counter() - started:.1f}s")
+        if not user_ids and config.events:
+            raise ValueError("Se necesitan usuarios para generar eventos")
+
+        started = time.perf_counter()
+        first_event = _next_id(connection, event_table)
+        events: List[Tuple[int, date, int]] = []
+
+        def event_rows() -> Iterator[Tuple]:
+            for event_id in range(first_event, first_event + config.events):
+                event_date = today + timedelta(days=rng.randint(-config.days_back, config.days_forward))
+                capacity = max(10, min(50000, int(rng.lognormvariate(5, 1))))
+                status = _event_status(event_date, today, rng)
+                events.append((event_id, event_date, capacity))
+                yield (
+                    event_id, f"Evento {event_id}", f"Descripción del evento {event_id}. " * rng.randint(1, 20),
+                    event_date, f"Sede {rng.randint(1, 500)}", capacity,
+                    status.name if postgres else status, None, rng.choice(user_ids), now, now,
+                )
+
+        counts["events"] = _load(
+            connection, event_table,
+            ["id", "name", "description", "event_date", "location", "capacity", "status",
+             "image_url", "organizer_id", "created_at", "updated_at"],
+            event_rows(), config.batch_size,
+        )
+        log(f"events: {counts['events']} en {time.perf_counter() - started:.1f}s")
+
+        started = time.perf_counter()
+        first_session = _next_id(connection, session_table)
+
+        def session_rows() -> Iterator[Tuple]:
+            # Las restricciones EXCLUDE prohíben solapes en un mismo evento y de un mismo ponente:
+            # las sesiones de cada evento van seguidas desde las 8:00 y, si el ponente está ocupado,
+            # la sesión se retrasa hasta que quede libre.
+            next_start = {event_id: datetime.combine(event_date, datetime.min.time()) + timedelta(hours=8)
+                          for event_id, event_date, _ in events}
+            speaker_busy: Dict[int, List[Tuple[datetime, datetime]]] = {}
+            for offset in range(config.sessions):
+                event_id, event_date, capacity = rng.choice(events)
+                speaker_id = rng.choice(user_ids)
+                duration = timedelta(minutes=rng.choice([30, 45, 60, 90]))
+                start = next_start[event_id] + timedelta(minutes=rng.choice([0, 15, 30]))
+                busy = speaker_busy.setdefault(speaker_id, [])
+                conflict = next((end for begin, end in busy if begin < start + duration and end > start), None)
+                while conflict is not None:
+                    start = conflict
+                    conflict = next((end for begin, end in busy if begin < start + duration and end > start), None)
+                busy.append((start, start + duration))
+                next_start[event_id] = start + duration
+                yield (
+                    first_session + offset, f"Sesión {first_session + offset}", "Sesión generada",
+                    start, start + duration,
+                    max(1, capacity // rng.randint(2, 10)), event_id, speaker_id, now, now,
+                )
+
+        counts["sessions"] = _load(
+            connection, session_table,
+            ["id", "name", "description", "start_time", "end_time", "capacity",
+             "event_id", "speaker_id", "created_at", "updated_at"],
+            session_rows() if events else iter(()), config.batch_size,
+        )
+        log(f"sessions: {counts['sessions']} en {time.perf_counter() - started:.1f}s")
+
+        started = time.perf_counter()
+        first_registration = _next_id(connection, registration_table)
+        weights = _zipf_weights(len(events), config.zipf_exponent, rng)
+        total_weight = sum(weights) or 1.0
+
+        def registration_rows() -> Iterator[Tuple]:
+            # Se reparte por orden de popularidad: el excedente de los eventos que
+            # llenan su capacidad pasa proporcionalmente a los menos populares.
+            next_id = first_registration
+            remaining = config.registrations
+            remaining_weight = total_weight
+            for weight, (event_id, event_date, capacity) in sorted(zip(weights, events), reverse=True):
+                if remaining <= 0:
+                    break
+                size = min(round(remaining * weight / remaining_weight), capacity, len(user_ids), remaining)
+                remaining_weight -= weight
+                # Los registros ocurren en los 90 días previos al evento y nunca en el futuro
+                latest = min(datetime.combine(event_date, datetime.min.time()), now)
+                earliest = latest - timedelta(days=90)
+                window = int((latest - earliest).total_seconds())
+                for user_id in rng.sample(user_ids, size):
+                    registered_at = earliest + timedelta(seconds=rng.randrange(window))
+                    yield (next_id, user_id, event_id, registered_at)
+                    next_id += 1
+                remaining -= size
+
+        counts["registrations"] = _load(
+            connection, registration_table,
+            ["id", "user_id", "event_id", "registration_date"],
+            registration_rows(), config.batch_size,
+        )
+        log(f"registrations: {counts['registrations']} en {time.perf_counter() - started:.1f}s")
+
+        for table in (user_table, event_table, session_table, registration_table):
+            _reset_sequence(connection, table)
+
+    return counts
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Carga masiva de datos sintéticos")
+    parser.add_argument("--database-url", help="Por defecto, la base de datos configurada en .env")
+    parser.add_argument("--users", type=int, default=GenerationConfig.users)
+    parser.add_argument("--events", type=int, default=GenerationConfig.events)
+    parser.add_argument("--sessions", type=int, default=GenerationConfig.sessions)
+    parser.add_argument("--registrations", type=int, default=GenerationConfig.registrations)
+    parser.add_argument("--batch-size", type=int, default=GenerationConfig.batch_size)
+    parser.add_argument("--zipf-exponent", type=float, default=GenerationConfig.zipf_exponent,
+                        help="Sesgo de popularidad entre eventos (mayor = más concentrado)")
+    parser.add_argument("--days-back", type=int, default=GenerationConfig.days_back)
+    parser.add_argument("--days-forward", type=int, default=GenerationConfig.days_forward)
+    parser.add_argument("--password", default=DEFAULT_PASSWORD, help="Contraseña común de los usuarios generados")
+    parser.add_argument("--seed", type=int, default=GenerationConfig.seed)
+    parser.add_argument("--create-tables", action="store_true", help="Crea las tablas si no existen (sin Alembic)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.database_url:
+        database_url = args.database_url
+    else:
+        from app.database.connection import DATABASE_URL
+        database_url = DATABASE_URL
+    engine = create_engine(database_url)
+    if args.create_tables:
+        # Registra todos los modelos, también los que solo usan los workers (job_run)
+        import app.api.main  # noqa: F401
+        import app.workers.scheduler  # noqa: F401
+        SQLModel.metadata.create_all(engine)
+    config = GenerationConfig(
+        users=args.users,
+        events=args.events,
+        sessions=args.sessions,
+        registrations=args.registrations,
+        batch_size=args.batch_size,
+        zipf_exponent=args.zipf_exponent,
+        days_back=args.days_back,
+        days_forward=args.days_forward,
+        password=args.password,
+        seed=args.seed,
+    )
+    started = time.perf_counter()
+    counts = generate(engine, config)
+    print(f"Carga completa en {time.perf_counter() - started:.1f}s: {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# app/database/unit_of_work.py
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlmodel import Session
+
+_UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+@contextmanager
+def unit_of_work(session: Session) -> Iterator[Session]:
+    """
+    Agrupa varias escrituras de repositorios en una sola transacción.
+    Dentro del bloque los repositorios solo hacen flush; al salir se hace un único
+    commit, o rollback si hubo una excepción. Los bloques anidados se unen al exterior.
+    """
+    if session.info.get(_UNIT_OF_WORK_KEY):
+        yield session
+        return
+    session.info[_UNIT_OF_WORK_KEY] = True
+    try:
+        yield session
+        session.commit()
+    except BaseException:
+        session.rollback()
+        raise
+    finally:
+        session.info.pop(_UNIT_OF_WORK_KEY, None)
+
+
+def commit_or_flush(session: Session) -> None:
+    """
+    Confirma la escritura de un repositorio, o solo la envía (flush) si forma parte
+    de una unidad de trabajo. El flush ya obtiene los valores generados (RETURNING).
+    """
+    if session.info.get(_UNIT_OF_WORK_KEY):
+        session.flush()
+    else:
+        session.commit()
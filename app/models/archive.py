@@ -0,0 +1,65 @@
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+from app.models.envent import EventStatus
+
+
+class EventArchive(SQLModel, table=True):
+    """
+    Eventos completados o cancelados retirados de la tabla 'event'. Conservan su id original
+    y no tienen claves foráneas, así el histórico no bloquea el borrado de usuarios.
+    """
+    __tablename__ = "event_archive"
+    __table_args__ = (Index("ix_event_archive_organizer_id_event_date", "organizer_id", "event_date"),)
+
+    id: int = Field(primary_key=True)
+    name: str = Field(max_length=100)
+    description: Optional[str] = Field(default=None, max_length=1000)
+    event_date: date
+    location: str = Field(max_length=200)
+    capacity: int
+    status: EventStatus
+    image_url: Optional[str] = Field(default=None, max_length=500)
+    organizer_id: int
+    created_at: datetime
+    updated_at: datetime
+    archived_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+
+
+class SessionArchive(SQLModel, table=True):
+    __tablename__ = "session_archive"
+
+    id: int = Field(primary_key=True)
+    name: str = Field(max_length=100)
+    description: Optional[str] = Field(default=None, max_length=1000)
+    start_time: datetime
+    end_time: datetime
+    capacity: int
+    event_id: int = Field(index=True)
+    speaker_id: int
+    seats_taken: int = 0
+    created_at: datetime
+    updated_at: datetime
+
+
+class RegistrationArchive(SQLModel, table=True):
+    __tablename__ = "registration_archive"
+    __table_args__ = (Index("ix_registration_archive_user_id_event_id", "user_id", "event_id"),)
+
+    id: int = Field(primary_key=True)
+    user_id: int
+    event_id: int = Field(index=True)
+    registration_date: datetime
+
+
+class SessionRegistrationArchive(SQLModel, table=True):
+    __tablename__ = "session_registration_archive"
+    __table_args__ = (Index("ix_session_registration_archive_user_id_session_id", "user_id", "session_id"),)
+
+    id: int = Field(primary_key=True)
+    user_id: int
+    session_id: int = Field(index=True)
+    registration_date: datetime
@@ -5,6 +5,7 @@ from enum import Enum as PyEnum
 from app.models.registration import Registration
 from app.models.session import Session
 from app.models.user import User
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -26,14 +27,30 @@ class EventBase(SQLModel):
     status: EventStatus = Field(default=EventStatus.DRAFT)
     image_url: Optional[str] = Field(default=None, max_length=500)
 
-    organizer_id: int = Field(foreign_key="user.id")
+    organizer_id: int = Field(foreign_key="user.id", index=True)
 
 
 class Event(EventBase, table=True):
     """Modelo de la tabla 'events'."""
+    __table_args__ = (
+        # Catálogo público: solo eventos publicados, paginados por id
+        Index(
+            "ix_event_published",
+            "id",
+            postgresql_where=text("status = 'PUBLISHED'"),
+            sqlite_where=text("status = 'PUBLISHED'"),
+        ),
+        # Filtros por rango de fechas y calendario mensual
+        Index("ix_event_status_event_date", "status", "event_date"),
+    )
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False) # Para PostgreSQL, considera `server_default=text("now()")` o similar
     updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": datetime.utcnow}, nullable=False)
     organizer: "User" = Relationship(back_populates="events")
-    sessions: List["Session"] = Relationship(back_populates="event")
-    registrations: List["Registration"] = Relationship(back_populates="event")
\ No newline at end of file
+    # passive_deletes: el ORM no carga los hijos al borrar, lo hace el ON DELETE CASCADE
+    sessions: List["Session"] = Relationship(
+        back_populates="event", sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True}
+    )
+    registrations: List["Registration"] = Relationship(
+        back_populates="event", sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True}
+    )
\ No newline at end of file
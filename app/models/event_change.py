@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, Column, Integer
+from sqlmodel import Field, SQLModel
+
+
+class EventChange(SQLModel, table=True):
+    """
+    Último cambio de cada evento, numerado con una secuencia creciente que sirve de cursor
+    para la sincronización incremental. Sin clave foránea: los eventos eliminados se
+    conservan como marcas de borrado.
+    """
+    __tablename__ = "event_change"
+
+    # En SQLite solo INTEGER PRIMARY KEY es autoincremental
+    seq: Optional[int] = Field(
+        default=None,
+        sa_column=Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True),
+    )
+    event_id: int = Field(index=True)
+    deleted: bool = Field(default=False)
+    changed_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
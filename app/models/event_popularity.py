@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Float, ForeignKey, Integer
+from sqlmodel import Field, SQLModel
+
+# Época inicial de las puntuaciones, mientras la tarea rebase_popularity no la haya adelantado
+DEFAULT_POPULARITY_EPOCH = datetime(2026, 1, 1)
+POPULARITY_EPOCH_ID = 1
+
+
+class EventPopularity(SQLModel, table=True):
+    """
+    Puntuación de popularidad con decaimiento exponencial de cada evento, mantenida de forma
+    incremental con cada inscripción (ver app/use_cases/event/popularity.py).
+    """
+    __tablename__ = "event_popularity"
+
+    # Al eliminar un evento, la base de datos elimina su puntuación
+    event_id: int = Field(sa_column=Column(Integer, ForeignKey("event.id", ondelete="CASCADE"), primary_key=True))
+    # El ranking se lee en orden descendente de este índice
+    score: float = Field(default=0, sa_column=Column(Float, nullable=False, index=True))
+
+
+class PopularityEpoch(SQLModel, table=True):
+    """
+    Época respecto a la que están expresadas todas las puntuaciones (una sola fila). Las
+    inscripciones la leen con un bloqueo compartido y el rebase la cambia con uno exclusivo.
+    """
+    __tablename__ = "popularity_epoch"
+
+    id: int = Field(default=POPULARITY_EPOCH_ID, primary_key=True)
+    epoch: datetime
@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import JSON, Column, LargeBinary
+from sqlmodel import Field, SQLModel
+
+
+class IdempotencyKey(SQLModel, table=True):
+    """
+    Primera respuesta a una petición con cabecera Idempotency-Key, por usuario y clave.
+    Mientras la petición original está en curso, `status_code` es nulo.
+    """
+    __tablename__ = "idempotency_key"
+
+    user_id: int = Field(primary_key=True)
+    key: str = Field(primary_key=True, max_length=255)
+    # Huella (método, ruta y cuerpo) para rechazar la misma clave con otra petición
+    fingerprint: str = Field(max_length=64)
+    status_code: Optional[int] = Field(default=None)
+    headers: List[List[str]] = Field(default_factory=list, sa_column=Column(JSON, nullable=False))
+    body: Optional[bytes] = Field(default=None, sa_column=Column(LargeBinary, nullable=True))
+    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # En curso: plazo de la reserva; completada: fin del periodo de reutilización
+    expires_at: datetime = Field(index=True)
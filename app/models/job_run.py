@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import UniqueConstraint
+from sqlmodel import Field, SQLModel
+
+
+class JobRun(SQLModel, table=True):
+    """
+    Ejecución de una tarea programada. La restricción única (job_name, slot) hace que solo
+    una réplica ejecute cada tarea en cada intervalo.
+    """
+    __tablename__ = "job_run"
+    __table_args__ = (UniqueConstraint("job_name", "slot", name="uq_job_run_job_name_slot"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    job_name: str = Field(max_length=100)
+    # Número de intervalo desde la época: int(timestamp // intervalo)
+    slot: int
+    started_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    finished_at: Optional[datetime] = Field(default=None)
+    rows_affected: Optional[int] = Field(default=None)
+    error: Optional[str] = Field(default=None, max_length=1000)
@@ -0,0 +1,41 @@
+from datetime import datetime
+from enum import Enum as PyEnum
+from typing import Any, Dict, Optional
+
+from sqlalchemy import JSON, Column, Index, text
+from sqlmodel import Field, SQLModel
+
+
+class OutboxStatus(str, PyEnum):
+    """Estados de un mensaje del outbox."""
+    PENDING = "pending"
+    PROCESSED = "processed"
+    FAILED = "failed"
+
+
+class OutboxMessage(SQLModel, table=True):
+    """
+    Efecto secundario pendiente, escrito en la misma transacción que el cambio que lo origina
+    y ejecutado después por el worker del outbox.
+    """
+    __tablename__ = "outbox_message"
+    __table_args__ = (
+        # Cola de pendientes en orden de llegada; los procesados no ocupan el índice
+        Index(
+            "ix_outbox_message_pending",
+            "id",
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    topic: str = Field(max_length=100)
+    payload: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
+    status: OutboxStatus = Field(default=OutboxStatus.PENDING)
+    attempts: int = Field(default=0)
+    # No se intenta antes de esta fecha (reintentos con backoff y mensajes reclamados)
+    available_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    last_error: Optional[str] = Field(default=None, max_length=1000)
+    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    processed_at: Optional[datetime] = Field(default=None)
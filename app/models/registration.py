@@ -1,13 +1,18 @@
 from asyncio import Event
 from datetime import datetime
 from typing import Optional
+from sqlalchemy import Column, ForeignKey, Index, Integer
 from sqlmodel import Field, Relationship, SQLModel
 
 
 class Registration(SQLModel, table=True):
+    # Un usuario se registra una sola vez por evento; el índice también cubre las búsquedas por user_id
+    __table_args__ = (Index("uq_registration_user_event", "user_id", "event_id", unique=True),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="user.id", index=True)
-    event_id: int = Field(foreign_key="event.id", index=True)
+    user_id: int = Field(foreign_key="user.id")
+    # Al eliminar un evento, la base de datos elimina sus inscripciones
+    event_id: int = Field(sa_column=Column(Integer, ForeignKey("event.id", ondelete="CASCADE"), nullable=False, index=True))
     registration_date: datetime = Field(default_factory=datetime.utcnow, nullable=False)
 
     user: "User" = Relationship(back_populates="registrations")
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class RevokedToken(SQLModel, table=True):
+    """
+    Refresh tokens revocados (rotados o cerrados con /logout) hasta su expiración.
+    Es la fuente compartida entre réplicas de la lista de revocación en memoria.
+    """
+    __tablename__ = "revoked_token"
+
+    jti: str = Field(primary_key=True, max_length=64)
+    user_id: int = Field(index=True)
+    expires_at: datetime
+    # Las réplicas leen de forma incremental por fecha de revocación
+    revoked_at: datetime = Field(default_factory=datetime.utcnow, nullable=False, index=True)
@@ -3,6 +3,7 @@ from asyncio import Event
 from datetime import datetime
 from typing import Optional
 #from app.models.user import User
+from sqlalchemy import CheckConstraint, Column, ForeignKey, Index, Integer
 from sqlmodel import Field, Relationship, SQLModel
 
 # from app.models.event import Event # Asegúrate de importar Event
@@ -20,7 +21,19 @@ class SessionBase(SQLModel):
 
 
 class Session(SessionBase, table=True):
+    # En PostgreSQL, además, restricciones EXCLUDE (btree_gist) impiden solapamientos
+    # por ponente y por evento; se crean en la migración porque SQLite no las soporta.
+    __table_args__ = (
+        Index("ix_session_event_id_start_time", "event_id", "start_time"),
+        Index("ix_session_speaker_id_start_time", "speaker_id", "start_time"),
+        CheckConstraint("seats_taken >= 0 AND seats_taken <= capacity", name="ck_session_seats_taken"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
+    # Al eliminar un evento, la base de datos elimina sus sesiones
+    event_id: int = Field(sa_column=Column(Integer, ForeignKey("event.id", ondelete="CASCADE"), nullable=False))
+    # Plazas reservadas; solo se modifica con UPDATE condicionales (SessionRegistrationRepository)
+    seats_taken: int = Field(default=0, sa_column_kwargs={"server_default": "0"}, nullable=False)
     created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
     updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": datetime.utcnow}, nullable=False)
 
@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Column, ForeignKey, Index, Integer
+from sqlmodel import Field, SQLModel
+
+
+class SessionRegistration(SQLModel, table=True):
+    """
+    Plaza reservada por un usuario en una sesión. Se crea en la misma transacción que
+    incrementa session.seats_taken, que es lo que limita el aforo.
+    """
+    __tablename__ = "session_registration"
+    # Una reserva por usuario y sesión; el índice también cubre las búsquedas por user_id
+    __table_args__ = (Index("uq_session_registration_user_session", "user_id", "session_id", unique=True),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="user.id")
+    # Al eliminar una sesión (o su evento), la base de datos elimina sus reservas
+    session_id: int = Field(sa_column=Column(Integer, ForeignKey("session.id", ondelete="CASCADE"), nullable=False, index=True))
+    registration_date: datetime = Field(default_factory=datetime.utcnow, nullable=False)
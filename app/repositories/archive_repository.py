@@ -0,0 +1,76 @@
+from datetime import date, datetime
+from typing import List, Sequence, Tuple
+from sqlalchemy import Table, delete, insert, literal
+from sqlmodel import Session, select
+from app.database.unit_of_work import commit_or_flush
+from app.models.archive import EventArchive, RegistrationArchive, SessionArchive, SessionRegistrationArchive
+from app.models.envent import Event, EventStatus
+from app.models.registration import Registration
+from app.models.session import Session as EventSession
+from app.models.session_registration import SessionRegistration
+
+ARCHIVABLE_STATUSES = (EventStatus.COMPLETED, EventStatus.CANCELLED)
+
+
+class ArchiveRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def find_archivable_events(self, before: date, limit: int) -> List[Tuple[int, int]]:
+        """
+        (id, organizer_id) de eventos completados o cancelados anteriores a `before`,
+        por el índice (status, event_date).
+        """
+        statement = (
+            select(Event.id, Event.organizer_id)
+            .where(Event.status.in_(ARCHIVABLE_STATUSES), Event.event_date < before)
+            .order_by(Event.event_date, Event.id)
+            .limit(limit)
+        )
+        return self.session.exec(statement).all()
+
+    def archive_events(self, event_ids: Sequence[int]) -> None:
+        """
+        Copia los eventos con sus sesiones, inscripciones y reservas de sesiones a las tablas de archivo y los elimina
+        de las tablas activas, con sentencias por conjunto y en una sola transacción.
+        """
+        now = datetime.utcnow()
+        self._copy(Event.__table__, EventArchive.__table__, Event.id.in_(event_ids), archived_at=now)
+        self._copy(EventSession.__table__, SessionArchive.__table__, EventSession.event_id.in_(event_ids))
+        self._copy(Registration.__table__, RegistrationArchive.__table__, Registration.event_id.in_(event_ids))
+        self._copy(
+            SessionRegistration.__table__, SessionRegistrationArchive.__table__,
+            SessionRegistration.session_id.in_(select(EventSession.id).where(EventSession.event_id.in_(event_ids))),
+        )
+        # Sesiones, inscripciones y reservas se eliminan por ON DELETE CASCADE
+        self.session.execute(delete(Event).where(Event.id.in_(event_ids)))
+        commit_or_flush(self.session)
+
+    def get_archived_events_by_organizer(self, organizer_id: int, skip: int = 0, limit: int = 100) -> List[EventArchive]:
+        statement = (
+            select(EventArchive)
+            .where(EventArchive.organizer_id == organizer_id)
+            .order_by(EventArchive.event_date.desc(), EventArchive.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return self.session.exec(statement).all()
+
+    def get_archived_registrations_by_user(self, user_id: int, skip: int = 0, limit: int = 100) -> List[Tuple[RegistrationArchive, EventArchive]]:
+        statement = (
+            select(RegistrationArchive, EventArchive)
+            .join(EventArchive, EventArchive.id == RegistrationArchive.event_id)
+            .where(RegistrationArchive.user_id == user_id)
+            .order_by(EventArchive.event_date.desc(), EventArchive.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return self.session.exec(statement).all()
+
+    def _copy(self, source: Table, target: Table, where, **extra) -> None:
+        # INSERT ... SELECT con las columnas de la tabla activa más las propias del archivo
+        columns = [column.name for column in source.columns]
+        values = [source.c[name] for name in columns] + [literal(value) for value in extra.values()]
+        self.session.execute(
+            insert(target).from_select(columns + list(extra), select(*values).where(where))
+        )
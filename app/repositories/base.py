@@ -1,9 +1,13 @@
 # app/repositories/base.py
 from abc import ABC, abstractmethod
-from typing import Generic, List, Optional, TypeVar, Type, Dict, Any
+from typing import Generic, Iterable, Iterator, List, Optional, Sequence, TypeVar, Type, Dict, Any
 
+from sqlalchemy import delete, insert, inspect, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlmodel import Session, SQLModel, select
 
+from app.database.unit_of_work import commit_or_flush
+
 # Definimos un TypeVar para los modelos de SQLModel
 ModelType = TypeVar("ModelType", bound=SQLModel)
 
@@ -41,11 +45,36 @@ class IBaseRepository(ABC, Generic[ModelType]):
         """Elimina un objeto."""
         pass
 
+    @abstractmethod
+    def create_many(self, objs_in: Sequence[ModelType]) -> List[ModelType]:
+        """Crea varios objetos en lote."""
+        pass
+
+    @abstractmethod
+    def update_many(self, values_by_id: Dict[Any, Dict[str, Any]]) -> List[ModelType]:
+        """Actualiza varios objetos a partir de un mapa id -> campos."""
+        pass
+
+    @abstractmethod
+    def delete_many(self, ids: Iterable[Any]) -> List[ModelType]:
+        """Elimina varios objetos por ID y devuelve los eliminados."""
+        pass
+
+    @abstractmethod
+    def upsert(self, objs_in: Sequence[ModelType], index_elements: Optional[Sequence[str]] = None,
+               update_fields: Optional[Sequence[str]] = None) -> List[ModelType]:
+        """Inserta o actualiza varios objetos según una clave única."""
+        pass
+
 
 class SQLModelRepository(IBaseRepository[ModelType]):
     """
     Implementación concreta de un repositorio base usando SQLModel.
+    Las operaciones en lote usan sentencias de varias filas (con RETURNING) en tandas de
+    `batch_size` y confirman una sola vez al final.
     """
+    batch_size: int = 1000
+
     def __init__(self, model: Type[ModelType], session: Session):
         self.model = model
         self.session = session
@@ -63,8 +92,7 @@ class SQLModelRepository(IBaseRepository[ModelType]):
 
     def create(self, obj_in: ModelType) -> ModelType:
         self.session.add(obj_in)
-        self.session.commit()
-        self.session.refresh(obj_in)
+        commit_or_flush(self.session)
         return obj_in
 
     def update(self, db_obj: ModelType, obj_in: Dict[str, Any]) -> ModelType:
@@ -73,10 +101,93 @@ class SQLModelRepository(IBaseRepository[ModelType]):
             if hasattr(db_obj, key):
                 setattr(db_obj, key, value)
         self.session.add(db_obj)
-        self.session.commit()
-        self.session.refresh(db_obj)
+        commit_or_flush(self.session)
         return db_obj
 
     def delete(self, db_obj: ModelType) -> None:
         self.session.delete(db_obj)
-        self.session.commit()
\ No newline at end of file
+        commit_or_flush(self.session)
+
+    def create_many(self, objs_in: Sequence[ModelType]) -> List[ModelType]:
+        rows = [self._row(obj) for obj in objs_in]
+        created: List[ModelType] = []
+        for batch in self._batches(rows):
+            statement = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+            created.extend(self.session.scalars(statement, batch).all())
+        commit_or_flush(self.session)
+        return created
+
+    def update_many(self, values_by_id: Dict[Any, Dict[str, Any]]) -> List[ModelType]:
+        # Como en update(), se ignoran los campos que no son columnas del modelo
+        columns = set(self._columns())
+        pk = self._primary_key().key
+        rows = [
+            {pk: id, **{key: value for key, value in values.items() if key in columns and key != pk}}
+            for id, values in values_by_id.items()
+        ]
+        for batch in self._batches(rows):
+            # UPDATE ... WHERE id = :id ejecutado como executemany, agrupado por conjunto de columnas
+            self.session.execute(update(self.model), batch)
+        commit_or_flush(self.session)
+        return self._get_many(list(values_by_id))
+
+    def delete_many(self, ids: Iterable[Any]) -> List[ModelType]:
+        pk = self._primary_key()
+        deleted: List[ModelType] = []
+        for batch in self._batches(list(ids)):
+            statement = delete(self.model).where(pk.in_(batch)).returning(self.model)
+            deleted.extend(self.session.scalars(statement).all())
+        commit_or_flush(self.session)
+        return deleted
+
+    def upsert(self, objs_in: Sequence[ModelType], index_elements: Optional[Sequence[str]] = None,
+               update_fields: Optional[Sequence[str]] = None) -> List[ModelType]:
+        """
+        INSERT ... ON CONFLICT (index_elements) DO UPDATE. Por defecto el conflicto se
+        resuelve por la clave primaria y se actualizan todas las columnas enviadas.
+        """
+        dialects = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+        dialect = self.session.get_bind().dialect.name
+        if dialect not in dialects:
+            raise NotImplementedError(f"upsert is not supported for dialect {dialect}")
+        index_elements = list(index_elements or [self._primary_key().key])
+        rows = [self._row(obj) for obj in objs_in]
+        upserted: List[ModelType] = []
+        for batch in self._batches(rows):
+            fields = update_fields or [key for key in batch[0] if key not in index_elements]
+            statement = dialects[dialect](self.model)
+            statement = statement.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={field: getattr(statement.excluded, field) for field in fields},
+            ).returning(self.model, sort_by_parameter_order=True)
+            upserted.extend(self.session.scalars(
+                statement, batch, execution_options={"populate_existing": True}
+            ).all())
+        commit_or_flush(self.session)
+        return upserted
+
+    def _get_many(self, ids: List[Any]) -> List[ModelType]:
+        pk = self._primary_key()
+        found: List[ModelType] = []
+        for batch in self._batches(ids):
+            statement = select(self.model).where(pk.in_(batch)).execution_options(populate_existing=True)
+            found.extend(self.session.exec(statement).all())
+        return found
+
+    def _row(self, obj: ModelType) -> Dict[str, Any]:
+        # Valores de las columnas; la clave primaria se omite si aún no está asignada
+        pk = self._primary_key().key
+        row = {key: getattr(obj, key) for key in self._columns()}
+        if row.get(pk) is None:
+            row.pop(pk, None)
+        return row
+
+    def _columns(self) -> List[str]:
+        return [column.key for column in inspect(self.model).column_attrs]
+
+    def _primary_key(self):
+        return inspect(self.model).primary_key[0]
+
+    def _batches(self, items: List[Any]) -> Iterator[List[Any]]:
+        for start in range(0, len(items), self.batch_size):
+            yield items[start:start + self.batch_size]
@@ -1,46 +1,269 @@
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import delete, func, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlmodel import Session, select
+from app.database.unit_of_work import commit_or_flush
 from app.models.envent import Event
+from app.models.event_change import EventChange
+from app.models.event_popularity import DEFAULT_POPULARITY_EPOCH, POPULARITY_EPOCH_ID, EventPopularity, PopularityEpoch
+from app.models.registration import Registration
+from app.models.session import Session as EventSession
+from app.repositories.outbox_repository import OutboxRepository
 from app.schemas.event import EventCreate, EventUpdate, EventStatus
 
+# Clave del advisory lock que serializa la numeración de cambios de eventos en PostgreSQL
+EVENT_CHANGE_LOCK_KEY = 0x6576656E74
+
 class EventRepository:
     def __init__(self, session: Session):
         self.session = session
+        self.outbox = OutboxRepository(session)
 
     def create_event(self, event_in: EventCreate, organizer_id: int, image: str) -> Event:
         event = Event.model_validate(event_in, update={"organizer_id": organizer_id, "image_url": image})
         self.session.add(event)
-        self.session.commit()
-        self.session.refresh(event)
+        self.session.flush()
+        self.outbox.enqueue("event.created", {"event_id": event.id, "organizer_id": organizer_id, "image_url": image})
+        self._record_changes([event.id], new=True)
+        commit_or_flush(self.session)
         return event
 
+    def create_events(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Inserta un lote de eventos ya validados con un INSERT multi-fila y devuelve sus ids en orden.
+        """
+        statement = insert(Event).returning(Event.id, sort_by_parameter_order=True)
+        event_ids = self.session.scalars(statement, rows).all()
+        self.outbox.enqueue("events.imported", {"event_ids": list(event_ids), "organizer_id": rows[0]["organizer_id"]})
+        self._record_changes(event_ids, new=True)
+        commit_or_flush(self.session)
+        return event_ids
+
     def get_event_by_id(self, event_id: int) -> Optional[Event]:
         return self.session.get(Event, event_id)
 
-    def get_all_events_by_user(self, current_user_id: int, skip: int = 0, limit: int = 100) -> List[Event]:
-        statement = select(Event).where(Event.organizer_id == current_user_id).offset(skip).limit(limit)
+    def get_all_events_by_user(self, current_user_id: int, skip: int = 0, limit: int = 100, date_from: Optional[date] = None, date_to: Optional[date] = None, fields: Optional[Sequence[str]] = None) -> List[Event]:
+        statement = self._select(fields).where(Event.organizer_id == current_user_id)
+        statement = self._paginate(statement, skip, limit, date_from, date_to)
+        return self._fetch(statement, fields)
+
+    def search_events_by_name_by_user(self, name_query: str, current_user_id: int, skip: int = 0, limit: int = 100, date_from: Optional[date] = None, date_to: Optional[date] = None, fields: Optional[Sequence[str]] = None) -> List[Event]:
+        statement = self._select(fields).where(Event.name.ilike(f"%{name_query}%"), Event.organizer_id == current_user_id)
+        statement = self._paginate(statement, skip, limit, date_from, date_to)
+        return self._fetch(statement, fields)
+    
+    def get_all_events(self, skip: int = 0, limit: int = 100, date_from: Optional[date] = None, date_to: Optional[date] = None, fields: Optional[Sequence[str]] = None) -> List[Event]:
+        statement = self._select(fields).where(Event.status == EventStatus.PUBLISHED)
+        statement = self._paginate(statement, skip, limit, date_from, date_to)
+        return self._fetch(statement, fields)
+    
+    def search_events_by_name(self, name_query: str, skip: int = 0, limit: int = 100, date_from: Optional[date] = None, date_to: Optional[date] = None, fields: Optional[Sequence[str]] = None) -> List[Event]:
+        statement = self._select(fields).where(Event.name.ilike(f"%{name_query}%"), Event.status == EventStatus.PUBLISHED)
+        statement = self._paginate(statement, skip, limit, date_from, date_to)
+        return self._fetch(statement, fields)
+
+    def count_published_events_by_day(self, date_from: date, date_to: date) -> List[Tuple[date, int]]:
+        """
+        Número de eventos publicados por día en [date_from, date_to), con un solo GROUP BY
+        resuelto sobre el índice (status, event_date).
+        """
+        statement = (
+            select(Event.event_date, func.count())
+            .where(Event.status == EventStatus.PUBLISHED, Event.event_date >= date_from, Event.event_date < date_to)
+            .group_by(Event.event_date)
+            .order_by(Event.event_date)
+        )
         return self.session.exec(statement).all()
 
-    def search_events_by_name_by_user(self, name_query: str, current_user_id: int, skip: int = 0, limit: int = 100) -> List[Event]:
-        statement = select(Event).where(Event.name.ilike(f"%{name_query}%"), Event.organizer_id == current_user_id).offset(skip).limit(limit)
+    def get_changes(self, since: int, limit: int = 500) -> List[Tuple[EventChange, Optional[Event]]]:
+        """
+        Cambios posteriores al cursor, en orden, con el evento actual (None si se eliminó).
+        Sin cambios, la consulta es una sola búsqueda en la clave primaria de event_change.
+        """
+        statement = (
+            select(EventChange, Event)
+            .outerjoin(Event, Event.id == EventChange.event_id)
+            .where(EventChange.seq > since)
+            .order_by(EventChange.seq)
+            .limit(limit)
+        )
         return self.session.exec(statement).all()
-    
-    def get_all_events(self, skip: int = 0, limit: int = 100) -> List[Event]:
-        statement = select(Event).where(Event.status == EventStatus.PUBLISHED).offset(skip).limit(limit)
+
+    def add_popularity(self, event_id: int, weight: float) -> None:
+        """
+        Suma (o resta, al cancelar) el peso de una inscripción a la puntuación del evento con un
+        único upsert, sin leerla antes.
+        """
+        dialects = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+        dialect = self.session.get_bind().dialect.name
+        if dialect not in dialects:
+            raise NotImplementedError(f"add_popularity is not supported for dialect {dialect}")
+        statement = dialects[dialect](EventPopularity).values(event_id=event_id, score=weight)
+        statement = statement.on_conflict_do_update(
+            index_elements=["event_id"],
+            set_={"score": EventPopularity.score + statement.excluded.score},
+        )
+        self.session.execute(statement)
+        commit_or_flush(self.session)
+
+    def get_popularity_epoch(self, lock: Optional[str] = None) -> datetime:
+        """
+        Época de las puntuaciones de popularidad. `lock="share"` la bloquea hasta el fin de la
+        transacción para que un rebase no la cambie antes de sumar el peso de una inscripción;
+        `lock="update"` la bloquea en exclusiva para el propio rebase.
+        """
+        statement = select(PopularityEpoch.epoch).where(PopularityEpoch.id == POPULARITY_EPOCH_ID)
+        if lock is not None:
+            statement = statement.with_for_update(read=lock == "share")
+        return self.session.exec(statement).first() or DEFAULT_POPULARITY_EPOCH
+
+    def set_popularity_epoch(self, epoch: datetime) -> None:
+        dialects = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+        dialect = self.session.get_bind().dialect.name
+        if dialect not in dialects:
+            raise NotImplementedError(f"set_popularity_epoch is not supported for dialect {dialect}")
+        statement = dialects[dialect](PopularityEpoch).values(id=POPULARITY_EPOCH_ID, epoch=epoch)
+        self.session.execute(statement.on_conflict_do_update(index_elements=["id"], set_={"epoch": epoch}))
+        commit_or_flush(self.session)
+
+    def scale_popularity(self, factor: float) -> int:
+        result = self.session.execute(
+            update(EventPopularity)
+            .values(score=EventPopularity.score * factor)
+            .execution_options(synchronize_session=False)
+        )
+        commit_or_flush(self.session)
+        return result.rowcount
+
+    def get_trending_events(self, limit: int, min_score: float) -> List[Tuple[Event, float]]:
+        """
+        Eventos publicados con mayor puntuación guardada (al menos `min_score`), recorriendo el
+        índice de puntuaciones.
+        """
+        statement = (
+            select(Event, EventPopularity.score)
+            .join(EventPopularity, EventPopularity.event_id == Event.id)
+            .where(Event.status == EventStatus.PUBLISHED, EventPopularity.score >= min_score)
+            .order_by(EventPopularity.score.desc(), Event.id)
+            .limit(limit)
+        )
         return self.session.exec(statement).all()
-    
-    def search_events_by_name(self, name_query: str, skip: int = 0, limit: int = 100) -> List[Event]:
-        statement = select(Event).where(Event.name.ilike(f"%{name_query}%"), Event.status == EventStatus.PUBLISHED).offset(skip).limit(limit)
+
+    def get_organizer_stats(self, organizer_id: int) -> List[Tuple[Event, int, Optional[datetime], int]]:
+        """
+        Eventos del organizador con su número de inscripciones, la última inscripción y su número
+        de sesiones, en una sola consulta. Las subconsultas agregadas se limitan a los eventos
+        del organizador para recorrer solo sus filas por los índices de event_id.
+        """
+        own_events = select(Event.id).where(Event.organizer_id == organizer_id)
+        registrations = (
+            select(
+                Registration.event_id,
+                func.count().label("registrations"),
+                func.max(Registration.registration_date).label("last_registration_at"),
+            )
+            .where(Registration.event_id.in_(own_events))
+            .group_by(Registration.event_id)
+            .subquery()
+        )
+        sessions = (
+            select(EventSession.event_id, func.count().label("sessions"))
+            .where(EventSession.event_id.in_(own_events))
+            .group_by(EventSession.event_id)
+            .subquery()
+        )
+        statement = (
+            select(
+                Event,
+                func.coalesce(registrations.c.registrations, 0),
+                registrations.c.last_registration_at,
+                func.coalesce(sessions.c.sessions, 0),
+            )
+            .outerjoin(registrations, registrations.c.event_id == Event.id)
+            .outerjoin(sessions, sessions.c.event_id == Event.id)
+            .where(Event.organizer_id == organizer_id)
+            .order_by(Event.event_date, Event.id)
+        )
         return self.session.exec(statement).all()
 
     def update_event(self, event: Event, event_update: EventUpdate) -> Event:
         update_data = event_update.model_dump(exclude_unset=True)
         event.sqlmodel_update(update_data)
         self.session.add(event)
-        self.session.commit()
-        self.session.refresh(event)
+        self.outbox.enqueue("event.updated", {"event_id": event.id, "organizer_id": event.organizer_id, "fields": sorted(update_data)})
+        self._record_changes([event.id])
+        commit_or_flush(self.session)
         return event
 
+    def complete_past_events(self, today: date, limit: int) -> List[Tuple[int, int, date]]:
+        """
+        Marca como completados hasta `limit` eventos publicados anteriores a `today` con un único
+        UPDATE ... RETURNING (id, organizer_id, event_date). Los candidatos salen del índice
+        (status, event_date) con FOR UPDATE SKIP LOCKED: las filas que otra transacción está
+        modificando se saltan y se recogen en el siguiente lote.
+        """
+        candidates = (
+            select(Event.id)
+            .where(Event.status == EventStatus.PUBLISHED, Event.event_date < today)
+            .order_by(Event.event_date, Event.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            update(Event)
+            .where(Event.id.in_(candidates))
+            .values(status=EventStatus.COMPLETED, updated_at=datetime.utcnow())
+            .returning(Event.id, Event.organizer_id, Event.event_date)
+        )
+        rows = self.session.execute(statement, execution_options={"synchronize_session": False}).all()
+        event_ids = [event_id for event_id, _, _ in rows]
+        if event_ids:
+            self.outbox.enqueue("events.completed", {"event_ids": event_ids})
+            self._record_changes(event_ids)
+        commit_or_flush(self.session)
+        return rows
+
     def delete_event(self, event: Event):
-        self.session.delete(event)
-        self.session.commit()
\ No newline at end of file
+        self.outbox.enqueue("event.deleted", {"event_id": event.id, "organizer_id": event.organizer_id})
+        self._record_changes([event.id], deleted=True)
+        # Un único DELETE: sesiones e inscripciones se eliminan por ON DELETE CASCADE sin cargarlas
+        self.session.execute(delete(Event).where(Event.id == event.id))
+        commit_or_flush(self.session)
+
+    def _select(self, fields: Optional[Sequence[str]]):
+        # Con `fields` solo se leen esas columnas y no se construyen objetos del ORM
+        if fields is None:
+            return select(Event)
+        return select(*(getattr(Event, name) for name in fields))
+
+    def _fetch(self, statement, fields: Optional[Sequence[str]]) -> List[Any]:
+        if fields is None:
+            return self.session.exec(statement).all()
+        return [dict(row) for row in self.session.execute(statement).mappings()]
+
+    def _paginate(self, statement, skip: int, limit: int, date_from: Optional[date], date_to: Optional[date]):
+        # Con filtro de fechas se ordena por fecha (rango sobre el índice); sin él, por id
+        if date_from is None and date_to is None:
+            return statement.order_by(Event.id).offset(skip).limit(limit)
+        if date_from is not None:
+            statement = statement.where(Event.event_date >= date_from)
+        if date_to is not None:
+            statement = statement.where(Event.event_date <= date_to)
+        return statement.order_by(Event.event_date, Event.id).offset(skip).limit(limit)
+
+    def _record_changes(self, event_ids: Sequence[int], deleted: bool = False, new: bool = False):
+        """
+        Numera el cambio de cada evento y descarta su cambio anterior, de modo que la tabla
+        guarda un único cambio por evento.
+        """
+        if not event_ids:
+            return
+        if self.session.get_bind().dialect.name == "postgresql":
+            # La secuencia se asigna al insertar pero se hace visible al confirmar: sin este lock
+            # un cliente podría avanzar su cursor por encima de un cambio aún sin confirmar.
+            self.session.execute(select(func.pg_advisory_xact_lock(EVENT_CHANGE_LOCK_KEY)))
+        if not new:
+            self.session.execute(delete(EventChange).where(EventChange.event_id.in_(event_ids)))
+        now = datetime.utcnow()
+        self.session.execute(insert(EventChange), [{"event_id": event_id, "deleted": deleted, "changed_at": now} for event_id in event_ids])
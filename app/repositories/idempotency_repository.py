@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+from sqlalchemy import delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, update
+from app.database.unit_of_work import commit_or_flush
+from app.models.idempotency import IdempotencyKey
+
+
+class IdempotencyRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def claim(self, user_id: int, key: str, fingerprint: str, lock_seconds: float) -> bool:
+        """
+        Reserva la clave para una petición en curso. Devuelve False si ya existe y no ha
+        expirado; una reserva expirada (respuesta antigua o petición que nunca terminó) se reemplaza.
+        """
+        dialects = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+        dialect = self.session.get_bind().dialect.name
+        if dialect not in dialects:
+            raise NotImplementedError(f"claim is not supported for dialect {dialect}")
+        now = datetime.utcnow()
+        values = {
+            "user_id": user_id, "key": key, "fingerprint": fingerprint, "status_code": None,
+            "headers": [], "body": None, "created_at": now, "expires_at": now + timedelta(seconds=lock_seconds),
+        }
+        statement = dialects[dialect](IdempotencyKey).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=["user_id", "key"],
+            set_={name: value for name, value in values.items() if name not in ("user_id", "key")},
+            where=IdempotencyKey.expires_at < now,
+        ).returning(IdempotencyKey.key)
+        claimed = self.session.scalar(statement)
+        commit_or_flush(self.session)
+        return claimed is not None
+
+    def get(self, user_id: int, key: str) -> Optional[IdempotencyKey]:
+        return self.session.get(IdempotencyKey, (user_id, key), populate_existing=True)
+
+    def complete(self, user_id: int, key: str, status_code: int, headers: List[List[str]], body: bytes, ttl_seconds: float) -> None:
+        self.session.exec(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+            .values(status_code=status_code, headers=headers, body=body,
+                    expires_at=datetime.utcnow() + timedelta(seconds=ttl_seconds))
+        )
+        commit_or_flush(self.session)
+
+    def release(self, user_id: int, key: str) -> None:
+        """Libera la reserva sin respuesta guardada para que un reintento vuelva a ejecutarse."""
+        self.session.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.user_id == user_id, IdempotencyKey.key == key, IdempotencyKey.status_code.is_(None)
+            )
+        )
+        commit_or_flush(self.session)
+
+    def delete_expired(self) -> int:
+        result = self.session.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at <= datetime.utcnow()))
+        commit_or_flush(self.session)
+        return result.rowcount
@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, select, update
+from app.database.unit_of_work import commit_or_flush
+from app.models.job_run import JobRun
+
+
+class JobRunRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def try_start(self, job_name: str, slot: int) -> Optional[int]:
+        """
+        Registra el inicio de la tarea en el intervalo `slot` y devuelve el id de la ejecución,
+        o None si otra réplica ya la reclamó (INSERT ... ON CONFLICT DO NOTHING).
+        """
+        dialects = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+        dialect = self.session.get_bind().dialect.name
+        if dialect not in dialects:
+            raise NotImplementedError(f"try_start is not supported for dialect {dialect}")
+        statement = (
+            dialects[dialect](JobRun)
+            .values(job_name=job_name, slot=slot, started_at=datetime.utcnow())
+            .on_conflict_do_nothing(index_elements=["job_name", "slot"])
+            .returning(JobRun.id)
+        )
+        run_id = self.session.scalar(statement)
+        commit_or_flush(self.session)
+        return run_id
+
+    def finish(self, run_id: int, rows_affected: Optional[int], error: Optional[str] = None) -> None:
+        self.session.exec(
+            update(JobRun)
+            .where(JobRun.id == run_id)
+            .values(finished_at=datetime.utcnow(), rows_affected=rows_affected, error=error[:1000] if error else None)
+        )
+        commit_or_flush(self.session)
+
+    def get_last_runs(self, job_name: str, limit: int = 20) -> List[JobRun]:
+        statement = select(JobRun).where(JobRun.job_name == job_name).order_by(JobRun.slot.desc()).limit(limit)
+        return self.session.exec(statement).all()
@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from sqlmodel import Session, delete, select, update
+from app.database.unit_of_work import commit_or_flush
+from app.models.outbox import OutboxMessage, OutboxStatus
+
+
+class OutboxRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def enqueue(self, topic: str, payload: Dict[str, Any]) -> OutboxMessage:
+        """
+        Añade un mensaje a la transacción en curso sin confirmarla: se guarda
+        solo si se confirma el cambio que lo origina.
+        """
+        message = OutboxMessage(topic=topic, payload=payload)
+        self.session.add(message)
+        return message
+
+    def claim_batch(self, limit: int, lease_seconds: float) -> List[OutboxMessage]:
+        """
+        Reclama hasta `limit` mensajes pendientes. En PostgreSQL, FOR UPDATE SKIP LOCKED permite
+        varios workers sin que se pisen; el plazo (lease) devuelve el mensaje a la cola si
+        el worker muere antes de terminarlo.
+        """
+        now = datetime.utcnow()
+        statement = (
+            select(OutboxMessage)
+            .where(OutboxMessage.status == OutboxStatus.PENDING, OutboxMessage.available_at <= now)
+            .order_by(OutboxMessage.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        messages = self.session.exec(statement).all()
+        for message in messages:
+            message.attempts += 1
+            message.available_at = now + timedelta(seconds=lease_seconds)
+        commit_or_flush(self.session)
+        return messages
+
+    def mark_processed(self, message_ids: List[int]) -> None:
+        if not message_ids:
+            return
+        self.session.exec(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(message_ids))
+            .values(status=OutboxStatus.PROCESSED, processed_at=datetime.utcnow(), last_error=None)
+        )
+        commit_or_flush(self.session)
+
+    def mark_failed(self, message_id: int, error: str, retry_at: Optional[datetime]) -> None:
+        """
+        Registra el error; con `retry_at` el mensaje vuelve a la cola, sin él queda como fallido.
+        """
+        values = {"last_error": error[:1000], "status": OutboxStatus.PENDING if retry_at else OutboxStatus.FAILED}
+        if retry_at:
+            values["available_at"] = retry_at
+        self.session.exec(update(OutboxMessage).where(OutboxMessage.id == message_id).values(**values))
+        commit_or_flush(self.session)
+
+    def delete_processed(self, before: datetime, limit: int) -> int:
+        """
+        Borra hasta `limit` mensajes procesados antes de `before`, en una transacción.
+        Los fallidos se conservan para poder revisarlos.
+        """
+        batch = (
+            select(OutboxMessage.id)
+            .where(OutboxMessage.status == OutboxStatus.PROCESSED, OutboxMessage.processed_at < before)
+            .order_by(OutboxMessage.id)
+            .limit(limit)
+        )
+        result = self.session.execute(delete(OutboxMessage).where(OutboxMessage.id.in_(batch)))
+        commit_or_flush(self.session)
+        return result.rowcount
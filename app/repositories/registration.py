@@ -1,17 +1,31 @@
+from datetime import datetime
 from typing import List, Optional
 from sqlmodel import Session, select
+from app.database.errors import violated_constraint
+from app.database.unit_of_work import commit_or_flush
 from app.models.registration import Registration
-from sqlalchemy import func
+from app.repositories.outbox_repository import OutboxRepository
+from sqlalchemy import delete, func
+from sqlalchemy.exc import IntegrityError
 
 class RegistrationRepository:
     def __init__(self, session: Session):
         self.session = session
+        self.outbox = OutboxRepository(session)
 
     def create_registration(self, user_id: int, event_id: int) -> Registration:
         registration = Registration(user_id=user_id, event_id=event_id)
         self.session.add(registration)
-        self.session.commit()
-        self.session.refresh(registration)
+        try:
+            self.session.flush()
+            self.outbox.enqueue("registration.created", {"registration_id": registration.id, "user_id": user_id, "event_id": event_id})
+            commit_or_flush(self.session)
+        except IntegrityError as e:
+            # Dos peticiones simultáneas pueden pasar la validación previa; la restricción única decide
+            self.session.rollback()
+            if violated_constraint(e, Registration.__table__) == "uq_registration_user_event":
+                raise ValueError("User is already registered for this event")
+            raise
         return registration
 
     def get_registration(self, user_id: int, event_id: int) -> Optional[Registration]:
@@ -34,9 +48,23 @@ class RegistrationRepository:
             return result[0]
         return result
     
-    def delete_registration(self, registration: Registration):
-        self.session.delete(registration)
-        self.session.commit()
+    def delete_registration(self, user_id: int, event_id: int) -> Optional[datetime]:
+        """
+        Borra la inscripción y devuelve su fecha, o None si esta transacción no borró ninguna
+        fila (no existía o la canceló a la vez otra petición).
+        """
+        statement = (
+            delete(Registration)
+            .where(Registration.user_id == user_id, Registration.event_id == event_id)
+            .returning(Registration.registration_date)
+            .execution_options(synchronize_session=False)
+        )
+        registration_date = self.session.execute(statement).scalar_one_or_none()
+        if registration_date is None:
+            return None
+        self.outbox.enqueue("registration.cancelled", {"user_id": user_id, "event_id": event_id})
+        commit_or_flush(self.session)
+        return registration_date
 
     def get_registrations_by_event(self, event_id: int) -> List[Registration]:
         statement = select(Registration).where(Registration.event_id == event_id)
@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import List, Tuple
+from sqlalchemy import delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, select
+from app.database.unit_of_work import commit_or_flush
+from app.models.revoked_token import RevokedToken
+
+
+class RevokedTokenRepository:
+    """
+    Almacén persistente de la lista de revocación (implementa RevocationStore).
+    """
+    def __init__(self, session: Session):
+        self.session = session
+
+    def revoke(self, jti: str, user_id: int, expires_at: datetime) -> bool:
+        """
+        Revoca el jti con un INSERT ... ON CONFLICT DO NOTHING. Devuelve False si ya estaba
+        revocado: con dos usos simultáneos del mismo refresh token solo uno obtiene True.
+        """
+        dialects = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+        dialect = self.session.get_bind().dialect.name
+        if dialect not in dialects:
+            raise NotImplementedError(f"revoke is not supported for dialect {dialect}")
+        statement = (
+            dialects[dialect](RevokedToken)
+            .values(jti=jti, user_id=user_id, expires_at=expires_at, revoked_at=datetime.utcnow())
+            .on_conflict_do_nothing(index_elements=["jti"])
+            .returning(RevokedToken.jti)
+        )
+        revoked = self.session.scalar(statement)
+        commit_or_flush(self.session)
+        return revoked is not None
+
+    def get_revoked_since(self, since: datetime) -> List[Tuple[str, datetime]]:
+        """(jti, expires_at) revocados desde `since` que aún no han expirado."""
+        statement = select(RevokedToken.jti, RevokedToken.expires_at).where(
+            RevokedToken.revoked_at >= since, RevokedToken.expires_at > datetime.utcnow()
+        )
+        return self.session.exec(statement).all()
+
+    def delete_expired(self) -> int:
+        result = self.session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= datetime.utcnow()))
+        commit_or_flush(self.session)
+        return result.rowcount
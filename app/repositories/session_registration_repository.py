@@ -0,0 +1,127 @@
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import delete, func, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+from app.database.errors import violated_constraint
+from app.database.unit_of_work import commit_or_flush
+from app.models.session import Session as EventSession
+from app.models.session_registration import SessionRegistration
+from app.repositories.outbox_repository import OutboxRepository
+
+# Clave del advisory lock que serializa las reservas de un mismo usuario en PostgreSQL
+SESSION_BOOKING_LOCK_KEY = 0x73656174
+
+class SessionRegistrationRepository:
+    def __init__(self, session: Session):
+        self.session = session
+        self.outbox = OutboxRepository(session)
+
+    def lock_user_bookings(self, user_id: int) -> None:
+        """
+        Serializa hasta el fin de la transacción las reservas simultáneas del mismo usuario,
+        para que dos peticiones no pasen a la vez la comprobación de solapamientos.
+        Solo espera quien reserva para ese usuario; no bloquea sesiones ni tablas.
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            self.session.execute(select(func.pg_advisory_xact_lock(SESSION_BOOKING_LOCK_KEY, user_id)))
+
+    def take_seat(self, session_id: int) -> bool:
+        """
+        Ocupa una plaza con un UPDATE condicional: la comprobación del aforo y el incremento son
+        una sola sentencia, así que las reservas simultáneas nunca superan la capacidad.
+        Devuelve False si la sesión está completa.
+        """
+        statement = (
+            update(EventSession)
+            .where(EventSession.id == session_id, EventSession.seats_taken < EventSession.capacity)
+            .values(seats_taken=EventSession.seats_taken + 1)
+        )
+        return self.session.execute(statement).rowcount == 1
+
+    def release_seats(self, *session_ids: int) -> None:
+        statement = (
+            update(EventSession)
+            .where(EventSession.id.in_(session_ids), EventSession.seats_taken > 0)
+            .values(seats_taken=EventSession.seats_taken - 1)
+        )
+        self.session.execute(statement)
+
+    def create_session_registration(self, user_id: int, session_id: int) -> SessionRegistration:
+        registration = SessionRegistration(user_id=user_id, session_id=session_id)
+        self.session.add(registration)
+        try:
+            self.session.flush()
+            self.outbox.enqueue("session_registration.created", {"registration_id": registration.id, "user_id": user_id, "session_id": session_id})
+            commit_or_flush(self.session)
+        except IntegrityError as e:
+            # La restricción única decide entre dos reservas simultáneas; el rollback devuelve la plaza
+            self.session.rollback()
+            if violated_constraint(e, SessionRegistration.__table__) == "uq_session_registration_user_session":
+                raise ValueError("User is already registered for this session")
+            raise
+        return registration
+
+    def get_session_registration(self, user_id: int, session_id: int) -> Optional[SessionRegistration]:
+        statement = select(SessionRegistration).where(
+            SessionRegistration.user_id == user_id,
+            SessionRegistration.session_id == session_id
+        )
+        return self.session.exec(statement).first()
+
+    def get_session_registrations_by_user(self, user_id: int, skip: int = 0, limit: int = 100) -> List[SessionRegistration]:
+        statement = select(SessionRegistration).where(SessionRegistration.user_id == user_id).offset(skip).limit(limit)
+        return self.session.exec(statement).all()
+
+    def find_overlapping_bookings(self, user_id: int, start_time: datetime, end_time: datetime) -> List[EventSession]:
+        """
+        Sesiones ya reservadas por el usuario que se solapan con el intervalo [start_time, end_time).
+        """
+        statement = (
+            select(EventSession)
+            .join(SessionRegistration, SessionRegistration.session_id == EventSession.id)
+            .where(
+                SessionRegistration.user_id == user_id,
+                EventSession.start_time < end_time,
+                EventSession.end_time > start_time,
+            )
+        )
+        return self.session.exec(statement).all()
+
+    def delete_session_registration(self, user_id: int, session_id: int) -> bool:
+        """
+        Cancela la reserva y libera su plaza solo si esta transacción borró la fila: de dos
+        cancelaciones simultáneas, la segunda no borra nada y no debe liberar otra plaza.
+        """
+        statement = (
+            delete(SessionRegistration)
+            .where(SessionRegistration.user_id == user_id, SessionRegistration.session_id == session_id)
+            .returning(SessionRegistration.id)
+            .execution_options(synchronize_session=False)
+        )
+        if self.session.execute(statement).first() is None:
+            return False
+        self.outbox.enqueue("session_registration.cancelled", {"user_id": user_id, "session_id": session_id})
+        self.release_seats(session_id)
+        commit_or_flush(self.session)
+        return True
+
+    def delete_session_registrations_for_event(self, user_id: int, event_id: int) -> List[int]:
+        """
+        Cancela las reservas del usuario en las sesiones de un evento (al cancelar su inscripción)
+        y libera sus plazas. Devuelve los ids de las sesiones afectadas.
+        """
+        statement = (
+            delete(SessionRegistration)
+            .where(
+                SessionRegistration.user_id == user_id,
+                SessionRegistration.session_id.in_(select(EventSession.id).where(EventSession.event_id == event_id)),
+            )
+            .returning(SessionRegistration.session_id)
+            .execution_options(synchronize_session=False)
+        )
+        session_ids = list(self.session.execute(statement).scalars())
+        if session_ids:
+            self.release_seats(*session_ids)
+        commit_or_flush(self.session)
+        return session_ids
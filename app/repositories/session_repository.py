@@ -1,8 +1,18 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import func, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
 from sqlmodel import Session, select
+from app.database.errors import violated_constraint
+from app.database.unit_of_work import commit_or_flush
+from app.models.envent import Event
 from app.models.session import Session
 from app.schemas.session import SessionCreate, SessionUpdate
 
+EXCLUSION_VIOLATION = "23P01"
+SEATS_TAKEN_CONSTRAINT = "ck_session_seats_taken"
+
 class SessionRepository:
     def __init__(self, session: Session):
         self.session = session
@@ -10,25 +20,94 @@ class SessionRepository:
     def create_session(self, session_in: SessionCreate) -> Session:
         session = Session.model_validate(session_in)
         self.session.add(session)
-        self.session.commit()
-        self.session.refresh(session)
+        self._commit_schedule()
         return session
 
     def get_session_by_id(self, session_id: int) -> Optional[Session]:
         return self.session.get(Session, session_id)
 
-    def get_sessions_by_event_id(self, event_id: int, skip: int = 0, limit: int = 100) -> List[Session]:
-        statement = select(Session).where(Session.event_id == event_id).offset(skip).limit(limit)
+    def get_event_organizer_id(self, event_id: int) -> Optional[int]:
+        event = self.session.get(Event, event_id)
+        return event.organizer_id if event else None
+
+    def get_sessions_by_event_id(self, event_id: int, skip: int = 0, limit: int = 100, fields: Optional[Sequence[str]] = None) -> List[Session]:
+        if fields is None:
+            statement = select(Session)
+        else:
+            # Solo las columnas pedidas, sin construir objetos del ORM
+            statement = select(*(getattr(Session, name) for name in fields))
+        statement = statement.where(Session.event_id == event_id).order_by(Session.start_time).offset(skip).limit(limit)
+        if fields is None:
+            return self.session.exec(statement).all()
+        return [dict(row) for row in self.session.execute(statement).mappings()]
+
+    def find_overlapping_sessions(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        speaker_id: Optional[int] = None,
+        event_id: Optional[int] = None,
+        exclude_session_id: Optional[int] = None,
+    ) -> List[Session]:
+        """
+        Sesiones del mismo ponente o del mismo evento cuyo intervalo [inicio, fin) se solapa.
+        """
+        owners = []
+        if speaker_id is not None:
+            owners.append(Session.speaker_id == speaker_id)
+        if event_id is not None:
+            owners.append(Session.event_id == event_id)
+        if not owners:
+            return []
+        statement = select(Session).where(or_(*owners), self._overlaps(start_time, end_time))
+        if exclude_session_id is not None:
+            statement = statement.where(Session.id != exclude_session_id)
+        return self.session.exec(statement.order_by(Session.start_time)).all()
+
+    def get_speaker_conflicts(self, speaker_id: int) -> List[Tuple[Session, Session]]:
+        """
+        Pares de sesiones solapadas de un ponente en cualquier evento, en una sola consulta.
+        """
+        other = aliased(Session)
+        statement = (
+            select(Session, other)
+            .join(other, (other.speaker_id == Session.speaker_id) & (other.id > Session.id))
+            .where(
+                Session.speaker_id == speaker_id,
+                other.start_time < Session.end_time,
+                other.end_time > Session.start_time,
+            )
+            .order_by(Session.start_time, other.start_time)
+        )
         return self.session.exec(statement).all()
 
     def update_session(self, session: Session, session_update: SessionUpdate) -> Session:
         update_data = session_update.model_dump(exclude_unset=True)
         session.sqlmodel_update(update_data)
         self.session.add(session)
-        self.session.commit()
-        self.session.refresh(session)
+        self._commit_schedule()
         return session
 
     def delete_session(self, session: Session):
         self.session.delete(session)
-        self.session.commit()
\ No newline at end of file
+        commit_or_flush(self.session)
+
+    def _overlaps(self, start_time: datetime, end_time: datetime):
+        # En PostgreSQL el operador && sobre tsrange usa los índices GiST de las
+        # restricciones EXCLUDE; en el resto, el índice (speaker_id|event_id, start_time).
+        if self.session.get_bind().dialect.name == "postgresql":
+            return func.tsrange(Session.start_time, Session.end_time).op("&&")(func.tsrange(start_time, end_time))
+        return (Session.start_time < end_time) & (Session.end_time > start_time)
+
+    def _commit_schedule(self):
+        try:
+            commit_or_flush(self.session)
+        except IntegrityError as e:
+            self.session.rollback()
+            # Una escritura concurrente pudo ocupar el mismo horario; la restricción EXCLUDE decide
+            if getattr(e.orig, "pgcode", None) == EXCLUSION_VIOLATION:
+                raise ValueError("Session overlaps with another session of the same speaker or event")
+            # Una reserva concurrente pudo ocupar plazas por encima de la nueva capacidad
+            if violated_constraint(e, Session.__table__) == SEATS_TAKEN_CONSTRAINT:
+                raise ValueError("Session capacity cannot be lower than its booked seats")
+            raise
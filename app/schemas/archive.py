@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Optional
+from sqlmodel import SQLModel, Field
+
+from app.schemas.event import EventBase
+
+class EventArchiveResponse(EventBase):
+    id: int
+    organizer_id: int
+    image_url: Optional[str] = Field(default=None, max_length=500)
+    created_at: datetime
+    updated_at: datetime
+    archived_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class RegistrationHistoryResponse(SQLModel):
+    id: int
+    user_id: int
+    event_id: int
+    registration_date: datetime
+    event: EventArchiveResponse
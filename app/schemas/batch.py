@@ -0,0 +1,22 @@
+# app/schemas/batch.py
+from typing import Any, List, Literal, Optional
+
+from pydantic import BaseModel
+
+
+class BatchRequestItem(BaseModel):
+    # Identificador opcional que se devuelve tal cual para relacionar cada respuesta
+    id: Optional[str] = None
+    method: Literal["GET"] = "GET"
+    # Ruta completa de la API con su query string, p. ej. /api/v1/event/3?fields=id,name
+    path: str
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchRequestItem]
+
+
+class BatchResponseItem(BaseModel):
+    id: Optional[str] = None
+    status: int
+    body: Any = None
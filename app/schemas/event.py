@@ -46,4 +46,58 @@ class EventResponse(EventBase):
                 "created_at": "2025-05-01T10:00:00.000Z",
                 "updated_at": "2025-05-01T10:00:00.000Z",
             }
-        }
\ No newline at end of file
+        }
+
+class EventCalendarDay(SQLModel):
+    day: date
+    events: int
+
+class EventImportError(SQLModel):
+    row: int
+    errors: List[str]
+
+class EventImportReport(SQLModel):
+    created: int = 0
+    failed: int = 0
+    event_ids: List[int] = []
+    errors: List[EventImportError] = []
+
+class EventAvailability(SQLModel):
+    event_id: int
+    status: EventStatus
+    capacity: int
+    registered: int
+    available: int
+
+class EventChangeItem(SQLModel):
+    seq: int
+    event_id: int
+    # True si el evento se eliminó o dejó de estar publicado: el cliente debe quitarlo
+    deleted: bool
+    event: Optional[EventResponse] = None
+
+class EventChangesResponse(SQLModel):
+    changes: List[EventChangeItem]
+    next_cursor: int
+    has_more: bool
+
+class OrganizerEventStats(SQLModel):
+    event_id: int
+    name: str
+    event_date: date
+    status: EventStatus
+    capacity: int
+    registrations: int
+    fill_ratio: float
+    sessions: int
+    last_registration_at: Optional[datetime] = None
+
+class TrendingEvent(SQLModel):
+    event: EventResponse
+    # Inscripciones recientes equivalentes: cada una cuenta 1 y la mitad por cada vida media
+    score: float
+
+class OrganizerDashboard(SQLModel):
+    total_events: int
+    total_registrations: int
+    events: List[OrganizerEventStats]
@@ -0,0 +1,18 @@
+# app/schemas/fieldsets.py
+from typing import List, Optional, Type
+
+from pydantic import BaseModel
+
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> Optional[List[str]]:
+    """
+    Convierte `?fields=a,b` en la lista de campos pedidos, validada contra el esquema de
+    respuesta. El id se incluye siempre. None si no se pidió un subconjunto.
+    """
+    if fields is None:
+        return None
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = sorted(set(requested) - set(schema.model_fields))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Allowed fields: {', '.join(schema.model_fields)}")
+    return ["id"] + [name for name in dict.fromkeys(requested) if name != "id"]
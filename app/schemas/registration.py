@@ -12,4 +12,9 @@ class RegistrationResponse(SQLModel):
     event_id: int
     registration_date: datetime
     event: EventResponse
-    user: UserResponse
\ No newline at end of file
+    user: UserResponse
+class SessionRegistrationResponse(SQLModel):
+    id: int
+    user_id: int
+    session_id: int
+    registration_date: datetime
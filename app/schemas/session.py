@@ -26,6 +26,7 @@ class SessionUpdate(SessionBase):
 
 class SessionResponse(SessionBase):
     id: int
+    seats_taken: int = 0
     created_at: datetime
     updated_at: datetime
     
@@ -41,8 +42,13 @@ class SessionResponse(SessionBase):
                 "capacity": 100,
                 "event_id": 1,
                 "speaker_id": 1,
+                "seats_taken": 12,
                 "created_at": "2025-05-28T09:00:00.000Z",
                 "updated_at": "2025-05-28T09:30:00.000Z",
             }
         }   
-    # Puedes añadir aquí información del ponente (UserResponse) o del evento (EventResponse)
\ No newline at end of file
+    # Puedes añadir aquí información del ponente (UserResponse) o del evento (EventResponse)
+
+class SessionConflictResponse(SQLModel):
+    session: SessionResponse
+    conflicts_with: SessionResponse
@@ -45,4 +45,7 @@ class Token(BaseModel):
         }
     })
 class TokenPayload(BaseModel):
-    sub: Optional[int] = None
\ No newline at end of file
+    sub: Optional[int] = None
+    exp: Optional[int] = None
+    jti: Optional[str] = None
+    type: Optional[str] = None
\ No newline at end of file
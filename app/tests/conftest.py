@@ -19,7 +19,7 @@ def session_fixture():
     # engine = create_engine("sqlite:///:memory:")
 
     SQLModel.metadata.create_all(engine) # Crea todas las tablas definidas por SQLModel
-    with Session(engine) as session:
+    with Session(engine, expire_on_commit=False) as session:
         yield session
     SQLModel.metadata.drop_all(engine) # Elimina las tablas al finalizar las pruebas
 
@@ -0,0 +1,80 @@
+# app/tests/functional/test_availability_stream.py
+import json
+import threading
+import time
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.api.v1.endpoints import events as events_endpoints
+from app.core.broadcast import broadcaster
+from app.models.envent import Event, EventStatus
+from app.models.user import User
+from app.repositories.event_repository import EventRepository
+from app.repositories.registration import RegistrationRepository
+from app.repositories.session_registration_repository import SessionRegistrationRepository
+from app.schemas.event import EventUpdate
+from app.use_cases.event.availability import availability_channel
+from app.use_cases.event.delete_event import DeleteEventUseCase
+from app.use_cases.event.update_event import UpdateEventUseCase
+from app.use_cases.registrations.cancel_registration import CancelRegistration
+from app.use_cases.registrations.register_for_events import RegisterForEvent
+
+
+def _wait_for(condition, timeout: float = 5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timeout"
+        time.sleep(0.01)
+
+
+def test_stream_pushes_registrations_updates_and_closes_on_delete(client: TestClient, session: Session, test_user: User):
+    """
+    Prueba que los observadores reciben el estado inicial, cada inscripción, baja o cambio del evento
+    y el cierre al eliminarlo.
+    """
+    event = Event(name="Concierto", event_date=date.today() + timedelta(days=5), location="Estadio",
+                  capacity=2, status=EventStatus.PUBLISHED, organizer_id=test_user.id)
+    session.add(event)
+    session.commit()
+    channel = availability_channel(event.id)
+
+    bodies = []
+    watchers = [
+        threading.Thread(target=lambda: bodies.append(client.get(f"/api/v1/event/{event.id}/availability/stream").text))
+        for _ in range(2)
+    ]
+    for watcher in watchers:
+        watcher.start()
+    _wait_for(lambda: len(broadcaster._subscribers.get(channel, ())) == 2)
+
+    RegisterForEvent(RegistrationRepository(session), EventRepository(session)).execute(test_user.id, event.id)
+    UpdateEventUseCase(EventRepository(session)).execute(event.id, EventUpdate(capacity=3), test_user.id)
+    CancelRegistration(RegistrationRepository(session), EventRepository(session), SessionRegistrationRepository(session)).execute(test_user.id, event.id)
+    _wait_for(lambda: broadcaster.latest(channel).registered == 0)
+    DeleteEventUseCase(EventRepository(session)).execute(event.id, test_user.id)
+    for watcher in watchers:
+        watcher.join(timeout=5)
+
+    assert len(bodies) == 2 and bodies[0] == bodies[1]
+    messages = [json.loads(line[len("data: "):]) for line in bodies[0].splitlines() if line.startswith("data: ")]
+    assert [(m["registered"], m["capacity"], m["available"]) for m in messages] == [(0, 2, 2), (1, 2, 1), (1, 3, 2), (0, 3, 3)]
+    assert not broadcaster.has_subscribers(channel)
+
+
+def test_stream_ends_after_its_maximum_duration(monkeypatch, client: TestClient, session: Session, test_user: User):
+    """
+    Prueba que la conexión se cierra sola al cumplir STREAM_MAX_SECONDS, para que ningún
+    observador bloquee el apagado.
+    """
+    monkeypatch.setattr(events_endpoints.settings, "STREAM_MAX_SECONDS", 0.2)
+    event = Event(name="Concierto", event_date=date.today() + timedelta(days=5), location="Estadio",
+                  capacity=2, status=EventStatus.PUBLISHED, organizer_id=test_user.id)
+    session.add(event)
+    session.commit()
+
+    body = client.get(f"/api/v1/event/{event.id}/availability/stream").text
+
+    assert body.startswith("event: availability\n")
+    assert not broadcaster.has_subscribers(availability_channel(event.id))
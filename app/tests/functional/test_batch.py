@@ -0,0 +1,60 @@
+# app/tests/functional/test_batch.py
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import get_settings
+from app.core.security import create_access_token
+from app.models.envent import Event, EventStatus
+from app.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def sequential_batches(monkeypatch):
+    # El cliente de pruebas comparte una sola sesión de base de datos entre peticiones
+    monkeypatch.setattr(get_settings(), "BATCH_MAX_CONCURRENCY", 1)
+
+
+def test_batch_returns_each_response_in_order(client: TestClient, session: Session, test_user: User):
+    """
+    Prueba que el lote devuelve el estado y el cuerpo de cada subpetición, incluidos los errores,
+    y que las rutas autenticadas usan el usuario del lote.
+    """
+    event = Event(name="Evento", event_date=date.today() + timedelta(days=5), location="Lima", capacity=10,
+                  status=EventStatus.PUBLISHED, organizer_id=test_user.id)
+    session.add(event)
+    session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(test_user.id)}"}
+
+    response = client.post("/api/v1/batch", headers=headers, json={"requests": [
+        {"id": "me", "path": "/api/v1/users/me"},
+        {"id": "catalog", "path": "/api/v1/events/all?fields=name"},
+        {"id": "event", "path": f"/api/v1/event/{event.id}"},
+        {"id": "missing", "path": "/api/v1/event/999"},
+        {"id": "unknown", "path": "/api/v1/nada"},
+    ]})
+
+    assert response.status_code == 200
+    results = {item["id"]: item for item in response.json()}
+    assert list(results) == ["me", "catalog", "event", "missing", "unknown"]
+    assert (results["me"]["status"], results["me"]["body"]["email"]) == (200, "test@example.com")
+    assert results["catalog"]["body"] == [{"id": event.id, "name": "Evento"}]
+    assert results["event"]["body"]["name"] == "Evento"
+    assert results["missing"]["status"] == 404
+    assert results["unknown"]["status"] == 404
+
+
+def test_batch_requires_authentication_and_valid_paths(client: TestClient, test_user: User):
+    """
+    Prueba que el lote exige autenticación y rechaza rutas fuera de la API o el propio /batch.
+    """
+    assert client.post("/api/v1/batch", json={"requests": [{"path": "/api/v1/events/all"}]}).status_code == 401
+
+    headers = {"Authorization": f"Bearer {create_access_token(test_user.id)}"}
+    for path in ("/static/x.png", "/api/v1/batch"):
+        response = client.post("/api/v1/batch", headers=headers, json={"requests": [{"path": path}]})
+        assert response.status_code == 400
+    post = client.post("/api/v1/batch", headers=headers, json={"requests": [{"method": "POST", "path": "/api/v1/event"}]})
+    assert post.status_code == 422
@@ -0,0 +1,60 @@
+# app/tests/functional/test_compression.py
+from datetime import date, timedelta
+from urllib.parse import quote
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.compression import negotiate_encoding
+from app.models.envent import Event, EventStatus
+from app.models.user import User
+
+
+def test_negotiate_encoding_respects_q_values():
+    """
+    Prueba la negociación de Accept-Encoding con pesos, comodín y codificaciones rechazadas.
+    """
+    assert negotiate_encoding("gzip, deflate, br", ("br", "gzip")) == "br"
+    assert negotiate_encoding("br;q=0.5, gzip", ("br", "gzip")) == "gzip"
+    assert negotiate_encoding("*;q=0.1, br;q=0", ("br", "gzip")) == "gzip"
+    assert negotiate_encoding("identity", ("br", "gzip")) is None
+    assert negotiate_encoding("", ("gzip",)) is None
+
+
+def test_list_responses_are_compressed_above_threshold(client: TestClient, session: Session, test_user: User):
+    """
+    Prueba que el listado grande se comprime, el pequeño no, y que las imágenes estáticas se sirven tal cual.
+    """
+    session.add_all([
+        Event(name=f"Evento {i}", description="Charla sobre datos y comunidad " * 30,
+              event_date=date.today() + timedelta(days=i + 1), location="Bogotá", capacity=50,
+              status=EventStatus.PUBLISHED, organizer_id=test_user.id)
+        for i in range(20)
+    ])
+    session.commit()
+
+    response = client.get("/api/v1/events/all", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(response.content) / 4
+    assert len(response.json()) == 20
+
+    small = client.get("/api/v1/events/all?name_query=inexistente", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+    plain = client.get("/api/v1/events/all", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == response.json()
+
+
+def test_static_images_are_not_recompressed(client: TestClient):
+    """
+    Prueba que las imágenes (ya comprimidas) no pasan por la compresión.
+    """
+    name = "event_1_20250512_1555_Logotipo de Civico_simple_compose_01jv34e0p1fy1sfetc3bz2zej5.png"
+    response = client.get(f"/static/events/{quote(name)}", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert "content-encoding" not in response.headers
@@ -0,0 +1,44 @@
+# app/tests/functional/test_event_changes.py
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.models.envent import EventStatus
+from app.models.user import User
+from app.repositories.event_repository import EventRepository
+from app.schemas.event import EventCreate, EventUpdate
+
+
+def test_change_feed_returns_changes_after_cursor(client: TestClient, session: Session, test_user: User):
+    """
+    Prueba la sincronización incremental: creaciones, cambios, marcas de borrado y cursor sin cambios.
+    """
+    repo = EventRepository(session)
+    event_date = date.today() + timedelta(days=20)
+    events = [
+        repo.create_event(EventCreate(name=f"Evento {i}", event_date=event_date, location="Lisboa", capacity=10,
+                                      status=EventStatus.PUBLISHED), test_user.id, image=None)
+        for i in range(3)
+    ]
+
+    first = client.get("/api/v1/events/changes", params={"limit": 2}).json()
+    assert [change["event_id"] for change in first["changes"]] == [events[0].id, events[1].id]
+    assert first["has_more"] is True
+    second = client.get("/api/v1/events/changes", params={"since": first["next_cursor"]}).json()
+    assert [change["event_id"] for change in second["changes"]] == [events[2].id]
+    cursor = second["next_cursor"]
+
+    repo.update_event(events[0], EventUpdate(name="Evento renombrado"))
+    repo.update_event(events[1], EventUpdate(status=EventStatus.DRAFT))
+    repo.delete_event(events[2])
+
+    changes = client.get("/api/v1/events/changes", params={"since": cursor}).json()
+    assert [(c["event_id"], c["deleted"]) for c in changes["changes"]] == [
+        (events[0].id, False), (events[1].id, True), (events[2].id, True),
+    ]
+    assert changes["changes"][0]["event"]["name"] == "Evento renombrado"
+    assert changes["changes"][2]["event"] is None
+
+    empty = client.get("/api/v1/events/changes", params={"since": changes["next_cursor"]}).json()
+    assert empty == {"changes": [], "next_cursor": changes["next_cursor"], "has_more": False}
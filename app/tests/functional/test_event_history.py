@@ -0,0 +1,55 @@
+# app/tests/functional/test_event_history.py
+from datetime import date, datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.core.security import create_access_token
+from app.models.archive import SessionArchive, SessionRegistrationArchive
+from app.models.envent import Event, EventStatus
+from app.models.registration import Registration
+from app.models.session import Session as EventSession
+from app.models.session_registration import SessionRegistration
+from app.models.user import User
+from app.repositories.archive_repository import ArchiveRepository
+from app.use_cases.archive.archive_events import ArchiveEventsUseCase
+
+
+def test_archive_moves_old_events_to_history(client: TestClient, session: Session, test_user: User):
+    """
+    Prueba que el archivado mueve los eventos terminados antiguos con sus sesiones e inscripciones
+    y que siguen consultables desde los endpoints de histórico.
+    """
+    past = date.today() - timedelta(days=60)
+    old = Event(name="Edición 2025", event_date=past, location="Lima", capacity=10,
+                status=EventStatus.COMPLETED, organizer_id=test_user.id)
+    recent = Event(name="Edición reciente", event_date=date.today() - timedelta(days=2), location="Lima",
+                   capacity=10, status=EventStatus.COMPLETED, organizer_id=test_user.id)
+    upcoming = Event(name="Edición próxima", event_date=date.today() + timedelta(days=30), location="Lima",
+                     capacity=10, status=EventStatus.PUBLISHED, organizer_id=test_user.id)
+    session.add_all([old, recent, upcoming])
+    session.commit()
+    start = datetime.combine(past, datetime.min.time()) + timedelta(hours=9)
+    closing = EventSession(name="Clausura", start_time=start, end_time=start + timedelta(hours=1),
+                           capacity=10, event_id=old.id, speaker_id=test_user.id)
+    session.add(closing)
+    session.add(Registration(user_id=test_user.id, event_id=old.id))
+    session.commit()
+    session.add(SessionRegistration(user_id=test_user.id, session_id=closing.id))
+    session.commit()
+
+    archived = ArchiveEventsUseCase(ArchiveRepository(session)).execute(older_than_days=30, batch_size=1)
+
+    assert archived == 1
+    assert session.exec(select(Event.id).order_by(Event.id)).all() == [recent.id, upcoming.id]
+    assert session.exec(select(Registration)).all() == []
+    assert [s.event_id for s in session.exec(select(SessionArchive)).all()] == [old.id]
+    assert session.exec(select(SessionRegistration)).all() == []
+    assert [(r.user_id, r.session_id) for r in session.exec(select(SessionRegistrationArchive)).all()] == [(test_user.id, closing.id)]
+
+    headers = {"Authorization": f"Bearer {create_access_token(test_user.id)}"}
+    events = client.get("/api/v1/events/history", headers=headers).json()
+    registrations = client.get("/api/v1/user/registrations/history", headers=headers).json()
+
+    assert [(e["id"], e["status"]) for e in events] == [(old.id, "completed")]
+    assert [(r["event_id"], r["event"]["name"]) for r in registrations] == [(old.id, "Edición 2025")]
@@ -0,0 +1,61 @@
+# app/tests/functional/test_events_calendar.py
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.cache import cache
+from app.models.envent import Event, EventStatus
+from app.models.user import User
+from app.repositories.event_repository import EventRepository
+from app.schemas.event import EventUpdate
+from app.use_cases.event.update_event import UpdateEventUseCase
+
+
+@pytest.fixture(name="events")
+def events_fixture(session: Session, test_user: User):
+    """
+    Tres eventos publicados en el mismo mes del año próximo y uno en borrador.
+    """
+    cache.clear()
+    year = date.today().year + 1
+    days = [(1, EventStatus.PUBLISHED), (1, EventStatus.PUBLISHED), (15, EventStatus.PUBLISHED), (20, EventStatus.DRAFT)]
+    events = [
+        Event(name=f"Evento {i}", event_date=date(year, 3, day), location="Madrid", capacity=10,
+              status=event_status, organizer_id=test_user.id)
+        for i, (day, event_status) in enumerate(days)
+    ]
+    session.add_all(events)
+    session.commit()
+    yield events
+    cache.clear()
+
+
+def test_events_filtered_by_date_range(client: TestClient, events):
+    """
+    Prueba que /events/all filtra por rango de fechas y ordena por fecha.
+    """
+    year = events[0].event_date.year
+    response = client.get("/api/v1/events/all", params={"date_from": f"{year}-03-10", "date_to": f"{year}-03-31"})
+
+    assert response.status_code == 200
+    assert [event["name"] for event in response.json()] == ["Evento 2"]
+
+
+def test_calendar_counts_and_invalidation(client: TestClient, session: Session, test_user: User, events):
+    """
+    Prueba el conteo por día del calendario y que se invalida al cambiar un evento del mes.
+    """
+    year = events[0].event_date.year
+    response = client.get("/api/v1/events/calendar", params={"year": year, "month": 3})
+
+    assert response.status_code == 200
+    assert response.json() == [{"day": f"{year}-03-01", "events": 2}, {"day": f"{year}-03-15", "events": 1}]
+
+    UpdateEventUseCase(EventRepository(session)).execute(
+        events[2].id, EventUpdate(event_date=date(year, 4, 2)), current_user_id=test_user.id
+    )
+    response = client.get("/api/v1/events/calendar", params={"year": year, "month": 3})
+
+    assert response.json() == [{"day": f"{year}-03-01", "events": 2}]
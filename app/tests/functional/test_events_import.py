@@ -0,0 +1,71 @@
+# app/tests/functional/test_events_import.py
+import json
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.models.envent import Event, EventStatus
+from app.models.user import User
+
+
+@pytest.fixture(name="auth_headers")
+def auth_headers_fixture(client: TestClient, test_user: User):
+    login_data = {"username": test_user.email, "password": "testpassword"}
+    token = client.post("/api/v1/login/access-token", data=login_data).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_import_csv_reports_invalid_rows(client: TestClient, session: Session, test_user: User, auth_headers):
+    """
+    Prueba que la importación CSV crea las filas válidas y devuelve el error de cada fila inválida.
+    """
+    future = date.today() + timedelta(days=30)
+    past = date.today() - timedelta(days=1)
+    content = (
+        "name,description,event_date,location,capacity,status,image\n"
+        f"Feria,,{future},Madrid,100,published,https://cdn.example.com/feria.png\n"
+        f"Pasado,,{past},Sevilla,10,,\n"
+        f"Sin aforo,,{future},Bilbao,-1,,\n"
+        f"Taller,Con imagen local,{future},Valencia,20,,taller.png\n"
+    )
+    response = client.post(
+        "/api/v1/events/import",
+        files={"file": ("events.csv", content, "text/csv")},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["created"] == 1 and report["failed"] == 3
+    assert [error["row"] for error in report["errors"]] == [2, 3, 4]
+    assert report["errors"][0]["errors"] == ["Event date cannot be in the past"]
+    assert report["errors"][1]["errors"][0].startswith("capacity:")
+    assert report["errors"][2]["errors"] == ["Image not uploaded: taller.png"]
+
+    event = session.exec(select(Event)).one()
+    assert event.id == report["event_ids"][0]
+    assert (event.status, event.organizer_id, event.image_url) == (
+        EventStatus.PUBLISHED, test_user.id, "https://cdn.example.com/feria.png"
+    )
+
+
+def test_import_ndjson_in_batches(client: TestClient, session: Session, auth_headers):
+    """
+    Prueba la importación NDJSON con varias tandas y una línea que no es JSON.
+    """
+    future = (date.today() + timedelta(days=10)).isoformat()
+    lines = [json.dumps({"name": f"Evento {i}", "event_date": future, "location": "Online", "capacity": 5}) for i in range(1500)]
+    lines.insert(3, "{no es json")
+    response = client.post(
+        "/api/v1/events/import",
+        files={"file": ("events.ndjson", "\n".join(lines), "application/x-ndjson")},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["created"], report["failed"]) == (1500, 1)
+    assert report["errors"][0]["row"] == 4
+    assert len(session.exec(select(Event.id)).all()) == 1500
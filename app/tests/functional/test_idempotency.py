@@ -0,0 +1,60 @@
+# app/tests/functional/test_idempotency.py
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.core.security import create_access_token
+from app.database import connection
+from app.models.envent import Event, EventStatus
+from app.models.registration import Registration
+from app.models.user import User
+
+
+@pytest.fixture(name="auth_headers")
+def auth_headers_fixture(monkeypatch, session: Session, test_user: User):
+    # Las respuestas guardadas van a la base de datos de las pruebas
+    monkeypatch.setattr(connection, "engine", session.get_bind())
+    return {"Authorization": f"Bearer {create_access_token(test_user.id)}"}
+
+
+def test_retried_registration_replays_first_response(client: TestClient, session: Session, test_user: User, auth_headers):
+    """
+    Prueba que un reintento con la misma Idempotency-Key recibe la respuesta original
+    en lugar del error de inscripción duplicada.
+    """
+    event = Event(name="Jornada", event_date=date.today() + timedelta(days=7), location="Cali",
+                  capacity=10, status=EventStatus.PUBLISHED, organizer_id=test_user.id)
+    session.add(event)
+    session.commit()
+    headers = {**auth_headers, "Idempotency-Key": "registro-1"}
+
+    first = client.post(f"/api/v1/event/{event.id}/register", headers=headers)
+    retry = client.post(f"/api/v1/event/{event.id}/register", headers=headers)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert "idempotent-replayed" not in first.headers
+    assert len(session.exec(select(Registration)).all()) == 1
+    # Sin clave, el segundo intento llega al caso de uso
+    assert client.post(f"/api/v1/event/{event.id}/register", headers=auth_headers).status_code == 400
+
+
+def test_retried_import_creates_events_once(client: TestClient, session: Session, auth_headers):
+    """
+    Prueba que reenviar la misma importación no duplica eventos y que la clave no se acepta con otro contenido.
+    """
+    content = f"name,event_date,location,capacity\nFeria,{date.today() + timedelta(days=30)},Madrid,100\n"
+    headers = {**auth_headers, "Idempotency-Key": "importacion-1"}
+
+    for _ in range(2):
+        response = client.post("/api/v1/events/import", files={"file": ("events.csv", content, "text/csv")}, headers=headers)
+        assert response.status_code == 200
+    other = client.post("/api/v1/events/import", files={"file": ("events.csv", content + "Otro,2030-01-01,Lima,5\n", "text/csv")},
+                        headers=headers)
+
+    assert response.headers["idempotent-replayed"] == "true"
+    assert other.status_code == 422
+    assert [event.name for event in session.exec(select(Event)).all()] == ["Feria"]
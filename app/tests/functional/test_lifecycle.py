@@ -0,0 +1,50 @@
+# app/tests/functional/test_lifecycle.py
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.api.main import app
+from app.core.lifecycle import lifecycle
+from app.database import connection
+
+
+@pytest.fixture(name="test_engine")
+def test_engine_fixture(monkeypatch, session: Session):
+    """
+    El calentamiento usa el motor SQLite de las pruebas y ninguna réplica.
+    """
+    monkeypatch.setattr(connection, "engine", session.get_bind())
+    monkeypatch.setattr(connection, "read_engine", None)
+    yield
+    lifecycle.ready = False
+    lifecycle.draining = False
+
+
+def test_ready_only_after_warm_up_and_not_while_draining(client: TestClient, test_engine):
+    """
+    Prueba que la instancia se declara lista tras el arranque y deja de estarlo al apagarse.
+    """
+    assert client.get("/api/v1/health/ready").status_code == 503
+
+    with TestClient(app) as running:
+        response = running.get("/api/v1/health/ready")
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+
+    assert lifecycle.draining
+    response = client.get("/api/v1/health/ready")
+    assert response.status_code == 503
+    assert response.json() == {"status": "draining"}
+
+
+def test_new_requests_rejected_while_draining(client: TestClient, test_engine):
+    """
+    Prueba que durante el drenaje las peticiones nuevas reciben 503 y los health checks siguen respondiendo.
+    """
+    lifecycle.draining = True
+
+    response = client.get("/api/v1/events/all")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert client.get("/api/v1/health/live").status_code == 200
@@ -0,0 +1,51 @@
+# app/tests/functional/test_organizer_dashboard.py
+from datetime import date, datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.cache import cache
+from app.core.security import create_access_token
+from app.models.envent import Event, EventStatus
+from app.models.registration import Registration
+from app.models.session import Session as EventSession
+from app.models.user import User
+from app.repositories.event_repository import EventRepository
+from app.repositories.registration import RegistrationRepository
+from app.use_cases.registrations.register_for_events import RegisterForEvent
+
+
+def test_dashboard_aggregates_and_invalidates_on_registration(client: TestClient, session: Session, test_user: User):
+    """
+    Prueba las métricas por evento del panel y que una nueva inscripción invalida la caché.
+    """
+    cache.clear()
+    attendee = User(email="asistente@example.com", hashed_password="x")
+    events = [
+        Event(name=f"Evento {i}", event_date=date.today() + timedelta(days=10 + i), location="Roma",
+              capacity=4, status=EventStatus.PUBLISHED, organizer_id=test_user.id)
+        for i in range(2)
+    ]
+    session.add_all([attendee, *events])
+    session.commit()
+    start = datetime.now() + timedelta(days=10)
+    session.add(EventSession(name="Apertura", start_time=start, end_time=start + timedelta(hours=1),
+                             capacity=4, event_id=events[0].id, speaker_id=test_user.id))
+    session.add(Registration(user_id=test_user.id, event_id=events[0].id))
+    session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(test_user.id)}"}
+
+    dashboard = client.get("/api/v1/events/dashboard", headers=headers).json()
+
+    assert (dashboard["total_events"], dashboard["total_registrations"]) == (2, 1)
+    first, second = dashboard["events"]
+    assert (first["registrations"], first["fill_ratio"], first["sessions"]) == (1, 0.25, 1)
+    assert first["last_registration_at"] is not None
+    assert (second["registrations"], second["sessions"], second["last_registration_at"]) == (0, 0, None)
+
+    RegisterForEvent(RegistrationRepository(session), EventRepository(session)).execute(attendee.id, events[0].id)
+    dashboard = client.get("/api/v1/events/dashboard", headers=headers).json()
+
+    assert dashboard["total_registrations"] == 2
+    assert dashboard["events"][0]["fill_ratio"] == 0.5
+    cache.clear()
@@ -0,0 +1,75 @@
+# app/tests/functional/test_read_replica.py
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.core.cache import cache
+from app.database import connection
+from app.models.envent import Event, EventStatus
+from app.models.user import User
+
+
+@pytest.fixture(name="replica_engine")
+def replica_engine_fixture(monkeypatch, tmp_path):
+    """
+    Usa una segunda base SQLite como réplica con un evento que solo existe en ella.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as replica_session:
+        organizer = User(email="replica@example.com", hashed_password="x")
+        replica_session.add(organizer)
+        replica_session.commit()
+        replica_session.add(Event(
+            name="Solo en la réplica",
+            event_date=date.today() + timedelta(days=7),
+            location="Réplica",
+            capacity=10,
+            status=EventStatus.PUBLISHED,
+            organizer_id=organizer.id,
+        ))
+        replica_session.commit()
+    monkeypatch.setattr(connection, "read_engine", engine)
+    yield engine
+    engine.dispose()
+
+
+def test_get_endpoints_read_from_replica(client: TestClient, replica_engine):
+    """
+    Prueba que los GET del catálogo se sirven desde la réplica.
+    """
+    response = client.get("/api/v1/events/all")
+
+    assert response.status_code == 200
+    assert [event["name"] for event in response.json()] == ["Solo en la réplica"]
+
+
+def test_reads_go_to_primary_right_after_a_write(client: TestClient, replica_engine):
+    """
+    Prueba que tras una escritura el mismo cliente lee del primario (read-your-writes).
+    """
+    response = client.post("/api/v1/users/", json={"email": "writer@example.com", "password": "Password123"})
+    assert response.status_code == 201
+    assert "last_write_at" in response.cookies
+
+    response = client.get("/api/v1/events/all")
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_cached_calendar_is_built_from_primary(client: TestClient, replica_engine):
+    """
+    Prueba que el calendario cacheado se calcula en el primario y no guarda los datos
+    de una réplica que puede ir retrasada.
+    """
+    cache.clear()
+    in_a_week = date.today() + timedelta(days=7)
+
+    response = client.get("/api/v1/events/calendar", params={"year": in_a_week.year, "month": in_a_week.month})
+    cache.clear()
+
+    assert response.status_code == 200
+    assert response.json() == []
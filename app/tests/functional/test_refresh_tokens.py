@@ -0,0 +1,64 @@
+# app/tests/functional/test_refresh_tokens.py
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.revocation import RevocationList
+from app.models.user import User
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+
+
+def _login(client: TestClient, user: User) -> dict:
+    login_data = {"username": user.email, "password": "testpassword"}
+    return client.post("/api/v1/login/access-token", data=login_data).json()
+
+
+def _refresh(client: TestClient, refresh_token: str):
+    return client.post("/api/v1/login/refresh-token", headers={"Cookie": f"refresh_token={refresh_token}"})
+
+
+def test_refresh_token_rotates_and_cannot_be_reused(client: TestClient, test_user: User):
+    """
+    Prueba que cada refresh devuelve un par nuevo y que el refresh token usado queda revocado.
+    """
+    tokens = _login(client, test_user)
+
+    response = _refresh(client, tokens["refresh_token"])
+    assert response.status_code == 200
+    rotated = response.json()
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+
+    reused = _refresh(client, tokens["refresh_token"])
+    assert reused.status_code == 401
+    assert reused.json()["detail"] == "Refresh token has been revoked"
+    assert _refresh(client, rotated["refresh_token"]).status_code == 200
+
+
+def test_logout_revokes_refresh_token(client: TestClient, test_user: User):
+    """
+    Prueba que tras /logout el refresh token ya no sirve y que no se acepta como access token.
+    """
+    tokens = _login(client, test_user)
+    assert client.get("/api/v1/users/me", headers={"Authorization": f"Bearer {tokens['refresh_token']}"}).status_code == 401
+
+    client.post("/api/v1/logout", headers={"Cookie": f"refresh_token={tokens['refresh_token']}"})
+
+    assert _refresh(client, tokens["refresh_token"]).status_code == 401
+
+
+def test_revocation_list_syncs_revocations_from_other_replicas(session: Session, test_user: User):
+    """
+    Prueba que una réplica incorpora las revocaciones guardadas por otra en la tabla compartida.
+    """
+    store = RevokedTokenRepository(session)
+    replica = RevocationList()
+    replica.sync(store)
+    store.revoke("jti-otra-replica", test_user.id, datetime.utcnow() + timedelta(days=1))
+    store.revoke("jti-expirado", test_user.id, datetime.utcnow() - timedelta(seconds=1))
+
+    replica.sync(store)
+
+    assert replica.is_revoked("jti-otra-replica")
+    assert not replica.is_revoked("jti-expirado")
+    assert store.revoke("jti-otra-replica", test_user.id, datetime.utcnow()) is False
@@ -0,0 +1,103 @@
+# app/tests/functional/test_session_registrations.py
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlmodel import Session
+
+from app.core.security import create_access_token
+from app.models.envent import Event, EventStatus
+from app.models.registration import Registration
+from app.models.session import Session as EventSession
+from app.models.user import User
+from app.repositories.session_repository import SessionRepository
+from app.schemas.session import SessionUpdate
+
+
+def _event_with_sessions(session: Session, organizer: User):
+    event = Event(name="Congreso", event_date=date.today() + timedelta(days=3), location="Quito", capacity=100,
+                  status=EventStatus.PUBLISHED, organizer_id=organizer.id)
+    session.add(event)
+    session.commit()
+    start = datetime.combine(event.event_date, datetime.min.time()).replace(hour=9)
+    workshop = EventSession(name="Taller", start_time=start, end_time=start + timedelta(hours=2), capacity=1,
+                            event_id=event.id, speaker_id=organizer.id)
+    talk = EventSession(name="Charla", start_time=start + timedelta(hours=1), end_time=start + timedelta(hours=3),
+                        capacity=50, event_id=event.id, speaker_id=organizer.id)
+    session.add_all([workshop, talk])
+    session.commit()
+    return event, workshop, talk
+
+
+def test_session_booking_rules_and_seat_counter(client: TestClient, session: Session, test_user: User):
+    """
+    Prueba que reservar exige inscripción en el evento, respeta el aforo y los solapamientos,
+    y que el contador de plazas sigue a las reservas y cancelaciones.
+    """
+    event, workshop, talk = _event_with_sessions(session, test_user)
+    other = User(email="otra@example.com", hashed_password="x")
+    session.add(other)
+    session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(test_user.id)}"}
+    other_headers = {"Authorization": f"Bearer {create_access_token(other.id)}"}
+
+    not_registered = client.post(f"/api/v1/session/{workshop.id}/register", headers=headers)
+    assert not_registered.status_code == 400
+    assert "registered for the event" in not_registered.json()["detail"]
+
+    session.add_all([Registration(user_id=test_user.id, event_id=event.id), Registration(user_id=other.id, event_id=event.id)])
+    session.commit()
+
+    booked = client.post(f"/api/v1/session/{workshop.id}/register", headers=headers)
+    assert booked.status_code == 201
+    assert booked.json()["session_id"] == workshop.id
+    assert client.get(f"/api/v1/session/{workshop.id}").json()["seats_taken"] == 1
+
+    full = client.post(f"/api/v1/session/{workshop.id}/register", headers=other_headers)
+    assert (full.status_code, full.json()["detail"]) == (400, "Session is full")
+
+    overlap = client.post(f"/api/v1/session/{talk.id}/register", headers=headers)
+    assert overlap.status_code == 400
+    assert f"booked session {workshop.id}" in overlap.json()["detail"]
+
+    assert [item["session_id"] for item in client.get("/api/v1/user/session-registrations", headers=headers).json()] == [workshop.id]
+
+    assert client.delete(f"/api/v1/session/{workshop.id}/register", headers=headers).status_code == 204
+    assert client.get(f"/api/v1/session/{workshop.id}").json()["seats_taken"] == 0
+    assert client.post(f"/api/v1/session/{workshop.id}/register", headers=other_headers).status_code == 201
+
+    # Una segunda cancelación no encuentra la reserva y no libera la plaza ocupada por otro
+    assert client.delete(f"/api/v1/session/{workshop.id}/register", headers=headers).status_code == 404
+    assert client.get(f"/api/v1/session/{workshop.id}").json()["seats_taken"] == 1
+
+
+def test_cancelling_event_registration_releases_session_seats(client: TestClient, session: Session, test_user: User):
+    """
+    Prueba que al cancelar la inscripción en el evento se liberan las plazas de sus sesiones.
+    """
+    event, workshop, _ = _event_with_sessions(session, test_user)
+    session.add(Registration(user_id=test_user.id, event_id=event.id))
+    session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(test_user.id)}"}
+    assert client.post(f"/api/v1/session/{workshop.id}/register", headers=headers).status_code == 201
+
+    assert client.delete(f"/api/v1/event/{event.id}/register", headers=headers).status_code == 204
+
+    assert client.get(f"/api/v1/session/{workshop.id}").json()["seats_taken"] == 0
+    assert client.get("/api/v1/user/session-registrations", headers=headers).json() == []
+
+
+def test_capacity_below_concurrently_booked_seats_is_rejected(session: Session, test_user: User):
+    """
+    Prueba que bajar la capacidad por debajo de plazas reservadas después de leer la sesión
+    se rechaza como error de validación y no como error interno.
+    """
+    _, _, talk = _event_with_sessions(session, test_user)
+    loaded = session.get(EventSession, talk.id)
+    # Reserva concurrente que la sesión ya cargada no ve
+    session.execute(update(EventSession).where(EventSession.id == talk.id).values(seats_taken=5).execution_options(synchronize_session=False))
+
+    with pytest.raises(ValueError, match="booked seats"):
+        SessionRepository(session).update_session(loaded, SessionUpdate(capacity=3))
+    assert session.get(EventSession, talk.id).capacity == 50
@@ -0,0 +1,64 @@
+# app/tests/functional/test_sparse_fields.py
+from datetime import date, datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.database.query_plans import capture_statements
+from app.models.envent import Event, EventStatus
+from app.models.session import Session as EventSession
+from app.models.user import User
+
+
+def test_catalog_returns_only_requested_fields(client: TestClient, session: Session, test_user: User):
+    """
+    Prueba que `fields` recorta el JSON y que la consulta solo lee las columnas pedidas.
+    """
+    session.add_all([
+        Event(name=f"Evento {i}", description="Descripción larga " * 50, event_date=date.today() + timedelta(days=i + 1),
+              location="Bogotá", capacity=50, status=EventStatus.PUBLISHED, organizer_id=test_user.id)
+        for i in range(3)
+    ])
+    session.commit()
+
+    full = client.get("/api/v1/events/all")
+    with capture_statements(session.get_bind()) as captured:
+        response = client.get("/api/v1/events/all?fields=name,event_date,image_url")
+
+    assert response.status_code == 200
+    events = response.json()
+    assert [set(event) for event in events] == [{"id", "name", "event_date", "image_url"}] * 3
+    assert events[0]["name"] == full.json()[0]["name"]
+    assert events[0]["event_date"] == full.json()[0]["event_date"]
+    assert len(response.content) < len(full.content) / 5
+    statement = next(statement for statement, _ in captured if "FROM event" in statement)
+    assert "description" not in statement.split("FROM")[0]
+
+
+def test_unknown_fields_are_rejected(client: TestClient):
+    """
+    Prueba que un campo que no existe en la respuesta devuelve 400 con los campos válidos.
+    """
+    response = client.get("/api/v1/events/all?fields=name,password")
+
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
+
+
+def test_sessions_return_only_requested_fields(client: TestClient, session: Session, test_user: User):
+    """
+    Prueba `fields` en el listado de sesiones de un evento.
+    """
+    event = Event(name="Evento", event_date=date.today() + timedelta(days=1), location="Bogotá", capacity=50,
+                  status=EventStatus.PUBLISHED, organizer_id=test_user.id)
+    session.add(event)
+    session.commit()
+    start = datetime.combine(event.event_date, datetime.min.time()).replace(hour=9)
+    session.add(EventSession(name="Apertura", start_time=start, end_time=start + timedelta(hours=1), capacity=50,
+                             event_id=event.id, speaker_id=test_user.id))
+    session.commit()
+
+    response = client.get(f"/api/v1/sessions/{event.id}?fields=name,start_time")
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": 1, "name": "Apertura", "start_time": start.isoformat()}]
@@ -0,0 +1,105 @@
+# app/tests/functional/test_trending_events.py
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.cache import cache
+from app.models.envent import Event, EventStatus
+from app.models.user import User
+from app.repositories.event_repository import EventRepository
+from app.repositories.registration import RegistrationRepository
+from app.repositories.session_registration_repository import SessionRegistrationRepository
+from app.models.event_popularity import DEFAULT_POPULARITY_EPOCH, EventPopularity
+from app.use_cases.event.popularity import POPULARITY_HALF_LIFE, decayed_score, registration_weight
+from app.use_cases.event.rebase_popularity import RebasePopularityUseCase
+from app.use_cases.registrations.cancel_registration import CancelRegistration
+from app.use_cases.registrations.register_for_events import RegisterForEvent
+
+
+def test_decayed_score_halves_every_half_life():
+    """
+    Prueba que una inscripción vale 1 al hacerse y la mitad tras cada vida media.
+    """
+    now = datetime(2026, 10, 1)
+    epoch = DEFAULT_POPULARITY_EPOCH
+    stored = registration_weight(now, epoch) + registration_weight(now - POPULARITY_HALF_LIFE, epoch)
+
+    assert decayed_score(stored, now, epoch) == 1.5
+    assert decayed_score(stored, now + POPULARITY_HALF_LIFE, epoch) == 0.75
+
+
+def test_trending_ranks_published_events_by_registrations(client: TestClient, session: Session, test_user: User):
+    """
+    Prueba que el ranking sigue a las inscripciones y cancelaciones, excluye los no publicados
+    y se sirve desde memoria hasta que expira.
+    """
+    cache.clear()
+    users = [User(email=f"asistente{i}@example.com", hashed_password="x") for i in range(3)]
+    events = [
+        Event(name=f"Evento {i}", event_date=date.today() + timedelta(days=10), location="Cali", capacity=10,
+              status=EventStatus.PUBLISHED, organizer_id=test_user.id)
+        for i in range(2)
+    ]
+    draft = Event(name="Borrador", event_date=date.today() + timedelta(days=10), location="Cali", capacity=10,
+                  status=EventStatus.DRAFT, organizer_id=test_user.id)
+    session.add_all([*users, *events, draft])
+    session.commit()
+    register = RegisterForEvent(RegistrationRepository(session), EventRepository(session))
+    for user in users:
+        register.execute(user.id, events[1].id)
+        register.execute(user.id, draft.id)
+    register.execute(users[0].id, events[0].id)
+
+    trending = client.get("/api/v1/events/trending").json()
+    assert [item["event"]["id"] for item in trending] == [events[1].id, events[0].id]
+    assert round(trending[0]["score"]) == 3
+
+    cancel = CancelRegistration(RegistrationRepository(session), EventRepository(session), SessionRegistrationRepository(session))
+    cancel.execute(users[0].id, events[1].id)
+    # Repetir la cancelación no borra nada y no vuelve a restar la popularidad
+    score = session.get(EventPopularity, events[1].id).score
+    with pytest.raises(ValueError, match="not registered"):
+        cancel.execute(users[0].id, events[1].id)
+    session.expire_all()
+    assert session.get(EventPopularity, events[1].id).score == score
+    assert client.get("/api/v1/events/trending").json() == trending
+
+    cache.clear()
+    trending = client.get("/api/v1/events/trending?limit=1").json()
+    assert [item["event"]["id"] for item in trending] == [events[1].id]
+    assert round(trending[0]["score"]) == 2
+
+
+def test_rebase_moves_epoch_without_changing_ranking(client: TestClient, session: Session, test_user: User):
+    """
+    Prueba que el rebase adelanta la época y reescala las puntuaciones sin alterar las decaídas,
+    y que las inscripciones posteriores usan la nueva época.
+    """
+    cache.clear()
+    users = [User(email=f"asistente{i}@example.com", hashed_password="x") for i in range(2)]
+    event = Event(name="Evento", event_date=date.today() + timedelta(days=10), location="Cali", capacity=10,
+                  status=EventStatus.PUBLISHED, organizer_id=test_user.id)
+    session.add_all([*users, event])
+    session.commit()
+    register = RegisterForEvent(RegistrationRepository(session), EventRepository(session))
+    register.execute(users[0].id, event.id)
+    stored = session.get(EventPopularity, event.id).score
+    before = client.get("/api/v1/events/trending").json()
+
+    repo = EventRepository(session)
+    now = datetime.utcnow()
+    assert RebasePopularityUseCase(repo).execute(now) == 1
+    epoch = repo.get_popularity_epoch()
+    assert now - POPULARITY_HALF_LIFE < epoch <= now
+    session.refresh(session.get(EventPopularity, event.id))
+    assert session.get(EventPopularity, event.id).score == stored / registration_weight(epoch, DEFAULT_POPULARITY_EPOCH)
+    assert RebasePopularityUseCase(repo).execute(now) == 0
+
+    cache.clear()
+    assert client.get("/api/v1/events/trending").json()[0]["score"] == before[0]["score"]
+    register.execute(users[1].id, event.id)
+    cache.clear()
+    assert round(client.get("/api/v1/events/trending").json()[0]["score"]) == 2
+
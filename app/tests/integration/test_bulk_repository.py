@@ -0,0 +1,46 @@
+# app/tests/integration/test_bulk_repository.py
+from sqlmodel import Session, select
+
+from app.models.user import User
+from app.repositories.user_repository import UserRepository
+
+
+def _users(*emails: str):
+    return [User(email=email, hashed_password="x") for email in emails]
+
+
+def test_create_update_and_delete_many(session: Session):
+    """
+    Prueba las operaciones en lote con tandas más pequeñas que el número de filas.
+    """
+    repo = UserRepository(session)
+    repo.batch_size = 2
+
+    created = repo.create_many(_users("a@example.com", "b@example.com", "c@example.com"))
+    assert [user.email for user in created] == ["a@example.com", "b@example.com", "c@example.com"]
+    assert all(user.id for user in created)
+
+    updated = repo.update_many({created[0].id: {"is_active": False}, created[2].id: {"is_superuser": True, "unknown": 1}})
+    assert {(user.email, user.is_active, user.is_superuser) for user in updated} == {
+        ("a@example.com", False, False), ("c@example.com", True, True),
+    }
+
+    deleted = repo.delete_many([created[0].id, created[1].id])
+    assert {user.email for user in deleted} == {"a@example.com", "b@example.com"}
+    assert session.exec(select(User.email)).all() == ["c@example.com"]
+
+
+def test_upsert_by_unique_field(session: Session):
+    """
+    Prueba que upsert inserta las filas nuevas y actualiza las existentes por email.
+    """
+    repo = UserRepository(session)
+    existing = repo.create(User(email="a@example.com", hashed_password="old"))
+
+    users = _users("a@example.com", "b@example.com")
+    upserted = repo.upsert(users, index_elements=["email"], update_fields=["hashed_password"])
+
+    assert [user.email for user in upserted] == ["a@example.com", "b@example.com"]
+    assert upserted[0].id == existing.id
+    assert existing.hashed_password == "x"
+    assert len(session.exec(select(User)).all()) == 2
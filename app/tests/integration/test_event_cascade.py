@@ -0,0 +1,36 @@
+# app/tests/integration/test_event_cascade.py
+from datetime import date, datetime, timedelta
+
+from sqlmodel import Session, select
+
+from app.database.query_plans import capture_statements
+from app.models.envent import Event
+from app.models.registration import Registration
+from app.models.session import Session as EventSession
+from app.models.user import User
+from app.repositories.event_repository import EventRepository
+
+
+def test_delete_event_cascades_in_the_database(session: Session, test_user: User):
+    """
+    Prueba que eliminar un evento borra sus sesiones e inscripciones sin cargarlas en el ORM.
+    """
+    attendees = [User(email=f"asistente{i}@example.com", hashed_password="x") for i in range(50)]
+    event = Event(name="Congreso", event_date=date.today() + timedelta(days=5), location="París",
+                  capacity=100, organizer_id=test_user.id)
+    session.add_all([event, *attendees])
+    session.commit()
+    start = datetime.now() + timedelta(days=5)
+    session.add_all([Registration(user_id=attendee.id, event_id=event.id) for attendee in attendees])
+    session.add(EventSession(name="Plenaria", start_time=start, end_time=start + timedelta(hours=1),
+                             capacity=100, event_id=event.id, speaker_id=test_user.id))
+    session.commit()
+    session.expunge_all()
+    event = session.get(Event, event.id)
+
+    with capture_statements(session.get_bind()) as selects:
+        EventRepository(session).delete_event(event)
+
+    assert selects == []
+    assert session.exec(select(Registration)).all() == []
+    assert session.exec(select(EventSession)).all() == []
@@ -0,0 +1,78 @@
+# app/tests/integration/test_outbox_worker.py
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+from sqlmodel import Session, select
+
+from app.database.unit_of_work import unit_of_work
+
+from app.models.outbox import OutboxMessage, OutboxStatus
+from app.repositories.event_repository import EventRepository
+from app.schemas.event import EventCreate
+from app.workers.outbox_worker import HANDLERS, OutboxWorker
+
+
+def _create_event(session: Session, organizer_id: int):
+    event_in = EventCreate(name="Feria", event_date=date.today() + timedelta(days=3), location="Madrid", capacity=10)
+    return EventRepository(session).create_event(event_in, organizer_id, image="static/events/feria.png")
+
+
+def test_event_write_enqueues_message_in_same_transaction(session: Session, test_user):
+    """
+    Prueba que el mensaje del outbox solo existe si se confirma el cambio que lo origina.
+    """
+    with pytest.raises(RuntimeError):
+        with unit_of_work(session):
+            _create_event(session, test_user.id)
+            raise RuntimeError("falla un paso posterior de la misma transacción")
+    assert session.exec(select(OutboxMessage)).all() == []
+
+    event = _create_event(session, test_user.id)
+    message = session.exec(select(OutboxMessage)).one()
+    assert (message.topic, message.payload["event_id"], message.status) == ("event.created", event.id, OutboxStatus.PENDING)
+
+
+def test_worker_retries_with_backoff_and_gives_up(monkeypatch, session: Session, test_user):
+    """
+    Prueba que un manejador que falla se reintenta y que tras el máximo de intentos el mensaje queda fallido.
+    """
+    calls = []
+
+    def flaky(payload):
+        calls.append(payload["event_id"])
+        raise RuntimeError("smtp down")
+
+    monkeypatch.setitem(HANDLERS, "event.created", [flaky])
+    event = _create_event(session, test_user.id)
+    worker = OutboxWorker(session.get_bind(), max_attempts=2)
+    worker.backoff = lambda attempts: timedelta(0)
+
+    assert asyncio.run(worker.run_once()) == 1
+    message = session.exec(select(OutboxMessage).execution_options(populate_existing=True)).one()
+    assert (message.status, message.attempts, message.last_error) == (OutboxStatus.PENDING, 1, "RuntimeError('smtp down')")
+
+    assert asyncio.run(worker.run_once()) == 1
+    session.refresh(message)
+    assert (message.status, message.attempts) == (OutboxStatus.FAILED, 2)
+    assert asyncio.run(worker.run_once()) == 0
+    assert calls == [event.id, event.id]
+
+
+def test_worker_marks_handled_messages_processed(monkeypatch, session: Session, test_user):
+    """
+    Prueba que los mensajes con manejadores correctos (o sin manejador) quedan procesados.
+    """
+    handled = []
+
+    async def notify(payload):
+        handled.append(payload["event_id"])
+
+    monkeypatch.setitem(HANDLERS, "event.created", [notify])
+    event = _create_event(session, test_user.id)
+    EventRepository(session).delete_event(event)
+
+    assert asyncio.run(OutboxWorker(session.get_bind()).run_once()) == 2
+    statuses = session.exec(select(OutboxMessage.topic, OutboxMessage.status).order_by(OutboxMessage.id)).all()
+    assert statuses == [("event.created", OutboxStatus.PROCESSED), ("event.deleted", OutboxStatus.PROCESSED)]
+    assert handled == [event.id]
@@ -0,0 +1,37 @@
+# app/tests/integration/test_query_plans.py
+from datetime import date
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+from app.database.query_plans import check_access_paths
+from app.models.envent import Event
+from app.models.registration import Registration
+
+
+def test_hot_queries_use_their_indexes(session: Session):
+    """
+    Verifica con EXPLAIN QUERY PLAN que las consultas de los repositorios usan los índices esperados.
+    """
+    results = check_access_paths(session)
+
+    assert results
+    for result in results:
+        assert result.uses_index, f"{result.name} no usa {result.index_name}:\n{result.plan}"
+
+
+def test_registration_is_unique_per_user_and_event(session: Session, test_user):
+    """
+    Prueba que la restricción única impide registrar dos veces al mismo usuario en un evento.
+    """
+    event = Event(name="Evento", event_date=date.today(), location="Sala", capacity=10, organizer_id=test_user.id)
+    session.add(event)
+    session.commit()
+    session.add(Registration(user_id=test_user.id, event_id=event.id))
+    session.commit()
+
+    session.add(Registration(user_id=test_user.id, event_id=event.id))
+    with pytest.raises(IntegrityError):
+        session.commit()
+    session.rollback()
@@ -0,0 +1,28 @@
+# app/tests/integration/test_registration_repository.py
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+from app.models.envent import Event
+from app.models.user import User
+from app.repositories.registration import RegistrationRepository
+
+
+def test_only_unique_violation_is_reported_as_duplicate(session: Session, test_user: User):
+    """
+    Prueba que solo la restricción única se traduce en "ya inscrito"; un evento inexistente
+    (clave foránea) sigue siendo un error de integridad.
+    """
+    event = Event(name="Congreso", event_date=date.today() + timedelta(days=5), location="Lima",
+                  capacity=10, organizer_id=test_user.id)
+    session.add(event)
+    session.commit()
+    repo = RegistrationRepository(session)
+    repo.create_registration(test_user.id, event.id)
+
+    with pytest.raises(ValueError, match="already registered"):
+        repo.create_registration(test_user.id, event.id)
+    with pytest.raises(IntegrityError):
+        repo.create_registration(test_user.id, event.id + 1000)
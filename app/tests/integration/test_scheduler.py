@@ -0,0 +1,70 @@
+# app/tests/integration/test_scheduler.py
+import asyncio
+from datetime import date, datetime, timedelta
+
+from sqlmodel import Session, select
+
+from app.core.cache import cache
+from app.models.envent import Event, EventStatus
+from app.models.event_change import EventChange
+from app.models.job_run import JobRun
+from app.models.outbox import OutboxMessage, OutboxStatus
+from app.use_cases.event.cache import calendar_cache_key
+from app.workers.scheduler import JOBS, Scheduler
+
+
+def test_complete_past_events_runs_once_per_interval(session: Session, test_user):
+    """
+    Prueba que la tarea completa solo los eventos publicados pasados, invalida el calendario,
+    anota las filas modificadas y no se repite en el mismo intervalo (otra réplica).
+    """
+    today = date.today()
+    past = [
+        Event(name=f"Pasado {i}", event_date=today - timedelta(days=i + 1), location="Quito", capacity=5,
+              status=EventStatus.PUBLISHED, organizer_id=test_user.id)
+        for i in range(3)
+    ]
+    draft = Event(name="Borrador", event_date=today - timedelta(days=1), location="Quito", capacity=5,
+                  organizer_id=test_user.id)
+    upcoming = Event(name="Próximo", event_date=today + timedelta(days=1), location="Quito", capacity=5,
+                     status=EventStatus.PUBLISHED, organizer_id=test_user.id)
+    session.add_all([*past, draft, upcoming])
+    session.commit()
+    month = today - timedelta(days=1)
+    cache.set(calendar_cache_key(month.year, month.month), [])
+    job = JOBS["complete_past_events"]
+    scheduler = Scheduler(session.get_bind(), [job])
+
+    assert asyncio.run(scheduler.run_job(job)) == 3
+    assert asyncio.run(scheduler.run_job(job)) is None
+
+    session.expire_all()
+    statuses = {event.name: event.status for event in session.exec(select(Event)).all()}
+    assert statuses == {"Pasado 0": EventStatus.COMPLETED, "Pasado 1": EventStatus.COMPLETED,
+                        "Pasado 2": EventStatus.COMPLETED, "Borrador": EventStatus.DRAFT,
+                        "Próximo": EventStatus.PUBLISHED}
+    assert sorted(change.event_id for change in session.exec(select(EventChange)).all()) == sorted(e.id for e in past)
+    assert cache.get(calendar_cache_key(month.year, month.month)) is None
+    run = session.exec(select(JobRun)).one()
+    assert (run.job_name, run.rows_affected, run.error) == ("complete_past_events", 3, None)
+    assert run.finished_at is not None
+
+
+def test_purge_processed_outbox_keeps_recent_pending_and_failed(session: Session):
+    """
+    Prueba que solo se borran los mensajes procesados fuera del plazo de retención.
+    """
+    old = datetime.utcnow() - timedelta(days=30)
+    messages = {
+        "antiguo": OutboxMessage(topic="antiguo", status=OutboxStatus.PROCESSED, processed_at=old),
+        "reciente": OutboxMessage(topic="reciente", status=OutboxStatus.PROCESSED, processed_at=datetime.utcnow()),
+        "pendiente": OutboxMessage(topic="pendiente", created_at=old),
+        "fallido": OutboxMessage(topic="fallido", status=OutboxStatus.FAILED, created_at=old),
+    }
+    session.add_all(messages.values())
+    session.commit()
+
+    assert JOBS["purge_processed_outbox"].func(session) == 1
+
+    session.expire_all()
+    assert sorted(message.topic for message in session.exec(select(OutboxMessage)).all()) == ["fallido", "pendiente", "reciente"]
@@ -0,0 +1,72 @@
+# app/tests/unit/core/test_idempotency.py
+import asyncio
+
+from starlette.requests import HTTPConnection
+
+from app.core.idempotency import IdempotencyMiddleware, RequestFingerprint
+from app.core.security import create_access_token
+
+
+def _scope(headers):
+    return {
+        "type": "http", "method": "POST", "path": "/api/v1/event/1/register", "query_string": b"",
+        "headers": [(name.encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()],
+    }
+
+
+def test_duplicates_take_over_in_turn_after_failed_original(monkeypatch):
+    """
+    Prueba que, si la petición original no guarda respuesta (5xx), de los duplicados que
+    la esperaban solo uno se ejecuta y el resto recibe su respuesta.
+    """
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(len(calls))
+        await asyncio.sleep(0.05)
+        status = 500 if len(calls) == 1 else 201
+        await send({"type": "http.response.start", "status": status, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    middleware = IdempotencyMiddleware(app)
+    monkeypatch.setattr(middleware, "_claim", lambda *args: True)
+    monkeypatch.setattr(middleware, "_complete", lambda *args: None)
+    monkeypatch.setattr(middleware, "_release", lambda *args: None)
+    scope = _scope({"authorization": f"Bearer {create_access_token(1)}", "idempotency-key": "registro-1"})
+
+    async def request():
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+        await middleware(scope, receive, send)
+        return sent[0]["status"]
+
+    async def run():
+        first = asyncio.create_task(request())
+        await asyncio.sleep(0.01)
+        return [await first, *await asyncio.gather(*(request() for _ in range(3)))]
+
+    assert asyncio.run(run()) == [500, 201, 201, 201]
+    assert len(calls) == 2
+    assert middleware._in_flight == {}
+
+
+def test_multipart_fingerprint_ignores_boundary_split_across_chunks():
+    """
+    Prueba que la huella de un multipart no depende del boundary ni de cómo llegue
+    partido el cuerpo.
+    """
+    def fingerprint(boundary, chunk_size):
+        body = f"--{boundary}\r\ncontenido\r\n--{boundary}--\r\n".encode()
+        scope = _scope({"content-type": f"multipart/form-data; boundary={boundary}"})
+        result = RequestFingerprint(scope, HTTPConnection(scope))
+        for start in range(0, len(body), chunk_size):
+            result.update(body[start:start + chunk_size])
+        return result.hexdigest()
+
+    expected = fingerprint("abc123", 1024)
+    assert all(fingerprint(boundary, size) == expected for boundary in ("abc123", "zz99") for size in (1, 3, 5, 7))
@@ -0,0 +1,30 @@
+# app/tests/unit/core/test_lifecycle.py
+import asyncio
+import signal
+
+from app.core import lifecycle as lifecycle_module
+from app.core.lifecycle import Lifecycle
+
+
+def test_shutdown_signal_drains_before_handing_over(monkeypatch):
+    """
+    Prueba que la señal de parada marca el proceso como drenando al momento y solo se pasa
+    a uvicorn, una única vez, cuando terminan las peticiones en curso.
+    """
+    monkeypatch.setattr(lifecycle_module.settings, "SHUTDOWN_READINESS_DELAY_SECONDS", 0)
+    state = Lifecycle()
+    state.ready = True
+    state.in_flight = 1
+    handed_over = []
+
+    async def run():
+        state.on_shutdown_signal(lambda signum, frame: handed_over.append(signum), signal.SIGTERM, None)
+        assert state.draining and not state.ready
+        await asyncio.sleep(0.1)
+        assert handed_over == []
+        state.in_flight = 0
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+
+    assert handed_over == [signal.SIGTERM]
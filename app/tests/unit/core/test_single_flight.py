@@ -0,0 +1,58 @@
+# app/tests/unit/core/test_single_flight.py
+import asyncio
+import threading
+import time
+
+from app.core.single_flight import SingleFlight
+
+
+def test_concurrent_identical_reads_share_one_call():
+    """
+    Prueba que las lecturas simultáneas con la misma clave ejecutan una sola consulta y
+    que una clave distinta o no compartida se ejecuta aparte.
+    """
+    flight = SingleFlight()
+    calls = []
+    lock = threading.Lock()
+
+    def load(value):
+        def fetch():
+            with lock:
+                calls.append(value)
+            time.sleep(0.05)
+            return {"event_id": value}
+        return fetch
+
+    async def run():
+        return await asyncio.gather(
+            *(flight.do(("event_detail", 1), load(1)) for _ in range(20)),
+            flight.do(("event_detail", 2), load(2)),
+            flight.do(("event_detail", 1), load(1), shared=False),
+        )
+
+    results = asyncio.run(run())
+
+    assert results[:20] == [{"event_id": 1}] * 20
+    assert sorted(calls) == [1, 1, 2]
+    assert flight.stats() == {"event_detail": {"executed": 3, "coalesced": 19}}
+
+
+def test_errors_are_shared_and_key_is_released():
+    """
+    Prueba que el error de la consulta llega a todos los que esperaban y que la clave
+    queda libre para la siguiente petición.
+    """
+    flight = SingleFlight()
+
+    def fail():
+        time.sleep(0.02)
+        raise LookupError("Event not found")
+
+    async def run():
+        return await asyncio.gather(*(flight.do(("event_detail", 9), fail) for _ in range(3)), return_exceptions=True)
+
+    errors = asyncio.run(run())
+
+    assert [type(error) for error in errors] == [LookupError] * 3
+    assert asyncio.run(flight.do(("event_detail", 9), lambda: "ok")) == "ok"
+    assert flight.stats()["event_detail"] == {"executed": 2, "coalesced": 2}
@@ -0,0 +1,76 @@
+# app/tests/unit/use_cases/test_session_schedule.py
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.session import Session
+from app.repositories.session_repository import SessionRepository
+from app.schemas.session import SessionCreate, SessionUpdate
+from app.use_cases.session.create_session import CreateSessionUseCase
+from app.use_cases.session.update_session import UpdateSessionUseCase
+
+
+def _session(id: int, start: datetime, hours: int = 1) -> Session:
+    return Session(
+        id=id, name=f"Sesión {id}", start_time=start, end_time=start + timedelta(hours=hours),
+        capacity=10, event_id=1, speaker_id=1, created_at=start, updated_at=start,
+    )
+
+
+def test_create_session_rejects_overlap():
+    """
+    Prueba que no se crea una sesión que se solapa con otra del mismo speaker o evento.
+    """
+    mock_repo = MagicMock(spec=SessionRepository)
+    start = datetime.now() + timedelta(days=1)
+    mock_repo.find_overlapping_sessions.return_value = [_session(7, start)]
+    use_case = CreateSessionUseCase(mock_repo)
+
+    session_in = SessionCreate(
+        name="Nueva", start_time=start + timedelta(minutes=30), end_time=start + timedelta(hours=2),
+        capacity=10, event_id=1, speaker_id=1,
+    )
+    with pytest.raises(HTTPException) as excinfo:
+        use_case.execute(session_in)
+
+    assert excinfo.value.status_code == 400
+    assert "overlaps with session 7" in excinfo.value.detail
+    mock_repo.create_session.assert_not_called()
+
+
+def test_update_session_excludes_itself_from_overlap_check():
+    """
+    Prueba que al mover una sesión no se considera conflicto consigo misma.
+    """
+    mock_repo = MagicMock(spec=SessionRepository)
+    start = datetime.now() + timedelta(days=1)
+    existing = _session(3, start)
+    mock_repo.get_session_by_id.return_value = existing
+    mock_repo.find_overlapping_sessions.return_value = []
+    mock_repo.update_session.return_value = existing
+    use_case = UpdateSessionUseCase(mock_repo)
+
+    use_case.execute(3, SessionUpdate(end_time=start + timedelta(hours=2)), current_user_id=1)
+
+    args, kwargs = mock_repo.find_overlapping_sessions.call_args
+    assert args == (start, start + timedelta(hours=2))
+    assert kwargs == {"speaker_id": 1, "event_id": 1, "exclude_session_id": 3}
+    mock_repo.update_session.assert_called_once()
+
+
+@pytest.mark.parametrize("change", [{"event_id": 2}, {"speaker_id": 2}])
+def test_update_session_rejects_moving_to_another_event_or_speaker(change):
+    """
+    Prueba que el ponente no puede mover la sesión a otro evento ni cederla a otro usuario.
+    """
+    mock_repo = MagicMock(spec=SessionRepository)
+    mock_repo.get_session_by_id.return_value = _session(3, datetime.now() + timedelta(days=1))
+    use_case = UpdateSessionUseCase(mock_repo)
+
+    with pytest.raises(HTTPException) as excinfo:
+        use_case.execute(3, SessionUpdate(**change), current_user_id=1)
+
+    assert excinfo.value.status_code == 400
+    mock_repo.update_session.assert_not_called()
@@ -0,0 +1,22 @@
+from datetime import date, timedelta
+from app.repositories.archive_repository import ArchiveRepository
+from app.use_cases.event.cache import invalidate_organizer_dashboard
+
+class ArchiveEventsUseCase:
+    def __init__(self, archive_repo: ArchiveRepository):
+        self.archive_repo = archive_repo
+
+    def execute(self, older_than_days: int, batch_size: int = 500) -> int:
+        """
+        Archiva por lotes los eventos completados o cancelados hace más de `older_than_days` días.
+        Cada lote es una transacción; devuelve el número de eventos archivados.
+        """
+        before = date.today() - timedelta(days=older_than_days)
+        archived = 0
+        while True:
+            events = self.archive_repo.find_archivable_events(before=before, limit=batch_size)
+            if not events:
+                return archived
+            self.archive_repo.archive_events([event_id for event_id, _ in events])
+            invalidate_organizer_dashboard(*{organizer_id for _, organizer_id in events})
+            archived += len(events)
@@ -0,0 +1,24 @@
+from typing import List
+from app.repositories.archive_repository import ArchiveRepository
+from app.schemas.archive import EventArchiveResponse, RegistrationHistoryResponse
+
+class GetHistoryUseCase:
+    def __init__(self, archive_repo: ArchiveRepository):
+        self.archive_repo = archive_repo
+
+    def execute_events_by_organizer(self, organizer_id: int, skip: int = 0, limit: int = 100) -> List[EventArchiveResponse]:
+        events = self.archive_repo.get_archived_events_by_organizer(organizer_id, skip=skip, limit=limit)
+        return [EventArchiveResponse.model_validate(event) for event in events]
+
+    def execute_registrations_by_user(self, user_id: int, skip: int = 0, limit: int = 100) -> List[RegistrationHistoryResponse]:
+        rows = self.archive_repo.get_archived_registrations_by_user(user_id, skip=skip, limit=limit)
+        return [
+            RegistrationHistoryResponse(
+                id=registration.id,
+                user_id=registration.user_id,
+                event_id=registration.event_id,
+                registration_date=registration.registration_date,
+                event=EventArchiveResponse.model_validate(event),
+            )
+            for registration, event in rows
+        ]
@@ -0,0 +1,58 @@
+from app.core.broadcast import broadcaster
+from app.models.envent import Event
+from app.repositories.event_repository import EventRepository
+from app.repositories.registration import RegistrationRepository
+from app.schemas.event import EventAvailability
+from fastapi import HTTPException, status
+
+
+def availability_channel(event_id: int) -> str:
+    return f"event:{event_id}:availability"
+
+
+def build_availability(event: Event, registered: int) -> EventAvailability:
+    return EventAvailability(
+        event_id=event.id,
+        status=event.status,
+        capacity=event.capacity,
+        registered=registered,
+        available=max(event.capacity - registered, 0),
+    )
+
+
+def publish_registrations_changed(event: Event, registration_repo: RegistrationRepository) -> None:
+    """
+    Recalcula la disponibilidad una sola vez tras una inscripción o baja y la difunde
+    a todos los que la observan. Sin observadores no se hace ninguna consulta.
+    """
+    channel = availability_channel(event.id)
+    if broadcaster.has_subscribers(channel):
+        registered = registration_repo.get_event_current_registrations_count(event.id)
+        broadcaster.publish(channel, build_availability(event, registered))
+
+
+def publish_event_changed(event: Event) -> None:
+    """
+    Difunde un cambio de aforo o estado; las inscripciones se toman del último mensaje.
+    """
+    channel = availability_channel(event.id)
+    latest = broadcaster.latest(channel)
+    if latest is not None:
+        broadcaster.publish(channel, build_availability(event, latest.registered))
+
+
+def publish_event_deleted(event_id: int) -> None:
+    broadcaster.close(availability_channel(event_id))
+
+
+class GetEventAvailabilityUseCase:
+    def __init__(self, event_repo: EventRepository, registration_repo: RegistrationRepository):
+        self.event_repo = event_repo
+        self.registration_repo = registration_repo
+
+    def execute(self, event_id: int) -> EventAvailability:
+        event = self.event_repo.get_event_by_id(event_id)
+        if not event:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+        registered = self.registration_repo.get_event_current_registrations_count(event_id)
+        return build_availability(event, registered)
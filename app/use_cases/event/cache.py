@@ -0,0 +1,34 @@
+from datetime import date
+from typing import Optional
+
+from app.core.cache import cache
+
+CALENDAR_TTL_SECONDS = 3600
+DASHBOARD_TTL_SECONDS = 300
+# El ranking no se invalida con cada inscripción: se recalcula al expirar
+TRENDING_TTL_SECONDS = 60
+TRENDING_CACHE_KEY = "events:trending"
+
+
+def calendar_cache_key(year: int, month: int) -> str:
+    return f"events:calendar:{year:04d}-{month:02d}"
+
+
+def dashboard_cache_key(organizer_id: int) -> str:
+    return f"events:dashboard:{organizer_id}"
+
+
+def invalidate_event_caches(*event_dates: Optional[date]) -> None:
+    """
+    Invalida las cachés derivadas de eventos para los meses de las fechas dadas
+    (por ejemplo, la fecha anterior y la nueva de un evento actualizado) y el ranking.
+    """
+    cache.delete(*{calendar_cache_key(d.year, d.month) for d in event_dates if d}, TRENDING_CACHE_KEY)
+
+
+def invalidate_organizer_dashboard(*organizer_ids: Optional[int]) -> None:
+    """
+    Invalida el panel de los organizadores afectados por un cambio en sus eventos,
+    sesiones o inscripciones.
+    """
+    cache.delete(*{dashboard_cache_key(organizer_id) for organizer_id in organizer_ids if organizer_id is not None})
@@ -0,0 +1,23 @@
+from datetime import date
+from typing import Optional
+from app.repositories.event_repository import EventRepository
+from app.use_cases.event.cache import invalidate_event_caches, invalidate_organizer_dashboard
+
+class CompletePastEventsUseCase:
+    def __init__(self, event_repo: EventRepository):
+        self.event_repo = event_repo
+
+    def execute(self, today: Optional[date] = None, batch_size: int = 500) -> int:
+        """
+        Pasa a COMPLETED los eventos publicados cuya fecha ya pasó, por lotes de `batch_size`
+        (una transacción y un UPDATE por lote). Devuelve el número de eventos completados.
+        """
+        today = today or date.today()
+        completed = 0
+        while True:
+            rows = self.event_repo.complete_past_events(today, limit=batch_size)
+            if not rows:
+                return completed
+            invalidate_event_caches(*{event_date for _, _, event_date in rows})
+            invalidate_organizer_dashboard(*{organizer_id for _, organizer_id, _ in rows})
+            completed += len(rows)
@@ -2,6 +2,7 @@ from datetime import datetime
 from app.repositories.event_repository import EventRepository
 from app.schemas.event import EventCreate, EventResponse
 from app.models.envent import Event
+from app.use_cases.event.cache import invalidate_event_caches, invalidate_organizer_dashboard
 from fastapi import HTTPException, status
 
 class CreateEventUseCase:
@@ -13,4 +14,6 @@ class CreateEventUseCase:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Event date cannot be in the past")
 
         event = self.event_repo.create_event(event_in, organizer_id, image)
+        invalidate_event_caches(event.event_date)
+        invalidate_organizer_dashboard(organizer_id)
         return EventResponse.model_validate(event)
\ No newline at end of file
@@ -1,4 +1,6 @@
 from app.repositories.event_repository import EventRepository
+from app.use_cases.event.availability import publish_event_deleted
+from app.use_cases.event.cache import invalidate_event_caches, invalidate_organizer_dashboard
 from fastapi import HTTPException, status
 
 class DeleteEventUseCase:
@@ -13,4 +15,8 @@ class DeleteEventUseCase:
         if event.organizer_id != current_user_id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to delete this event")
 
-        self.event_repo.delete_event(event)
\ No newline at end of file
+        event_date = event.event_date
+        self.event_repo.delete_event(event)
+        invalidate_event_caches(event_date)
+        invalidate_organizer_dashboard(current_user_id)
+        publish_event_deleted(event_id)
\ No newline at end of file
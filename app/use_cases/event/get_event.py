@@ -1,11 +1,27 @@
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence, Union
 from app.repositories.event_repository import EventRepository
-from app.schemas.event import EventResponse
+from app.models.envent import EventStatus
+from app.schemas.event import (
+    EventCalendarDay, EventChangeItem, EventChangesResponse, EventResponse, OrganizerDashboard, OrganizerEventStats,
+    TrendingEvent,
+)
+from app.core.cache import cache
+from app.use_cases.event.cache import (
+    CALENDAR_TTL_SECONDS, DASHBOARD_TTL_SECONDS, TRENDING_CACHE_KEY, TRENDING_TTL_SECONDS, calendar_cache_key, dashboard_cache_key,
+)
+from app.use_cases.event.popularity import TRENDING_MIN_SCORE, decayed_score, registration_weight
 from fastapi import HTTPException, status
 
+# Tamaño del ranking que se mantiene en memoria; las peticiones devuelven un prefijo
+TRENDING_SIZE = 50
+
 class GetEventUseCase:
-    def __init__(self, event_repo: EventRepository):
+    def __init__(self, event_repo: EventRepository, primary_event_repo: Optional[EventRepository] = None):
         self.event_repo = event_repo
+        # Los valores cacheados se recalculan en el primario: una réplica con retraso volvería a
+        # guardar en la caché, durante todo su TTL, datos anteriores a la escritura que la invalidó
+        self.primary_event_repo = primary_event_repo or event_repo
 
     def execute_by_id(self, event_id: int) -> EventResponse:
         event = self.event_repo.get_event_by_id(event_id)
@@ -13,18 +29,100 @@ class GetEventUseCase:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
         return EventResponse.model_validate(event)
 
-    def execute_all_by_user(self, current_user_id: int, skip: int = 0, limit: int = 100) -> List[EventResponse]:
-        events = self.event_repo.get_all_events_by_user(current_user_id=current_user_id, skip=skip, limit=limit)
-        return [EventResponse.model_validate(event) for event in events]
+    def execute_all_by_user(self, current_user_id: int, skip: int = 0, limit: int = 100, date_from: Optional[date] = None, date_to: Optional[date] = None, fields: Optional[Sequence[str]] = None) -> Union[List[EventResponse], List[Dict[str, Any]]]:
+        events = self.event_repo.get_all_events_by_user(current_user_id=current_user_id, skip=skip, limit=limit, date_from=date_from, date_to=date_to, fields=fields)
+        return self._respond(events, fields)
 
-    def execute_search_by_name_by_user(self, name_query: str, current_user_id: int, skip: int = 0, limit: int = 100) -> List[EventResponse]:
-        events = self.event_repo.search_events_by_name_by_user(name_query=name_query, current_user_id=current_user_id, skip=skip, limit=limit)
-        return [EventResponse.model_validate(event) for event in events]
+    def execute_search_by_name_by_user(self, name_query: str, current_user_id: int, skip: int = 0, limit: int = 100, date_from: Optional[date] = None, date_to: Optional[date] = None, fields: Optional[Sequence[str]] = None) -> Union[List[EventResponse], List[Dict[str, Any]]]:
+        events = self.event_repo.search_events_by_name_by_user(name_query=name_query, current_user_id=current_user_id, skip=skip, limit=limit, date_from=date_from, date_to=date_to, fields=fields)
+        return self._respond(events, fields)
     
-    def execute_all(self, skip: int = 0, limit: int = 100) -> List[EventResponse]:
-        events = self.event_repo.get_all_events(skip=skip, limit=limit)
-        return [EventResponse.model_validate(event) for event in events]
+    def execute_all(self, skip: int = 0, limit: int = 100, date_from: Optional[date] = None, date_to: Optional[date] = None, fields: Optional[Sequence[str]] = None) -> Union[List[EventResponse], List[Dict[str, Any]]]:
+        events = self.event_repo.get_all_events(skip=skip, limit=limit, date_from=date_from, date_to=date_to, fields=fields)
+        return self._respond(events, fields)
     
-    def execute_search_by_name(self, name_query: str, skip: int = 0, limit: int = 100) -> List[EventResponse]:
-        events = self.event_repo.search_events_by_name(name_query=name_query, skip=skip, limit=limit)
-        return [EventResponse.model_validate(event) for event in events]
\ No newline at end of file
+    def execute_search_by_name(self, name_query: str, skip: int = 0, limit: int = 100, date_from: Optional[date] = None, date_to: Optional[date] = None, fields: Optional[Sequence[str]] = None) -> Union[List[EventResponse], List[Dict[str, Any]]]:
+        events = self.event_repo.search_events_by_name(name_query=name_query, skip=skip, limit=limit, date_from=date_from, date_to=date_to, fields=fields)
+        return self._respond(events, fields)
+
+    @staticmethod
+    def _respond(events: List[Any], fields: Optional[Sequence[str]]) -> Union[List[EventResponse], List[Dict[str, Any]]]:
+        # Con `fields` el repositorio ya devuelve diccionarios con solo esas columnas
+        if fields is not None:
+            return events
+        return [EventResponse.model_validate(event) for event in events]
+
+    def execute_calendar(self, year: int, month: int) -> List[EventCalendarDay]:
+        """
+        Conteo de eventos publicados por día del mes. Se cachea hasta que cambie un evento de ese mes.
+        """
+        def load() -> List[EventCalendarDay]:
+            first_day = date(year, month, 1)
+            next_month = date(year + month // 12, month % 12 + 1, 1)
+            rows = self.primary_event_repo.count_published_events_by_day(first_day, next_month)
+            return [EventCalendarDay(day=day, events=count) for day, count in rows]
+
+        return cache.get_or_set(calendar_cache_key(year, month), load, ttl=CALENDAR_TTL_SECONDS)
+
+    def execute_trending(self, limit: int = 10) -> List[TrendingEvent]:
+        """
+        Eventos publicados más populares según sus inscripciones recientes. El ranking completo
+        se guarda en memoria y se recalcula, con una consulta sobre el índice de puntuaciones,
+        solo cuando expira.
+        """
+        def load() -> List[TrendingEvent]:
+            now = datetime.utcnow()
+            epoch = self.primary_event_repo.get_popularity_epoch()
+            rows = self.primary_event_repo.get_trending_events(TRENDING_SIZE, min_score=TRENDING_MIN_SCORE * registration_weight(now, epoch))
+            return [
+                TrendingEvent(event=EventResponse.model_validate(event), score=round(decayed_score(score, now, epoch), 4))
+                for event, score in rows
+            ]
+
+        return cache.get_or_set(TRENDING_CACHE_KEY, load, ttl=TRENDING_TTL_SECONDS)[:limit]
+
+    def execute_changes(self, since: int, limit: int = 500) -> EventChangesResponse:
+        """
+        Cambios del catálogo público desde el cursor. Los eventos eliminados o que dejaron de estar
+        publicados se devuelven como marcas de borrado.
+        """
+        rows = self.event_repo.get_changes(since=since, limit=limit)
+        changes = []
+        for change, event in rows:
+            visible = not change.deleted and event is not None and event.status == EventStatus.PUBLISHED
+            changes.append(EventChangeItem(
+                seq=change.seq,
+                event_id=change.event_id,
+                deleted=not visible,
+                event=EventResponse.model_validate(event) if visible else None,
+            ))
+        next_cursor = rows[-1][0].seq if rows else since
+        return EventChangesResponse(changes=changes, next_cursor=next_cursor, has_more=len(rows) == limit)
+
+    def execute_dashboard(self, organizer_id: int) -> OrganizerDashboard:
+        """
+        Resumen de todos los eventos del organizador. Se cachea hasta que cambie alguno de sus
+        eventos, sesiones o inscripciones.
+        """
+        def load() -> OrganizerDashboard:
+            events = [
+                OrganizerEventStats(
+                    event_id=event.id,
+                    name=event.name,
+                    event_date=event.event_date,
+                    status=event.status,
+                    capacity=event.capacity,
+                    registrations=registrations,
+                    fill_ratio=round(registrations / event.capacity, 4) if event.capacity else 0.0,
+                    sessions=sessions,
+                    last_registration_at=last_registration_at,
+                )
+                for event, registrations, last_registration_at, sessions in self.primary_event_repo.get_organizer_stats(organizer_id)
+            ]
+            return OrganizerDashboard(
+                total_events=len(events),
+                total_registrations=sum(stats.registrations for stats in events),
+                events=events,
+            )
+
+        return cache.get_or_set(dashboard_cache_key(organizer_id), load, ttl=DASHBOARD_TTL_SECONDS)
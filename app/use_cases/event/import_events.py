@@ -0,0 +1,111 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+from pydantic import ValidationError
+from app.database.unit_of_work import unit_of_work
+from app.repositories.event_repository import EventRepository
+from app.schemas.event import EventCreate, EventImportError, EventImportReport
+from app.use_cases.event.cache import invalidate_event_caches, invalidate_organizer_dashboard
+
+IMPORT_BATCH_SIZE = 1000
+IMPORT_FORMATS = {
+    ".csv": "csv", "text/csv": "csv",
+    ".ndjson": "ndjson", ".jsonl": "ndjson", "application/x-ndjson": "ndjson",
+}
+
+def detect_import_format(filename: Optional[str], content_type: Optional[str]) -> str:
+    extension = f".{filename.rsplit('.', 1)[-1].lower()}" if filename and "." in filename else None
+    file_format = IMPORT_FORMATS.get(extension) or IMPORT_FORMATS.get((content_type or "").split(";")[0])
+    if not file_format:
+        raise ValueError("Unsupported file format, expected CSV or NDJSON")
+    return file_format
+
+
+class ImportEventsUseCase:
+    def __init__(self, event_repo: EventRepository, batch_size: int = IMPORT_BATCH_SIZE):
+        self.event_repo = event_repo
+        self.batch_size = batch_size
+
+    def execute(self, file: BinaryIO, file_format: str, organizer_id: int, images: Dict[str, str]) -> EventImportReport:
+        """
+        Valida el archivo fila a fila mientras se lee y carga las filas válidas en lotes.
+        Las filas inválidas no detienen la importación: se devuelven en el informe.
+        La columna `image` admite una URL http(s) o el nombre de una imagen subida junto al archivo.
+        """
+        report = EventImportReport()
+        event_dates = set()
+        today = datetime.now().date()
+        now = datetime.utcnow()
+        batch: List[Dict[str, Any]] = []
+
+        with unit_of_work(self.event_repo.session):
+            for row_number, raw in self._read_rows(file, file_format):
+                row, errors = self._validate(raw, organizer_id, images, today, now)
+                if errors:
+                    report.errors.append(EventImportError(row=row_number, errors=errors))
+                    continue
+                batch.append(row)
+                event_dates.add(row["event_date"].replace(day=1))
+                if len(batch) >= self.batch_size:
+                    report.event_ids.extend(self.event_repo.create_events(batch))
+                    batch = []
+            if batch:
+                report.event_ids.extend(self.event_repo.create_events(batch))
+
+        invalidate_event_caches(*event_dates)
+        invalidate_organizer_dashboard(organizer_id)
+        report.created = len(report.event_ids)
+        report.failed = len(report.errors)
+        return report
+
+    def _read_rows(self, file: BinaryIO, file_format: str) -> Iterator[Tuple[int, Union[Dict[str, Any], str]]]:
+        # Numeración de filas de datos empezando en 1 (sin contar la cabecera del CSV)
+        text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+        if file_format == "csv":
+            for row_number, row in enumerate(csv.DictReader(text), start=1):
+                # Las celdas vacías cuentan como ausentes para que apliquen los valores por defecto
+                yield row_number, {key: value for key, value in row.items() if key and value not in ("", None)}
+            return
+        row_number = 0
+        for line in text:
+            if not line.strip():
+                continue
+            row_number += 1
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield row_number, f"Invalid JSON: {e.msg}"
+                continue
+            yield row_number, row if isinstance(row, dict) else "Each line must be a JSON object"
+
+    def _validate(self, raw: Union[Dict[str, Any], str], organizer_id: int, images: Dict[str, str],
+                  today, now: datetime) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+        if isinstance(raw, str):
+            return None, [raw]
+        try:
+            event_in = EventCreate.model_validate(raw)
+        except ValidationError as e:
+            return None, [f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()]
+
+        errors = []
+        if event_in.event_date < today:
+            errors.append("Event date cannot be in the past")
+        image = raw.get("image") or raw.get("image_url")
+        image = str(image) if image else None
+        if image and not image.startswith(("http://", "https://")) and image not in images:
+            errors.append(f"Image not uploaded: {image}")
+        elif image and len(image) > 500:
+            errors.append("image: String should have at most 500 characters")
+        if errors:
+            return None, errors
+
+        image_url = images.get(image, image) if image else None
+        return {
+            **event_in.model_dump(),
+            "organizer_id": organizer_id,
+            "image_url": image_url,
+            "created_at": now,
+            "updated_at": now,
+        }, []
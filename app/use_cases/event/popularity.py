@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta
+
+# Decaimiento hacia delante: cada inscripción suma 2^((t - época) / HALF_LIFE) a la puntuación
+# guardada. Todas las puntuaciones crecen al mismo ritmo, así que el orden de las guardadas es el
+# de las decaídas y el ranking se lee del índice sin recalcular nada. Para obtener la puntuación
+# decaída (inscripciones "recientes" equivalentes) se divide por el peso del momento actual.
+# Para que los pesos no desborden el float, la tarea rebase_popularity adelanta periódicamente
+# la época (guardada en popularity_epoch) y divide todas las puntuaciones por la misma potencia de 2.
+POPULARITY_HALF_LIFE = timedelta(days=3)
+# Puntuación decaída mínima para aparecer en el ranking; descarta también los restos de coma
+# flotante que quedan cuando se cancelan todas las inscripciones de un evento
+TRENDING_MIN_SCORE = 0.01
+
+
+def registration_weight(at: datetime, epoch: datetime) -> float:
+    """
+    Peso que aporta a la puntuación guardada una inscripción hecha en `at` (UTC).
+    """
+    return 2 ** ((at - epoch) / POPULARITY_HALF_LIFE)
+
+
+def decayed_score(stored_score: float, now: datetime, epoch: datetime) -> float:
+    """
+    Puntuación guardada expresada en el momento `now`: cada inscripción cuenta 1 al hacerse
+    y la mitad por cada vida media transcurrida.
+    """
+    return stored_score / registration_weight(now, epoch)
+
+
+def rebase_half_lives(epoch: datetime, now: datetime) -> int:
+    """
+    Vidas medias completas que se puede adelantar la época sin pasar de `now`.
+    """
+    return max((now - epoch) // POPULARITY_HALF_LIFE, 0)
@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Optional
+from app.database.unit_of_work import unit_of_work
+from app.repositories.event_repository import EventRepository
+from app.use_cases.event.popularity import POPULARITY_HALF_LIFE, rebase_half_lives
+
+class RebasePopularityUseCase:
+    def __init__(self, event_repo: EventRepository):
+        self.event_repo = event_repo
+
+    def execute(self, now: Optional[datetime] = None) -> int:
+        """
+        Adelanta la época de las puntuaciones de popularidad hasta `now` en vidas medias enteras
+        y divide todas las puntuaciones por 2^k en la misma transacción. Dividir por una potencia
+        de 2 es exacto, así que el ranking y las puntuaciones decaídas no cambian.
+        Devuelve el número de puntuaciones reescaladas.
+        """
+        now = now or datetime.utcnow()
+        with unit_of_work(self.event_repo.session):
+            # Bloqueo exclusivo: espera a las inscripciones en curso, que leen la época con uno compartido
+            epoch = self.event_repo.get_popularity_epoch(lock="update")
+            half_lives = rebase_half_lives(epoch, now)
+            if not half_lives:
+                return 0
+            self.event_repo.set_popularity_epoch(epoch + half_lives * POPULARITY_HALF_LIFE)
+            return self.event_repo.scale_popularity(2.0 ** -half_lives)
@@ -2,6 +2,8 @@ from datetime import datetime
 from app.repositories.event_repository import EventRepository
 from app.schemas.event import EventUpdate, EventResponse
 from app.models.envent import EventStatus
+from app.use_cases.event.availability import publish_event_changed
+from app.use_cases.event.cache import invalidate_event_caches, invalidate_organizer_dashboard
 from fastapi import HTTPException, status
 
 class UpdateEventUseCase:
@@ -22,5 +24,9 @@ class UpdateEventUseCase:
         if event.status == EventStatus.COMPLETED and event_update.status and event_update.status != EventStatus.COMPLETED:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot change status from completed")
 
+        previous_date = event.event_date
         updated_event = self.event_repo.update_event(event, event_update)
+        invalidate_event_caches(previous_date, updated_event.event_date)
+        invalidate_organizer_dashboard(updated_event.organizer_id)
+        publish_event_changed(updated_event)
         return EventResponse.model_validate(updated_event)
\ No newline at end of file
@@ -0,0 +1,40 @@
+from app.database.unit_of_work import unit_of_work
+from app.repositories.event_repository import EventRepository
+from app.repositories.registration import RegistrationRepository
+from app.repositories.session_registration_repository import SessionRegistrationRepository
+from app.use_cases.event.availability import publish_registrations_changed
+from app.use_cases.event.cache import invalidate_organizer_dashboard
+from app.use_cases.event.popularity import registration_weight
+
+
+class CancelRegistration:
+    def __init__(
+        self,
+        registration_repository: RegistrationRepository,
+        event_repository: EventRepository,
+        session_registration_repository: SessionRegistrationRepository,
+    ):
+        self.registration_repository: RegistrationRepository = registration_repository
+        self.event_repository: EventRepository = event_repository
+        self.session_registration_repository: SessionRegistrationRepository = session_registration_repository
+
+    def execute(self, user_id: int, event_id: int):
+        with unit_of_work(self.registration_repository.session):
+            event = self.event_repository.get_event_by_id(event_id)
+            if not event:
+                raise ValueError("Event not found")
+
+            # Solo la transacción que borra la fila retira su popularidad: una cancelación
+            # simultánea de la misma inscripción no borra nada y no debe restarla otra vez
+            registration_date = self.registration_repository.delete_registration(user_id, event_id)
+            if registration_date is None:
+                raise ValueError("User is not registered for this event")
+
+            # Sin inscripción en el evento no se conservan las plazas en sus sesiones
+            self.session_registration_repository.delete_session_registrations_for_event(user_id, event_id)
+            # Se retira lo que aportó la inscripción, expresado en la época actual
+            epoch = self.event_repository.get_popularity_epoch(lock="share")
+            self.event_repository.add_popularity(event_id, -registration_weight(registration_date, epoch))
+
+        publish_registrations_changed(event, self.registration_repository)
+        invalidate_organizer_dashboard(event.organizer_id)
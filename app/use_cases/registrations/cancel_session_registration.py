@@ -0,0 +1,13 @@
+from app.database.unit_of_work import unit_of_work
+from app.repositories.session_registration_repository import SessionRegistrationRepository
+from fastapi import HTTPException, status
+
+
+class CancelSessionRegistration:
+    def __init__(self, session_registration_repository: SessionRegistrationRepository):
+        self.session_registration_repository: SessionRegistrationRepository = session_registration_repository
+
+    def execute(self, user_id: int, session_id: int):
+        with unit_of_work(self.session_registration_repository.session):
+            if not self.session_registration_repository.delete_session_registration(user_id, session_id):
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User is not registered for this session")
@@ -0,0 +1,11 @@
+from typing import List
+from app.repositories.session_registration_repository import SessionRegistrationRepository
+from app.schemas.registration import SessionRegistrationResponse
+
+class GetUserSessionRegistrations:
+    def __init__(self, session_registration_repository: SessionRegistrationRepository):
+        self.session_registration_repository = session_registration_repository
+
+    def execute(self, user_id: int) -> List[SessionRegistrationResponse]:
+        registrations = self.session_registration_repository.get_session_registrations_by_user(user_id)
+        return [SessionRegistrationResponse.model_validate(reg) for reg in registrations]
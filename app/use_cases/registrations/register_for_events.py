@@ -1,6 +1,10 @@
+from app.database.unit_of_work import unit_of_work
 from app.repositories.event_repository import EventRepository
 from app.repositories.registration import RegistrationRepository
 from app.repositories.user_repository import UserRepository
+from app.use_cases.event.availability import publish_registrations_changed
+from app.use_cases.event.cache import invalidate_organizer_dashboard
+from app.use_cases.event.popularity import registration_weight
 
 
 class RegisterForEvent:
@@ -9,18 +13,24 @@ class RegisterForEvent:
         self.event_repository: EventRepository = event_repository
 
     def execute(self, user_id: int, event_id: int):
+        # Comprobaciones e inscripción en una sola transacción con un único commit
+        with unit_of_work(self.registration_repository.session):
+            event = self.event_repository.get_event_by_id(event_id)
+            if not event:
+                raise ValueError("Event not found")
 
-        event = self.event_repository.get_event_by_id(event_id)
-        if not event:
-            raise ValueError("Event not found")
+            existing_registration = self.registration_repository.get_registration(user_id, event_id)
+            if existing_registration:
+                raise ValueError("User is already registered for this event")
 
-        existing_registration = self.registration_repository.get_registration(user_id, event_id)
-        if existing_registration:
-            raise ValueError("User is already registered for this event")
+            current_registrations = self.registration_repository.get_event_current_registrations_count(event_id)
+            if current_registrations >= event.capacity:
+                raise ValueError("Event is full")
 
-        current_registrations = self.registration_repository.get_event_current_registrations_count(event_id)
-        if current_registrations >= event.capacity:
-            raise ValueError("Event is full")
+            registration = self.registration_repository.create_registration(user_id, event_id)
+            epoch = self.event_repository.get_popularity_epoch(lock="share")
+            self.event_repository.add_popularity(event_id, registration_weight(registration.registration_date, epoch))
 
-        registration = self.registration_repository.create_registration(user_id, event_id)
+        publish_registrations_changed(event, self.registration_repository)
+        invalidate_organizer_dashboard(event.organizer_id)
         return registration
\ No newline at end of file
@@ -0,0 +1,39 @@
+from app.database.unit_of_work import unit_of_work
+from app.repositories.registration import RegistrationRepository
+from app.repositories.session_registration_repository import SessionRegistrationRepository
+from app.repositories.session_repository import SessionRepository
+
+
+class RegisterForSession:
+    def __init__(
+        self,
+        session_registration_repository: SessionRegistrationRepository,
+        registration_repository: RegistrationRepository,
+        session_repository: SessionRepository,
+    ):
+        self.session_registration_repository: SessionRegistrationRepository = session_registration_repository
+        self.registration_repository: RegistrationRepository = registration_repository
+        self.session_repository: SessionRepository = session_repository
+
+    def execute(self, user_id: int, session_id: int):
+        # La plaza se ocupa al final para mantener el bloqueo de la fila de la sesión lo mínimo posible
+        with unit_of_work(self.session_registration_repository.session):
+            session = self.session_repository.get_session_by_id(session_id)
+            if not session:
+                raise ValueError("Session not found")
+
+            if not self.registration_repository.get_registration(user_id, session.event_id):
+                raise ValueError("User must be registered for the event before booking its sessions")
+
+            self.session_registration_repository.lock_user_bookings(user_id)
+            if self.session_registration_repository.get_session_registration(user_id, session_id):
+                raise ValueError("User is already registered for this session")
+
+            overlapping = self.session_registration_repository.find_overlapping_bookings(user_id, session.start_time, session.end_time)
+            if overlapping:
+                raise ValueError(f"Session overlaps with booked session {overlapping[0].id}")
+
+            if not self.session_registration_repository.take_seat(session_id):
+                raise ValueError("Session is full")
+
+            return self.session_registration_repository.create_session_registration(user_id, session_id)
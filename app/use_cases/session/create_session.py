@@ -1,7 +1,9 @@
-from datetime import datetime, timezone
+from datetime import datetime
 from app.repositories.event_repository import EventRepository
 from app.repositories.session_repository import SessionRepository
 from app.schemas.session import SessionCreate, SessionResponse
+from app.use_cases.event.cache import invalidate_organizer_dashboard
+from app.use_cases.session.schedule import to_naive_utc
 from fastapi import HTTPException, status
 
 class CreateSessionUseCase:
@@ -9,11 +11,23 @@ class CreateSessionUseCase:
         self.session_repo = session_repo
 
     def execute(self, session_in: SessionCreate) -> SessionResponse:
-        start_time = session_in.start_time.astimezone(timezone.utc)
-        end_time = session_in.end_time.astimezone(timezone.utc)
-        if session_in.start_time.astimezone(timezone.utc) < datetime.now(timezone.utc):
+        start_time = to_naive_utc(session_in.start_time)
+        end_time = to_naive_utc(session_in.end_time)
+        if start_time < datetime.utcnow():
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Session start time cannot be in the past")
         if end_time <= start_time:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Session end time must be after start time")
-        session = self.session_repo.create_session(session_in)
+        overlapping = self.session_repo.find_overlapping_sessions(
+            start_time,
+            end_time,
+            speaker_id=session_in.speaker_id,
+            event_id=session_in.event_id,
+        )
+        if overlapping:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Session overlaps with session {overlapping[0].id} of the same speaker or event",
+            )
+        session = self.session_repo.create_session(session_in.model_copy(update={"start_time": start_time, "end_time": end_time}))
+        invalidate_organizer_dashboard(self.session_repo.get_event_organizer_id(session.event_id))
         return SessionResponse.model_validate(session)
\ No newline at end of file
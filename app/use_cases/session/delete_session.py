@@ -1,4 +1,5 @@
 from app.repositories.session_repository import SessionRepository
+from app.use_cases.event.cache import invalidate_organizer_dashboard
 from fastapi import HTTPException, status
 
 class DeleteSessionUseCase:
@@ -13,4 +14,6 @@ class DeleteSessionUseCase:
         if session.speaker_id != current_user_id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to delete this session")
 
-        self.session_repo.delete_session(session)
\ No newline at end of file
+        event_id = session.event_id
+        self.session_repo.delete_session(session)
+        invalidate_organizer_dashboard(self.session_repo.get_event_organizer_id(event_id))
\ No newline at end of file
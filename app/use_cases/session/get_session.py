@@ -1,8 +1,8 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
 from app.repositories.event_repository import EventRepository
 from app.repositories.session_repository import SessionRepository
 from app.schemas.event import EventResponse
-from app.schemas.session import SessionResponse
+from app.schemas.session import SessionConflictResponse, SessionResponse
 from fastapi import HTTPException, status
 
 class GetSessionUseCase:
@@ -15,8 +15,23 @@ class GetSessionUseCase:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
         return SessionResponse.model_validate(session)
     
-    def execute_all(self, event_id: int, skip: int = 0, limit: int = 100) -> List[SessionResponse]:
-        sessions = self.session_repo.get_sessions_by_event_id(event_id, skip=skip, limit=limit)
+    def execute_all(self, event_id: int, skip: int = 0, limit: int = 100, fields: Optional[Sequence[str]] = None) -> Union[List[SessionResponse], List[Dict[str, Any]]]:
+        """
+        Con `fields` devuelve solo esos campos de cada sesión, tal como salen de la base de datos.
+        """
+        sessions = self.session_repo.get_sessions_by_event_id(event_id, skip=skip, limit=limit, fields=fields)
         if not sessions:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No sessions found for this event")
+        if fields is not None:
+            return sessions
         return [SessionResponse.model_validate(session) for session in sessions]
+
+    def execute_speaker_conflicts(self, speaker_id: int) -> List[SessionConflictResponse]:
+        conflicts = self.session_repo.get_speaker_conflicts(speaker_id)
+        return [
+            SessionConflictResponse(
+                session=SessionResponse.model_validate(session),
+                conflicts_with=SessionResponse.model_validate(other),
+            )
+            for session, other in conflicts
+        ]
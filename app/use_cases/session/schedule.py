@@ -0,0 +1,12 @@
+from datetime import datetime, timezone
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """
+    Normaliza una fecha a UTC sin zona horaria, como se guardan en la base de datos.
+    Las fechas sin zona se consideran ya en UTC. En PostgreSQL una fecha con zona se envía
+    como timestamptz, que no admite tsrange ni se compara bien con las columnas timestamp.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,58 @@
+from datetime import datetime
+from app.repositories.session_repository import SessionRepository
+from app.schemas.session import SessionUpdate, SessionResponse
+from app.use_cases.event.cache import invalidate_organizer_dashboard
+from app.use_cases.session.schedule import to_naive_utc
+from fastapi import HTTPException, status
+
+class UpdateSessionUseCase:
+    def __init__(self, session_repo: SessionRepository):
+        self.session_repo = session_repo
+
+    def execute(self, session_id: int, session_update: SessionUpdate, current_user_id: int) -> SessionResponse:
+        session = self.session_repo.get_session_by_id(session_id)
+        if not session:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+
+        if session.speaker_id != current_user_id:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to update this session")
+
+        # Mover la sesión a otro evento o cederla a otro ponente exigiría la autorización de la
+        # otra parte y arrastraría sus plazas reservadas: se crea una sesión nueva en su lugar
+        if session_update.event_id not in (None, session.event_id) or session_update.speaker_id not in (None, session.speaker_id):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Session event and speaker cannot be changed")
+
+        if session_update.capacity is not None and session_update.capacity < session.seats_taken:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Session capacity cannot be lower than its booked seats ({session.seats_taken})",
+            )
+
+        if session_update.start_time is not None:
+            session_update = session_update.model_copy(update={"start_time": to_naive_utc(session_update.start_time)})
+            if session_update.start_time < datetime.utcnow():
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Session start time cannot be in the past")
+        if session_update.end_time is not None:
+            session_update = session_update.model_copy(update={"end_time": to_naive_utc(session_update.end_time)})
+
+        start_time = session_update.start_time or session.start_time
+        end_time = session_update.end_time or session.end_time
+        if end_time <= start_time:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Session end time must be after start time")
+
+        overlapping = self.session_repo.find_overlapping_sessions(
+            start_time,
+            end_time,
+            speaker_id=session.speaker_id,
+            event_id=session.event_id,
+            exclude_session_id=session.id,
+        )
+        if overlapping:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Session overlaps with session {overlapping[0].id} of the same speaker or event",
+            )
+
+        updated_session = self.session_repo.update_session(session, session_update)
+        invalidate_organizer_dashboard(self.session_repo.get_event_organizer_id(updated_session.event_id))
+        return SessionResponse.model_validate(updated_session)
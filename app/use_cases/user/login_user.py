@@ -1,21 +1,16 @@
-from fastapi import Depends, HTTPException, status
-from datetime import timedelta
+from fastapi import HTTPException, status
+from datetime import datetime
+from typing import Optional
 
-from app.core.exceptions import HTTPException
-from app.core.security import verify_password, create_access_token, decode_access_token
-from app.models.user import User
-from app.repositories.user_repository import IUserRepository
-from app.schemas.user import UserLogin, Token
-
-from typing import Annotated
 from jose import JWTError
 from pydantic import ValidationError
-from sqlmodel import Session
 
-from app.core.security import decode_access_token
-from app.database.connection import get_db_session
-from app.models.user import User 
-from app.schemas.user import TokenPayload
+from app.core.exceptions import HTTPException
+from app.core.revocation import revocation_list
+from app.core.security import REFRESH_TOKEN_TYPE, verify_password, create_access_token, create_refresh_token, decode_access_token
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+from app.repositories.user_repository import IUserRepository
+from app.schemas.user import UserLogin, Token, TokenPayload
 
 
 
@@ -23,8 +18,9 @@ class LoginUserUseCase:
     """
     Caso de uso para el inicio de sesión de un usuario.
     """
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(self, user_repository: IUserRepository, revoked_token_repository: RevokedTokenRepository):
         self.user_repository: IUserRepository = user_repository
+        self.revoked_token_repository = revoked_token_repository
 
     def execute(self, user_login: UserLogin) -> Token:
         """
@@ -49,17 +45,43 @@ class LoginUserUseCase:
         access_token = create_access_token(
             subject=user.id,
         )
-        refresh_token = create_access_token(
-            subject=user.id,
-            expires_delta=timedelta(days=1)
-        )
+        refresh_token = create_refresh_token(subject=user.id)
 
         return Token(access_token=access_token, refresh_token=refresh_token)
 
-    def refresh_access_token(self, refresh_token: str, db_session: Annotated[Session, Depends(get_db_session)],) -> Token:
+    def refresh_access_token(self, refresh_token: Optional[str]) -> Token:
         """
-        Valida el refresh token y genera un nuevo access token si es válido.
+        Valida el refresh token y lo rota: se revoca y se emite un par nuevo de tokens.
+        La comprobación de revocación es en memoria; la única escritura es la revocación
+        del token usado, que además detecta dos usos simultáneos del mismo token.
         """
+        token_data = self._decode_refresh_token(refresh_token)
+        if revocation_list.is_revoked(token_data.jti):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token has been revoked")
+
+        user = self.user_repository.get(token_data.sub)
+        if not user:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+        if not user.is_active:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
+
+        if not self._revoke(token_data):
+            # Ya lo había usado otra petición (posiblemente en otra réplica)
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token has been revoked")
+        return Token(access_token=create_access_token(subject=user.id), refresh_token=create_refresh_token(subject=user.id))
+
+    def logout(self, refresh_token: Optional[str]) -> None:
+        """
+        Revoca el refresh token de la sesión. Un token ausente o inválido no impide cerrar sesión.
+        """
+        try:
+            token_data = self._decode_refresh_token(refresh_token)
+        except HTTPException:
+            return
+        self._revoke(token_data)
+
+    def _decode_refresh_token(self, refresh_token: Optional[str]) -> TokenPayload:
         if not refresh_token:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -72,20 +94,17 @@ class LoginUserUseCase:
             payload = decode_access_token(refresh_token)
             token_data = TokenPayload.model_validate(payload)
         except (JWTError, ValidationError):
+            token_data = None
+        if token_data is None or token_data.type != REFRESH_TOKEN_TYPE or not token_data.jti or not token_data.sub:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        
-        user = db_session.get(User, token_data.sub)
-        if not user:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    
-        if not user.is_active:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
-        try:
-            access_token = create_access_token(subject=user.id)
-            return Token(access_token=access_token)
-        except Exception:
-            raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
\ No newline at end of file
+        return token_data
+
+    def _revoke(self, token_data: TokenPayload) -> bool:
+        expires_at = datetime.utcfromtimestamp(token_data.exp)
+        revoked = self.revoked_token_repository.revoke(token_data.jti, token_data.sub, expires_at)
+        revocation_list.add(token_data.jti, expires_at)
+        return revoked
@@ -0,0 +1,41 @@
+# app/workers/archive_events.py
+"""
+Mueve a las tablas de archivo los eventos completados o cancelados antiguos, con sus sesiones
+e inscripciones, para que las tablas activas solo contengan eventos vivos.
+
+Uso:
+    python -m app.workers.archive_events --older-than-days 30
+"""
+import argparse
+import logging
+from typing import List, Optional
+
+from app.core.config import get_settings
+from app.database.connection import open_session
+from app.repositories.archive_repository import ArchiveRepository
+from app.use_cases.archive.archive_events import ArchiveEventsUseCase
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def run_archive(older_than_days: int = settings.ARCHIVE_AFTER_DAYS, batch_size: int = 500) -> int:
+    with open_session() as session:
+        archived = ArchiveEventsUseCase(ArchiveRepository(session)).execute(older_than_days, batch_size=batch_size)
+    logger.info("Archived %s events", archived)
+    return archived
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Archiva los eventos completados o cancelados antiguos")
+    parser.add_argument("--older-than-days", type=int, default=settings.ARCHIVE_AFTER_DAYS)
+    parser.add_argument("--batch-size", type=int, default=500, help="Eventos por transacción")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    import app.api.main  # noqa: F401  registra todos los modelos
+    print(run_archive(args.older_than_days, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
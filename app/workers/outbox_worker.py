@@ -0,0 +1,175 @@
+# app/workers/outbox_worker.py
+"""
+Worker del outbox: entrega fuera de la petición los mensajes que los repositorios encolan en
+la misma transacción que el cambio, a los manejadores registrados con @handler para su tema.
+
+Por ahora es solo la infraestructura de entrega: el servicio no tiene todavía envío de correo
+ni procesado de imágenes, así que ningún tema tiene manejador y los mensajes se marcan como
+procesados sin efecto. Los consumidores (confirmaciones de inscripción, miniaturas, avisos a
+organizadores) se añaden registrando su manejador.
+
+Se ejecuta dentro del servicio (OUTBOX_WORKER_IN_PROCESS) o como proceso aparte:
+    python -m app.workers.outbox_worker
+"""
+import argparse
+import asyncio
+import inspect
+import logging
+import random
+import signal
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from sqlalchemy.engine import Engine
+
+from app.core.config import get_settings
+from app.database.connection import open_session
+from app.models.outbox import OutboxMessage
+from app.repositories.outbox_repository import OutboxRepository
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Dict[str, Any]], Union[None, Awaitable[None]]]
+
+# Manejadores por tema; los temas sin manejador se dan por procesados (y se borran al
+# cumplir OUTBOX_RETENTION_HOURS)
+HANDLERS: Dict[str, List[Handler]] = {}
+
+
+def handler(topic: str) -> Callable[[Handler], Handler]:
+    """
+    Registra un manejador para un tema. Puede ser una corrutina o una función
+    síncrona (se ejecuta en un hilo). Debe ser idempotente: un mensaje puede
+    entregarse más de una vez si el worker cae antes de marcarlo.
+    """
+    def register(func: Handler) -> Handler:
+        HANDLERS.setdefault(topic, []).append(func)
+        return func
+    return register
+
+
+@dataclass
+class Outcome:
+    message: OutboxMessage
+    error: Optional[str] = None
+
+
+class OutboxWorker:
+    def __init__(
+        self,
+        engine: Engine,
+        concurrency: int = 4,
+        batch_size: int = 50,
+        poll_interval: float = 1.0,
+        max_attempts: int = 8,
+        lease_seconds: float = 300,
+        max_backoff_seconds: float = 3600,
+    ):
+        self.engine = engine
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self._stopping = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    def stop(self) -> None:
+        """Termina el bucle tras el lote en curso."""
+        self._stopping.set()
+
+    async def run(self) -> None:
+        logger.info("Outbox worker started")
+        while not self._stopping.is_set():
+            try:
+                claimed = await self.run_once()
+            except Exception:
+                logger.exception("Outbox batch failed")
+                claimed = 0
+            # Con la cola vacía se espera; con un lote completo se sigue sin pausa
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        logger.info("Outbox worker stopped")
+
+    async def run_once(self) -> int:
+        """Reclama un lote, lo procesa con concurrencia limitada y guarda los resultados."""
+        messages = await asyncio.to_thread(self._claim)
+        if not messages:
+            return 0
+        outcomes = await asyncio.gather(*(self._process(message) for message in messages))
+        await asyncio.to_thread(self._complete, outcomes)
+        return len(messages)
+
+    def backoff(self, attempts: int) -> timedelta:
+        # Exponencial con jitter para no reintentar todos a la vez
+        seconds = min(2 ** attempts, self.max_backoff_seconds)
+        return timedelta(seconds=seconds * random.uniform(0.5, 1.0))
+
+    async def _process(self, message: OutboxMessage) -> Outcome:
+        async with self._semaphore:
+            try:
+                for func in HANDLERS.get(message.topic, []):
+                    if inspect.iscoroutinefunction(func):
+                        await func(message.payload)
+                    else:
+                        await asyncio.to_thread(func, message.payload)
+            except Exception as e:
+                logger.warning("Outbox message %s (%s) failed: %r", message.id, message.topic, e)
+                return Outcome(message, error=repr(e))
+        return Outcome(message)
+
+    def _claim(self) -> List[OutboxMessage]:
+        with open_session(self.engine) as session:
+            return OutboxRepository(session).claim_batch(self.batch_size, self.lease_seconds)
+
+    def _complete(self, outcomes: List[Outcome]) -> None:
+        with open_session(self.engine) as session:
+            repo = OutboxRepository(session)
+            repo.mark_processed([outcome.message.id for outcome in outcomes if outcome.error is None])
+            for outcome in outcomes:
+                if outcome.error is None:
+                    continue
+                attempts = outcome.message.attempts
+                retry_at = datetime.utcnow() + self.backoff(attempts) if attempts < self.max_attempts else None
+                repo.mark_failed(outcome.message.id, outcome.error, retry_at)
+
+
+def build_worker(engine: Engine) -> OutboxWorker:
+    return OutboxWorker(
+        engine,
+        concurrency=settings.OUTBOX_WORKER_CONCURRENCY,
+        batch_size=settings.OUTBOX_BATCH_SIZE,
+        max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Procesa los mensajes pendientes del outbox")
+    parser.add_argument("--once", action="store_true", help="Procesa un lote y termina")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    from app.database.connection import engine
+    import app.api.main  # noqa: F401  registra los modelos y los manejadores
+
+    async def run():
+        worker = build_worker(engine)
+        if args.once:
+            await worker.run_once()
+            return
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, worker.stop)
+        await worker.run()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
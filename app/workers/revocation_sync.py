@@ -0,0 +1,40 @@
+# app/workers/revocation_sync.py
+"""
+Mantiene la lista de revocación en memoria de cada réplica al día con la tabla
+revoked_token. A diferencia de las tareas del planificador, se ejecuta en todas las réplicas.
+"""
+import asyncio
+import logging
+
+from sqlalchemy.engine import Engine
+
+from app.core.revocation import revocation_list
+from app.database.connection import open_session
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationSync:
+    def __init__(self, engine: Engine, interval_seconds: float = 5):
+        self.engine = engine
+        self.interval_seconds = interval_seconds
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.to_thread(self.sync_once)
+            except Exception:
+                logger.exception("Revocation list sync failed")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def sync_once(self) -> None:
+        with open_session(self.engine) as session:
+            revocation_list.sync(RevokedTokenRepository(session))
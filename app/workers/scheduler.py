@@ -0,0 +1,182 @@
+# app/workers/scheduler.py
+"""
+Planificador de tareas periódicas de mantenimiento (completar eventos pasados, archivado,
+limpieza del outbox, reescalado de las puntuaciones de popularidad).
+
+Cada tarea se ejecuta al inicio de cada intervalo, alineado a la época para que todas las
+réplicas compartan los mismos intervalos. Antes de ejecutarla se reclama el intervalo en
+job_run; solo la réplica que lo consigue la ejecuta y anota cuántas filas modificó.
+
+Se ejecuta dentro del servicio (SCHEDULER_IN_PROCESS) o como proceso aparte:
+    python -m app.workers.scheduler
+"""
+import argparse
+import asyncio
+import logging
+import signal
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from app.core.config import get_settings
+from app.database.connection import open_session
+from app.repositories.archive_repository import ArchiveRepository
+from app.repositories.event_repository import EventRepository
+from app.repositories.idempotency_repository import IdempotencyRepository
+from app.repositories.job_run_repository import JobRunRepository
+from app.repositories.outbox_repository import OutboxRepository
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+from app.use_cases.archive.archive_events import ArchiveEventsUseCase
+from app.use_cases.event.complete_past_events import CompletePastEventsUseCase
+from app.use_cases.event.rebase_popularity import RebasePopularityUseCase
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    interval_seconds: float
+    # Recibe una sesión propia y devuelve el número de filas modificadas
+    func: Callable[[Session], int]
+
+
+JOBS: Dict[str, ScheduledJob] = {}
+
+
+def scheduled(name: str, interval_seconds: float) -> Callable[[Callable[[Session], int]], Callable[[Session], int]]:
+    """
+    Registra una tarea periódica. Debe ser idempotente y trabajar por lotes: si la réplica
+    cae a mitad, la siguiente ejecución continúa donde quedó.
+    """
+    def register(func: Callable[[Session], int]) -> Callable[[Session], int]:
+        JOBS[name] = ScheduledJob(name, interval_seconds, func)
+        return func
+    return register
+
+
+@scheduled("complete_past_events", settings.EVENT_COMPLETION_INTERVAL_SECONDS)
+def complete_past_events(session: Session) -> int:
+    return CompletePastEventsUseCase(EventRepository(session)).execute(batch_size=settings.SCHEDULER_BATCH_SIZE)
+
+
+@scheduled("archive_events", settings.ARCHIVE_INTERVAL_SECONDS)
+def archive_events(session: Session) -> int:
+    return ArchiveEventsUseCase(ArchiveRepository(session)).execute(
+        settings.ARCHIVE_AFTER_DAYS, batch_size=settings.SCHEDULER_BATCH_SIZE
+    )
+
+
+@scheduled("purge_revoked_tokens", settings.ARCHIVE_INTERVAL_SECONDS)
+def purge_revoked_tokens(session: Session) -> int:
+    # Un token expirado ya no pasa la validación del JWT: no hace falta recordar su revocación
+    return RevokedTokenRepository(session).delete_expired()
+
+
+@scheduled("purge_idempotency_keys", settings.EVENT_COMPLETION_INTERVAL_SECONDS)
+def purge_idempotency_keys(session: Session) -> int:
+    return IdempotencyRepository(session).delete_expired()
+
+
+@scheduled("purge_processed_outbox", settings.EVENT_COMPLETION_INTERVAL_SECONDS)
+def purge_processed_outbox(session: Session) -> int:
+    before = datetime.utcnow() - timedelta(hours=settings.OUTBOX_RETENTION_HOURS)
+    repo = OutboxRepository(session)
+    purged = 0
+    while True:
+        deleted = repo.delete_processed(before, limit=settings.SCHEDULER_BATCH_SIZE)
+        purged += deleted
+        if deleted < settings.SCHEDULER_BATCH_SIZE:
+            return purged
+
+
+@scheduled("rebase_popularity", settings.ARCHIVE_INTERVAL_SECONDS)
+def rebase_popularity(session: Session) -> int:
+    return RebasePopularityUseCase(EventRepository(session)).execute()
+
+
+class Scheduler:
+    def __init__(self, engine: Engine, jobs: Optional[Sequence[ScheduledJob]] = None):
+        self.engine = engine
+        self.jobs = list(JOBS.values()) if jobs is None else list(jobs)
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        """Termina tras la ejecución en curso."""
+        self._stopping.set()
+
+    async def run(self) -> None:
+        logger.info("Scheduler started with jobs %s", [job.name for job in self.jobs])
+        await asyncio.gather(*(self._loop(job) for job in self.jobs))
+        logger.info("Scheduler stopped")
+
+    async def run_job(self, job: ScheduledJob) -> Optional[int]:
+        """
+        Ejecuta la tarea si esta réplica reclama el intervalo actual. Devuelve las filas
+        modificadas, o None si otra réplica ya la ejecutó en este intervalo o falló.
+        """
+        slot = int(time.time() // job.interval_seconds)
+        return await asyncio.to_thread(self._run, job, slot)
+
+    async def _loop(self, job: ScheduledJob) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.run_job(job)
+            except Exception:
+                logger.exception("Scheduled job %s could not be started", job.name)
+            # Hasta el inicio del siguiente intervalo
+            delay = job.interval_seconds - time.time() % job.interval_seconds
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def _run(self, job: ScheduledJob, slot: int) -> Optional[int]:
+        with open_session(self.engine) as session:
+            runs = JobRunRepository(session)
+            run_id = runs.try_start(job.name, slot)
+            if run_id is None:
+                return None
+            try:
+                rows = job.func(session)
+            except Exception as e:
+                session.rollback()
+                logger.exception("Scheduled job %s failed", job.name)
+                runs.finish(run_id, None, error=repr(e))
+                return None
+            runs.finish(run_id, rows)
+        logger.info("Scheduled job %s affected %s rows", job.name, rows)
+        return rows
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Ejecuta las tareas periódicas de mantenimiento")
+    parser.add_argument("--once", action="store_true", help="Ejecuta cada tarea una vez y termina")
+    parser.add_argument("--job", action="append", choices=sorted(JOBS), help="Solo estas tareas")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    from app.database.connection import engine
+    import app.api.main  # noqa: F401  registra todos los modelos
+
+    async def run():
+        scheduler = Scheduler(engine, [JOBS[name] for name in args.job] if args.job else None)
+        if args.once:
+            for job in scheduler.jobs:
+                print(job.name, await scheduler.run_job(job))
+            return
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, scheduler.stop)
+        await scheduler.run()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
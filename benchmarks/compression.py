@@ -0,0 +1,156 @@
+# benchmarks/compression.py
+"""
+Compromiso CPU/bytes de la compresión de respuestas para los listados más pesados
+(`/events/all` y `/sessions/{event_id}`, 100 elementos con descripciones largas).
+
+Serializa los mismos esquemas de respuesta que los endpoints y, para cada codificación
+y nivel, mide el tamaño resultante y el tiempo de CPU por respuesta al comprimir y
+descomprimir. Sin el paquete 'brotli' solo se mide gzip.
+
+Uso:
+    python -m benchmarks.compression --items 100 --repeat 200 --output compression_results.json
+"""
+import argparse
+import gzip
+import json
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.schemas.event import EventResponse
+from app.schemas.session import SessionResponse
+from benchmarks.load_test import git_commit
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Vocabulario para descripciones con la redundancia de un texto real, no de un relleno repetido
+WORDS = (
+    "evento conferencia taller charla asistentes programa ponentes innovación tecnología "
+    "empresa equipo comunidad sesión inscripción aforo auditorio networking experiencia "
+    "datos nube seguridad diseño producto estrategia liderazgo cultura futuro práctica "
+    "el la los las de del en con para por una un sobre entre desde hasta y o que"
+).split()
+
+
+def _text(rng: random.Random, length: int) -> str:
+    words: List[str] = []
+    while sum(len(word) + 1 for word in words) < length:
+        words.append(rng.choice(WORDS))
+    return " ".join(words)[:length].capitalize()
+
+
+def build_payloads(items: int, seed_value: int) -> Dict[str, bytes]:
+    """
+    Cuerpos JSON equivalentes a una página completa de cada listado.
+    """
+    rng = random.Random(seed_value)
+    now = datetime(2030, 1, 1, 9)
+    events = [
+        EventResponse(
+            id=i + 1, name=f"Evento {i} {_text(rng, 40)}", description=_text(rng, rng.randint(300, 1000)),
+            event_date=date(2030, 1, 1) + timedelta(days=rng.randint(0, 365)), location=f"Auditorio {rng.randint(1, 50)}",
+            capacity=rng.randint(20, 2000), status="published", image_url=f"static/events/event_{i}.png",
+            organizer_id=rng.randint(1, 500), created_at=now, updated_at=now,
+        )
+        for i in range(items)
+    ]
+    sessions = [
+        SessionResponse(
+            id=i + 1, name=f"Sesión {i} {_text(rng, 30)}", description=_text(rng, rng.randint(200, 1000)),
+            start_time=now + timedelta(hours=i), end_time=now + timedelta(hours=i, minutes=50), capacity=100,
+            event_id=1, speaker_id=rng.randint(1, 500), created_at=now, updated_at=now,
+        )
+        for i in range(items)
+    ]
+    return {
+        "events_all": json.dumps([event.model_dump(mode="json") for event in events]).encode(),
+        "sessions_by_event": json.dumps([session.model_dump(mode="json") for session in sessions]).encode(),
+    }
+
+
+def codecs(gzip_levels: List[int], brotli_qualities: List[int]) -> List[Tuple[str, Callable[[bytes], bytes], Callable[[bytes], bytes]]]:
+    result = [
+        (f"gzip-{level}", lambda body, level=level: gzip.compress(body, compresslevel=level, mtime=0), gzip.decompress)
+        for level in gzip_levels
+    ]
+    if brotli is not None:
+        result += [
+            (f"br-{quality}", lambda body, quality=quality: brotli.compress(body, quality=quality), brotli.decompress)
+            for quality in brotli_qualities
+        ]
+    return result
+
+
+def measure(body: bytes, compress: Callable[[bytes], bytes], decompress: Callable[[bytes], bytes], repeat: int) -> Dict:
+    compressed = compress(body)
+    assert decompress(compressed) == body
+    compress_times, decompress_times = [], []
+    for _ in range(repeat):
+        started = time.process_time()
+        compress(body)
+        compress_times.append(time.process_time() - started)
+        started = time.process_time()
+        decompress(compressed)
+        decompress_times.append(time.process_time() - started)
+    compress_ms = statistics.fmean(compress_times) * 1000
+    return {
+        "bytes": len(compressed),
+        "ratio": round(len(body) / len(compressed), 2),
+        "saved_pct": round(100 * (1 - len(compressed) / len(body)), 1),
+        "compress_ms": round(compress_ms, 3),
+        "decompress_ms": round(statistics.fmean(decompress_times) * 1000, 3),
+        # Bytes ahorrados por milisegundo de CPU del servidor
+        "saved_bytes_per_cpu_ms": round((len(body) - len(compressed)) / compress_ms) if compress_ms else None,
+    }
+
+
+def run(args: argparse.Namespace) -> Dict:
+    payloads = build_payloads(args.items, args.seed)
+    results = {}
+    for name, body in payloads.items():
+        results[name] = {"identity": {"bytes": len(body)}}
+        for codec, compress, decompress in codecs(args.gzip_levels, args.brotli_qualities):
+            results[name][codec] = measure(body, compress, decompress, args.repeat)
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {"items": args.items, "repeat": args.repeat, "seed": args.seed, "brotli": brotli is not None},
+        "results": results,
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark de compresión de los listados")
+    parser.add_argument("--items", type=int, default=100, help="Elementos por respuesta (el límite de paginación)")
+    parser.add_argument("--repeat", type=int, default=200, help="Repeticiones por codificación")
+    parser.add_argument("--gzip-levels", type=int, nargs="*", default=[1, 6, 9])
+    parser.add_argument("--brotli-qualities", type=int, nargs="*", default=[1, 4, 6, 11])
+    parser.add_argument("--seed", type=int, default=42, help="Semilla para que las ejecuciones sean reproducibles")
+    parser.add_argument("--output", default="compression_results.json", help="Archivo JSON de resultados")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    report = run(args)
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2)
+    for name, codecs_results in report["results"].items():
+        print(f"{name}: {codecs_results['identity']['bytes']} bytes sin comprimir")
+        for codec, result in codecs_results.items():
+            if codec == "identity":
+                continue
+            print(
+                f"  {codec:<8} {result['bytes']:>8} bytes  x{result['ratio']:<5} "
+                f"compresión={result['compress_ms']:.3f}ms  descompresión={result['decompress_ms']:.3f}ms"
+            )
+    print(f"Resultados guardados en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
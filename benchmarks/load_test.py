@@ -0,0 +1,291 @@
+# benchmarks/load_test.py
+"""
+Suite de carga reproducible para los endpoints más usados de la API.
+
+Siembra un conjunto de datos realista en una base de datos local (SQLite por
+defecto o un PostgreSQL local), lanza peticiones concurrentes contra la
+aplicación FastAPI en proceso y reporta, por endpoint, peticiones por segundo,
+latencias p50/p95/p99 y consultas SQL por petición.
+
+Uso:
+    python -m benchmarks.load_test --requests 500 --concurrency 20 \\
+        --database-url sqlite:///./bench.db --output bench_results.json
+
+Los resultados se guardan en JSON junto al commit actual para poder comparar
+ejecuciones entre commits.
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+
+import httpx
+from sqlalchemy import event as sa_event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.api.main import app
+from app.core.security import create_access_token, get_password_hash
+from app.database.connection import get_db_session, open_session
+from app.models.envent import Event, EventStatus
+from app.models.session import Session as EventSession
+from app.models.user import User
+
+API = "/api/v1"
+BENCH_PASSWORD = "benchpassword"
+
+# Contador de consultas de la petición en curso. Se comparte un objeto mutable
+# para que las copias del contexto (threadpool, middlewares) sumen sobre él.
+_query_counter: ContextVar[Optional[List[int]]] = ContextVar("query_counter", default=None)
+
+
+@dataclass
+class Sample:
+    latency: float
+    status_code: int
+    queries: int
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    build: Callable[[int], Dict]
+    samples: List[Sample] = field(default_factory=list)
+
+
+def build_engine(database_url: str, pool_size: int) -> Engine:
+    """
+    Crea el motor de la base de datos de benchmark y registra el contador de consultas.
+    Los endpoints `async` ejecutan código síncrono en el event loop, así que el pool
+    debe cubrir la concurrencia completa o el loop queda bloqueado esperando conexión.
+    """
+    connect_args = {"check_same_thread": False} if database_url.startswith("sqlite") else {}
+    engine = create_engine(database_url, connect_args=connect_args, pool_size=pool_size, max_overflow=pool_size)
+
+    @sa_event.listens_for(engine, "before_cursor_execute")
+    def _count_query(conn, cursor, statement, parameters, context, executemany):
+        counter = _query_counter.get()
+        if counter is not None:
+            counter[0] += 1
+
+    return engine
+
+
+def seed(engine: Engine, users: int, events: int, sessions_per_event: int, seed_value: int) -> Dict[str, List[int]]:
+    """
+    Siembra usuarios, eventos publicados y sesiones. El hash de la contraseña
+    se calcula una sola vez y se reutiliza para todos los usuarios.
+    """
+    rng = random.Random(seed_value)
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    hashed_password = get_password_hash(BENCH_PASSWORD)
+    today = date.today()
+
+    with Session(engine) as session:
+        db_users = [User(email=f"bench{i}@example.com", hashed_password=hashed_password) for i in range(users)]
+        session.add_all(db_users)
+        session.flush()
+
+        db_events = [
+            Event(
+                name=f"Evento de carga {i}",
+                description="x" * rng.randint(100, 1000),
+                event_date=today + timedelta(days=rng.randint(1, 365)),
+                location=f"Auditorio {rng.randint(1, 50)}",
+                capacity=rng.randint(users // 2, users * 2),
+                status=EventStatus.PUBLISHED,
+                organizer_id=rng.choice(db_users).id,
+            )
+            for i in range(events)
+        ]
+        session.add_all(db_events)
+        session.flush()
+
+        for db_event in db_events:
+            start = datetime.combine(db_event.event_date, datetime.min.time()) + timedelta(hours=8)
+            for j in range(sessions_per_event):
+                session.add(EventSession(
+                    name=f"Sesión {j}",
+                    description="Sesión de carga",
+                    start_time=start + timedelta(hours=j),
+                    end_time=start + timedelta(hours=j, minutes=50),
+                    capacity=100,
+                    event_id=db_event.id,
+                    speaker_id=rng.choice(db_users).id,
+                ))
+        session.commit()
+        return {
+            "users": [u.id for u in db_users],
+            "emails": [u.email for u in db_users],
+            "events": [e.id for e in db_events],
+        }
+
+
+def build_scenarios(data: Dict[str, List[int]], seed_value: int) -> List[Scenario]:
+    """
+    Define los escenarios a medir. Cada escenario construye la petición i-ésima.
+    """
+    rng = random.Random(seed_value)
+    tokens = {user_id: create_access_token(subject=user_id) for user_id in data["users"]}
+    pairs = [(u, e) for u in data["users"] for e in data["events"]]
+    rng.shuffle(pairs)
+
+    def auth(user_id: int) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {tokens[user_id]}"}
+
+    def register(i: int) -> Dict:
+        user_id, event_id = pairs[i % len(pairs)]
+        return {"url": f"{API}/event/{event_id}/register", "headers": auth(user_id)}
+
+    def login(i: int) -> Dict:
+        email = data["emails"][i % len(data["emails"])]
+        return {"url": f"{API}/login/access-token", "data": {"username": email, "password": BENCH_PASSWORD}}
+
+    return [
+        Scenario("events_all", "GET", lambda i: {"url": f"{API}/events/all"}),
+        Scenario("event_detail", "GET", lambda i: {"url": f"{API}/event/{rng.choice(data['events'])}"}),
+        Scenario("event_register", "POST", register),
+        Scenario("login_access_token", "POST", login),
+        Scenario("users_me", "GET", lambda i: {"url": f"{API}/users/me", "headers": auth(rng.choice(data["users"]))}),
+    ]
+
+
+async def run_scenario(client: httpx.AsyncClient, scenario: Scenario, requests: int, concurrency: int) -> float:
+    """
+    Ejecuta un escenario con `concurrency` trabajadores y devuelve la duración total.
+    """
+    next_index = iter(range(requests))
+
+    async def worker():
+        for i in next_index:
+            kwargs = scenario.build(i)
+            counter = [0]
+            token = _query_counter.set(counter)
+            started = time.perf_counter()
+            try:
+                response = await client.request(scenario.method, **kwargs)
+            finally:
+                _query_counter.reset(token)
+                client.cookies.clear()
+            scenario.samples.append(Sample(time.perf_counter() - started, response.status_code, counter[0]))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(scenario: Scenario, elapsed: float) -> Dict:
+    latencies = [s.latency * 1000 for s in scenario.samples]
+    status_counts: Dict[str, int] = {}
+    for sample in scenario.samples:
+        status_counts[str(sample.status_code)] = status_counts.get(str(sample.status_code), 0) + 1
+    return {
+        "requests": len(scenario.samples),
+        "elapsed_s": round(elapsed, 4),
+        "rps": round(len(scenario.samples) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50), 3),
+            "p95": round(percentile(latencies, 95), 3),
+            "p99": round(percentile(latencies, 99), 3),
+            "mean": round(statistics.fmean(latencies), 3) if latencies else 0.0,
+        },
+        "queries_per_request": round(statistics.fmean(s.queries for s in scenario.samples), 2) if scenario.samples else 0.0,
+        "status_codes": status_counts,
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> Dict:
+    engine = build_engine(args.database_url, pool_size=args.concurrency)
+    data = seed(engine, args.users, args.events, args.sessions_per_event, args.seed)
+
+    def get_bench_session():
+        with open_session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_db_session] = get_bench_session
+    scenarios = build_scenarios(data, args.seed)
+    selected = [s for s in scenarios if not args.only or s.name in args.only]
+    results = {}
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for scenario in selected:
+                requests = args.login_requests if scenario.name == "login_access_token" else args.requests
+                elapsed = await run_scenario(client, scenario, requests, args.concurrency)
+                results[scenario.name] = summarize(scenario, elapsed)
+    finally:
+        app.dependency_overrides.pop(get_db_session, None)
+        engine.dispose()
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "database": engine.url.render_as_string(hide_password=True),
+            "requests": args.requests,
+            "login_requests": args.login_requests,
+            "concurrency": args.concurrency,
+            "users": args.users,
+            "events": args.events,
+            "sessions_per_event": args.sessions_per_event,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark de carga de los endpoints principales")
+    parser.add_argument("--database-url", default="sqlite:///./bench.db", help="Base de datos donde sembrar y medir")
+    parser.add_argument("--requests", type=int, default=500, help="Peticiones por escenario")
+    parser.add_argument("--login-requests", type=int, default=50, help="Peticiones de login (bcrypt es costoso)")
+    parser.add_argument("--concurrency", type=int, default=20, help="Peticiones simultáneas por escenario")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--sessions-per-event", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42, help="Semilla para que las ejecuciones sean reproducibles")
+    parser.add_argument("--only", nargs="*", help="Escenarios a ejecutar (por defecto todos)")
+    parser.add_argument("--output", default="bench_results.json", help="Archivo JSON de resultados")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    report = asyncio.run(run(args))
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2)
+    for name, result in report["results"].items():
+        latency = result["latency_ms"]
+        print(
+            f"{name:<20} {result['rps']:>9.1f} req/s  p50={latency['p50']:.1f}ms "
+            f"p95={latency['p95']:.1f}ms p99={latency['p99']:.1f}ms  q/req={result['queries_per_request']}"
+        )
+    print(f"Resultados guardados en {args.output}")
+
+
+if __name__ == "__main__":
+    main()